@@ -0,0 +1,489 @@
+"""
+Benchmarks that guard against performance regressions.
+
+```
+python benchmarks/run.py             # Compare against the baseline, fail if anything regressed
+python benchmarks/run.py --update    # Record a new baseline
+python benchmarks/run.py -k parse    # Only run the cases whose name contains "parse"
+```
+
+Each case measures one of:
+
+- time: the time per call of a hot path, in seconds (the best of several repeats)
+- memory: peak memory of a workload according to `tracemalloc`, or the size of a single object,
+  in bytes
+- count: the number of entries in an internal cache after a standard workload
+
+Memory and count cases run in a fresh interpreter, so they aren't affected by whatever the other
+cases left behind in the caches.
+
+The baseline is stored in `baseline.json` next to this file. Timings depend on the machine, so only
+compare against a baseline that was recorded on the same machine (and Python version). The memory
+and count cases are mostly machine independent.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import pathlib
+import platform
+import subprocess
+import sys
+import timeit
+import tracemalloc
+import typing as t
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import u  # noqa: E402
+from u._utils import caches  # noqa: E402
+from u.quantity import QUANTITY_ALIASES_BY_EXPONENTS  # noqa: E402
+from u.unit import units_by_symbol, units_cache  # noqa: E402
+
+
+BASELINE_PATH = pathlib.Path(__file__).resolve().parent / "baseline.json"
+
+UNITS_BY_KIND = {"time": "s", "memory": "B", "count": ""}
+
+
+class Result(t.NamedTuple):
+    kind: t.Literal["time", "memory", "count"]
+    value: float
+
+
+# Time cases return the function to time
+TIME_CASES = dict[str, t.Callable[[], t.Callable[[], object]]]()
+
+# Isolated cases return a dict of results, keyed by case name. They're run in a separate process.
+ISOLATED_CASES = dict[str, t.Callable[[], dict[str, Result]]]()
+
+
+def time_case(name: str):
+    def decorator(func: t.Callable[[], t.Callable[[], object]]):
+        TIME_CASES[f"time/{name}"] = func
+        return func
+
+    return decorator
+
+
+def isolated_case(name: str):
+    def decorator(func: t.Callable[[], dict[str, Result]]):
+        ISOLATED_CASES[name] = func
+        return func
+
+    return decorator
+
+
+# --- Time ---------------------------------------------------------------------------------------
+
+
+@time_case("quantity_creation")
+def _():
+    return lambda: u.meters(3.5)
+
+
+@time_case("to_number")
+def _():
+    quantity = u.kilometers(3.5)
+    return lambda: quantity.to_number(u.miles)
+
+
+@time_case("add_same_unit")
+def _():
+    a = u.meters(3.5)
+    b = u.meters(1.5)
+    return lambda: a + b
+
+
+@time_case("add_different_units")
+def _():
+    a = u.meters(3.5)
+    b = u.feet(1.5)
+    return lambda: a + b
+
+
+@time_case("multiply_quantities")
+def _():
+    distance = u.meters(100)
+    duration = u.seconds(9.58)
+    return lambda: distance / duration
+
+
+@time_case("compare")
+def _():
+    a = u.minutes(60)
+    b = u.hours(1)
+    return lambda: a < b
+
+
+@time_case("hash")
+def _():
+    return lambda: hash(u.minutes(60))
+
+
+@time_case("str")
+def _():
+    quantity = u.meters(12_345.678)
+    return lambda: str(quantity)
+
+
+@time_case("format_decomposition")
+def _():
+    quantity = u.seconds(5025)
+    return lambda: f"{quantity:h+min+s}"
+
+
+@time_case("quantity_parse")
+def _():
+    return lambda: u.Quantity.parse("12.5 km/h")
+
+
+@time_case("unit_parse")
+def _():
+    return lambda: u.Unit.parse("kg*m/s²")
+
+
+@time_case("prefix_lookup")
+def _():
+    return lambda: u.Unit.parse("µs")
+
+
+@time_case("fsum_1000")
+def _():
+    units = [u.meters, u.kilometers, u.feet, u.miles]
+    quantities = [u.Quantity(float(i), unit) for i in range(250) for unit in units]
+    return lambda: u.fsum(quantities, u.meters)
+
+
+@time_case("parse_many_1000")
+def _():
+    texts = [f"{i}.5 {symbol}" for i in range(250) for symbol in ("ms", "s", "min", "µs")]
+    return lambda: u.Duration.parse_many(texts, to=u.seconds)
+
+
+# --- Memory and caches --------------------------------------------------------------------------
+
+
+@isolated_case("memory/object_sizes")
+def _measure_object_sizes() -> dict[str, Result]:
+    count = 10_000
+    values = [float(i) for i in range(count)]
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    quantities = [u.Quantity(value, u.meters) for value in values]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    bytes_per_quantity = (after - before - sys.getsizeof(quantities)) / count
+
+    # Registering a unit also adds it to several registries, which is included here
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    units = [u.Unit(u.Distance, f"benchmark_unit_{i}", i + 2) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    bytes_per_unit = (after - before - sys.getsizeof(units)) / count
+
+    return {
+        "memory/bytes_per_quantity": Result("memory", bytes_per_quantity),
+        "memory/bytes_per_unit": Result("memory", bytes_per_unit),
+    }
+
+
+@isolated_case("memory/workload_peaks")
+def _measure_workload_peaks() -> dict[str, Result]:
+    texts = [f"{i}.5 {symbol}" for i in range(25_000) for symbol in ("ms", "s", "min", "µs")]
+    results = {}
+
+    tracemalloc.start()
+    u.Duration.parse_many(texts)
+    results["memory/parse_many_peak"] = Result("memory", tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+    quantities = [u.Quantity(float(i), unit) for i in range(25_000) for unit in (u.m, u.km, u.ft)]
+
+    tracemalloc.start()
+    u.fsum(quantities, u.meters)
+    u.mean(quantities, u.meters)
+    results["memory/aggregation_peak"] = Result("memory", tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+    return results
+
+
+@isolated_case("count/caches")
+def _measure_cache_sizes() -> dict[str, Result]:
+    _standard_workload()
+
+    sizes = {
+        "units_cache": len(units_cache),
+        "units_by_symbol": len(units_by_symbol),
+        "parsed_units": u.Unit._from_compound_symbol.cache_info().currsize,
+        "quantity_aliases": len(QUANTITY_ALIASES_BY_EXPONENTS),
+        **{name: len(cache) for name, cache in caches.items()},
+    }
+
+    return {f"count/{name}": Result("count", size) for name, size in sizes.items()}
+
+
+def _standard_workload() -> None:
+    """
+    Uses a bit of everything, the way a typical application would.
+    """
+    distances = [u.meters(100), u.kilometers(3), u.feet(12), u.miles(1.5)]
+    durations = [u.seconds(9.58), u.minutes(3), u.hours(2)]
+
+    for distance in distances:
+        for duration in durations:
+            speed = distance / duration
+            str(speed)
+            speed.to_number(u.kph)
+
+    for distance in distances:
+        str(distance * distance)
+        str(distance + u.meters(1))
+
+    for text in ["12.5 km/h", "3 ms", "1.5e3 kg*m/s²", "5 MiB", "20 K", "3 fl oz"]:
+        str(u.Quantity.parse(text))
+
+    str(u.fsum(distances))
+    f"{u.seconds(5025):h+min+s}"
+    u.decompose(u.feet(100))
+    u.common_unit(durations)
+
+
+# --- Runner -------------------------------------------------------------------------------------
+
+
+def measure_time(make_func: t.Callable[[], t.Callable[[], object]], repeat: int = 5) -> Result:
+    timer = timeit.Timer(make_func())
+    number, _ = timer.autorange()
+
+    return Result("time", min(timer.repeat(repeat, number)) / number)
+
+
+def measure_import_time(repeat: int = 5) -> Result:
+    code = "import time; start = time.perf_counter(); import u; print(time.perf_counter() - start)"
+
+    times = [float(_run_python(["-c", code])) for _ in range(repeat)]
+    return Result("time", min(times))
+
+
+def measure_isolated(name: str) -> dict[str, Result]:
+    output = _run_python([__file__, "--isolated", name])
+    return {name: Result(*result) for name, result in json.loads(output).items()}
+
+
+def _run_python(args: list[str]) -> str:
+    process = subprocess.run(
+        [sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return process.stdout
+
+
+def run_cases(filter: str | None) -> dict[str, Result]:
+    results = dict[str, Result]()
+
+    for name, make_func in TIME_CASES.items():
+        if filter is None or filter in name:
+            results[name] = measure_time(make_func)
+            _print_progress(name, results[name])
+
+    if filter is None or filter in "time/import":
+        results["time/import"] = measure_import_time()
+        _print_progress("time/import", results["time/import"])
+
+    for name in ISOLATED_CASES:
+        if filter is not None and filter not in name:
+            continue
+
+        for result_name, result in measure_isolated(name).items():
+            results[result_name] = result
+            _print_progress(result_name, result)
+
+    return results
+
+
+def remeasure_slow_cases(
+    baseline: t.Mapping[str, Result],
+    results: dict[str, Result],
+    *,
+    time_threshold: float,
+    retries: int,
+) -> None:
+    """
+    Timings are noisy, so time cases that look like regressions are measured again. The best
+    measurement is kept.
+    """
+    for name, make_func in TIME_CASES.items():
+        old = baseline.get(name)
+
+        for _ in range(retries):
+            result = results.get(name)
+            if old is None or result is None or result.value <= old.value * (1 + time_threshold):
+                break
+
+            new_result = measure_time(make_func)
+            results[name] = min(result, new_result, key=lambda result: result.value)
+            _print_progress(f"{name} (again)", new_result)
+
+
+def compare(
+    baseline: t.Mapping[str, Result],
+    results: t.Mapping[str, Result],
+    *,
+    time_threshold: float,
+    memory_threshold: float,
+) -> list[str]:
+    """
+    Prints a comparison table and returns the names of all cases that regressed by more than the
+    threshold.
+    """
+    regressions = list[str]()
+
+    print()
+    print(f"{'case':<55} {'baseline':>12} {'current':>12} {'change':>9}")
+
+    for name, result in results.items():
+        old = baseline.get(name)
+
+        if old is None:
+            print(f"{name:<55} {'-':>12} {_format_value(result):>12} {'new':>9}")
+            continue
+
+        threshold = time_threshold if result.kind == "time" else memory_threshold
+
+        if old.value:
+            change = result.value / old.value - 1
+            change_str = f"{change:+.1%}"
+        else:
+            change = 0 if result.value == 0 else float("inf")
+            change_str = "+inf" if change else "+0.0%"
+
+        marker = ""
+        if change > threshold:
+            regressions.append(name)
+            marker = "  REGRESSION"
+
+        print(
+            f"{name:<55} {_format_value(old):>12} {_format_value(result):>12}"
+            f" {change_str:>9}{marker}"
+        )
+
+    return regressions
+
+
+def load_baseline(path: pathlib.Path) -> dict[str, Result]:
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+
+    return {
+        name: Result(result["kind"], result["value"]) for name, result in data["results"].items()
+    }
+
+
+def save_baseline(path: pathlib.Path, results: t.Mapping[str, Result]) -> None:
+    data = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": {
+            name: {"kind": result.kind, "value": result.value, "unit": UNITS_BY_KIND[result.kind]}
+            for name, result in sorted(results.items())
+        },
+    }
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=2)
+        file.write("\n")
+
+
+def _format_value(result: Result) -> str:
+    if result.kind == "time":
+        for unit, factor in [("s", 1), ("ms", 1e3), ("µs", 1e6)]:
+            if result.value * factor >= 1:
+                return f"{result.value * factor:.3g} {unit}"
+
+        return f"{result.value * 1e9:.3g} ns"
+
+    if result.kind == "memory":
+        for unit, factor in [("MiB", 2**20), ("KiB", 2**10)]:
+            if result.value >= factor:
+                return f"{result.value / factor:.3g} {unit}"
+
+        return f"{result.value:.0f} B"
+
+    return f"{result.value:.0f}"
+
+
+def _print_progress(name: str, result: Result) -> None:
+    print(f"{name:<55} {_format_value(result):>12}", file=sys.stderr)
+
+
+def main(argv: t.Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks that guard against regressions.")
+    parser.add_argument("--update", action="store_true", help="Record a new baseline")
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE_PATH)
+    parser.add_argument("-k", dest="filter", help="Only run cases whose name contains this")
+    parser.add_argument(
+        "--time-threshold",
+        type=float,
+        default=0.3,
+        help="How much slower a case may get before it counts as a regression (default: 0.3)",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=0.1,
+        help="Like --time-threshold, but for memory and cache sizes (default: 0.1)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=3,
+        help="How often to re-measure time cases that look like regressions (default: 3)",
+    )
+    parser.add_argument("--isolated", help=argparse.SUPPRESS)
+
+    args = parser.parse_args(argv)
+
+    if args.isolated is not None:
+        results = ISOLATED_CASES[args.isolated]()
+        print(json.dumps(results))
+        return 0
+
+    results = run_cases(args.filter)
+
+    if args.update:
+        if args.filter is not None and args.baseline.exists():
+            results = {**load_baseline(args.baseline), **results}
+
+        save_baseline(args.baseline, results)
+        print(f"Saved the baseline to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    remeasure_slow_cases(
+        baseline, results, time_threshold=args.time_threshold, retries=args.retries
+    )
+
+    regressions = compare(
+        baseline,
+        results,
+        time_threshold=args.time_threshold,
+        memory_threshold=args.memory_threshold,
+    )
+
+    if regressions:
+        print(f"\n{len(regressions)} case(s) regressed: {', '.join(regressions)}")
+        return 1
+
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
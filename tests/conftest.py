@@ -0,0 +1,18 @@
+import pytest
+
+import u
+
+
+@pytest.fixture
+def ms() -> u.Unit[u.DURATION]:
+    return u.milli(u.seconds)
+
+
+@pytest.fixture
+def index(ms: u.Unit[u.DURATION]) -> u.QuantityIndex[u.DURATION]:
+    return u.QuantityIndex[u.DURATION]([u.seconds(2), ms(30), ms(1), u.minutes(1), ms(500)])
+
+
+@pytest.fixture
+def histogram(ms: u.Unit[u.DURATION]) -> u.Histogram[u.DURATION]:
+    return u.Histogram([ms(1), ms(5), ms(25), u.seconds(1)])
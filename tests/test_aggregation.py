@@ -0,0 +1,84 @@
+from decimal import Decimal
+
+import pytest
+
+import u
+
+
+def test_fsum():
+    result = u.fsum([u.seconds(30), u.minutes(1), u.seconds(30)])
+
+    assert result == u.minutes(2)
+    assert repr(result) == "120 s"
+
+
+def test_fsum_accepts_generators():
+    assert u.fsum(u.seconds(0.1) for _ in range(10)) == u.seconds(1)
+
+
+def test_fsum_is_accurate():
+    values = [u.seconds(0.1)] * 10 + [u.minutes(Decimal("0.5"))]
+
+    assert u.fsum(values).to_number(u.seconds) == 31
+
+
+def test_fsum_with_unit():
+    assert repr(u.fsum([u.km(1), u.m(500)], unit=u.m)) == "1500 m"
+    assert u.fsum([], unit=u.m) == 0
+
+
+def test_fsum_empty():
+    with pytest.raises(ValueError):
+        u.fsum([])
+
+
+def test_fsum_incompatible():
+    with pytest.raises(ValueError):
+        u.fsum([u.seconds(1), u.meters(1)])  # type: ignore
+
+
+def test_mean():
+    assert u.mean([u.seconds(30), u.minutes(1)]) == u.seconds(45)
+    assert u.mean(iter([u.km(1), u.m(500), u.m(1500)])) == u.km(1)
+
+
+def test_mean_empty():
+    with pytest.raises(ValueError):
+        u.mean([])
+
+
+def test_minimum_and_maximum():
+    values = [u.seconds(90), u.minutes(1), u.seconds(30), u.minutes(2)]
+
+    assert u.minimum(values) is values[2]
+    assert u.maximum(values) is values[3]
+
+
+def test_minimum_empty():
+    with pytest.raises(ValueError):
+        u.minimum([])
+
+
+def test_common_unit():
+    distances = [u.m(500), u.km(3), u.km(30)]
+
+    assert u.common_unit(distances) is u.km
+    assert u.common_unit([u.hours(3), u.minutes(300)]) is u.hours
+    assert u.common_unit([u.mps(0)]) is u.mps
+
+
+def test_common_unit_by_max():
+    distances = [u.m(5), u.m(20), u.km(30)]
+
+    assert u.common_unit(distances) is u.m
+    assert u.common_unit(distances, by="max") is u.km
+
+
+def test_common_unit_systems():
+    assert u.common_unit([u.km(3), u.mi(5)], systems=["imperial"]) is u.mi
+
+
+@pytest.mark.parametrize("quantities", [[], [u.m(1), u.seconds(1)]])
+def test_common_unit_invalid(quantities: list):
+    with pytest.raises(ValueError):
+        u.common_unit(quantities)
@@ -0,0 +1,88 @@
+import asyncio
+import concurrent.futures
+import typing as t
+
+import pytest
+
+import u
+
+
+async def aiter_(items: t.Iterable) -> t.AsyncIterator:
+    for item in items:
+        yield item
+
+
+async def collect(items: t.AsyncIterable) -> list:
+    return [item async for item in items]
+
+
+def test_parse():
+    lines = [b"5 km\n", "\n", u.m(300), "1.5km"]
+
+    result = asyncio.run(collect(u.aio.parse(aiter_(lines), batch_size=2)))
+    assert result == [u.km(5), u.m(300), u.km(1.5)]
+
+
+def test_parse_with_quantity():
+    with pytest.raises(ValueError):
+        asyncio.run(collect(u.aio.parse(aiter_(["5 km", "3 s"]), u.Distance)))
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect(u.aio.parse(aiter_([u.seconds(3)]), u.Distance)))
+
+
+def test_parse_in_executor():
+    lines = [f"{i} s" for i in range(10)]
+
+    async def main():
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            return await collect(u.aio.parse(aiter_(lines), batch_size=3, executor=executor))
+
+    assert asyncio.run(main()) == [u.seconds(i) for i in range(10)]
+
+
+def test_partial_batches_are_not_held_back():
+    async def main():
+        received = asyncio.Event()
+
+        async def lines():
+            yield "1 s"
+            await received.wait()
+            yield "2 s"
+
+        result = []
+        async for quantity in u.aio.parse(lines(), batch_size=100):
+            result.append(quantity)
+            received.set()
+
+        return result
+
+    assert asyncio.run(asyncio.wait_for(main(), 5)) == [u.seconds(1), u.seconds(2)]
+
+
+def test_source_error():
+    async def lines():
+        yield "1 s"
+        raise OSError("Connection lost")
+
+    with pytest.raises(OSError):
+        asyncio.run(collect(u.aio.parse(lines())))
+
+
+def test_convert():
+    result = asyncio.run(collect(u.aio.convert(aiter_(["5 km", u.m(300)]), u.m)))
+    assert [repr(quantity) for quantity in result] == ["5000.0 m", "300.0 m"]
+
+
+def test_aggregation():
+    lines = ["30 s", "1 min", u.seconds(30), "2 min"]
+
+    assert asyncio.run(u.aio.fsum(aiter_(lines), batch_size=3)) == u.seconds(240)
+    assert asyncio.run(u.aio.mean(aiter_(lines), batch_size=3)) == u.seconds(60)
+    assert asyncio.run(u.aio.minimum(aiter_(lines), batch_size=3)) == u.seconds(30)
+    assert asyncio.run(u.aio.maximum(aiter_(lines), batch_size=3)) == u.minutes(2)
+
+
+def test_mean_empty():
+    with pytest.raises(ValueError):
+        asyncio.run(u.aio.mean(aiter_([])))
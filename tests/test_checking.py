@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import typing as t
+
+import pytest
+
+import u
+
+
+@u.checked
+def travel_time(distance: u.Distance, speed: u.Speed, note: str = "") -> u.Duration:
+    return distance / speed  # type: ignore
+
+
+def test_valid_arguments():
+    assert travel_time(u.km(5), u.kph(5)) == u.hours(1)
+    assert travel_time(speed=u.kph(5), distance=u.km(5)) == u.hours(1)
+
+
+def test_invalid_argument():
+    with pytest.raises(TypeError):
+        travel_time(u.km(5), u.seconds(3))  # type: ignore
+
+    with pytest.raises(TypeError):
+        travel_time(u.km(5), speed=5)  # type: ignore
+
+
+def test_invalid_return_value():
+    @u.checked
+    def func() -> u.Distance:
+        return u.seconds(3)  # type: ignore
+
+    with pytest.raises(TypeError):
+        func()
+
+
+def test_optional():
+    @u.checked
+    def func(distance: t.Optional[u.Distance] = None, *durations: u.Duration) -> None:
+        pass
+
+    func()
+    func(None)
+    func(u.m(3), u.seconds(1), u.minutes(2))
+
+    with pytest.raises(TypeError):
+        func(u.seconds(1))  # type: ignore
+
+    with pytest.raises(TypeError):
+        func(u.m(3), u.seconds(1), u.m(2))  # type: ignore
+
+
+def test_convert():
+    @u.checked(convert={"duration": u.seconds, "distance": u.meters})
+    def func(duration: u.Duration, *, distance: u.Distance) -> tuple[str, str]:
+        return repr(duration), repr(distance)
+
+    assert func(u.minutes(1), distance=u.km(1)) == ("60.0 s", "1000.0 m")
+
+
+def test_convert_unknown_parameter():
+    with pytest.raises(TypeError, match="foo"):
+
+        @u.checked(convert={"foo": u.seconds})
+        def func(duration: u.Duration) -> None:
+            pass
+
+
+def test_disable_checks():
+    u.set_checks_enabled(False)
+
+    try:
+        travel_time(u.km(5), u.seconds(3))  # type: ignore
+    finally:
+        u.set_checks_enabled(True)
@@ -0,0 +1,99 @@
+import importlib.util
+import pathlib
+
+import pytest
+
+import u
+from u.cli.make_derived_quantity import generate_module, main
+
+
+def import_module(path: pathlib.Path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None and spec.loader is not None
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generated_module(tmp_path: pathlib.Path):
+    path = tmp_path / "specific_heat.py"
+    main(
+        [
+            "SPECIFIC_HEAT",
+            "DIV[ENERGY, MUL[MASS, TEMPERATURE]]",
+            "--unit",
+            "J/(kg*K)",
+            "--unit",
+            "kcal/(kg*K)",
+            "--prefix",
+            "k",
+            "-o",
+            str(path),
+        ]
+    )
+
+    module = import_module(path)
+
+    assert module.SpecificHeat is u.Quantity[module.SPECIFIC_HEAT]
+    assert module.SpecificHeat is u.Quantity[u.DIV[u.ENERGY, u.MUL[u.MASS, u.TEMPERATURE]]]
+
+    assert module.J_per_kg_K.symbol == "J/(kg*K)"
+    assert module.J_per_kg_K == u.joules / (u.kilograms * u.kelvin)
+    assert module.kJ_per_kg_K == u.kilo(u.joules) / (u.kilograms * u.kelvin)
+    assert module.kcal_per_kg_K == u.kcal / (u.kilograms * u.kelvin)
+    assert module.kkcal_per_kg_K.multiplier == 1000 * module.kcal_per_kg_K.multiplier
+
+    assert module.__all__ == [
+        "SPECIFIC_HEAT",
+        "SpecificHeat",
+        "J_per_kg_K",
+        "kcal_per_kg_K",
+        "kJ_per_kg_K",
+        "kkcal_per_kg_K",
+    ]
+
+    assert module.J_per_kg_K(1) == module.kJ_per_kg_K(0.001)
+
+
+def test_unit_names():
+    source = generate_module(
+        "SPECIFIC_HEAT", "ENERGY/(MASS*TEMPERATURE)", units=["specific_heat_unit=J/(kg*K)"]
+    )
+    assert 'specific_heat_unit = Unit(SpecificHeat, "J/(kg*K)", 1, systems={"metric"})' in source
+
+
+def test_symbol_equation():
+    source = generate_module("ACCELERATION_RATE", "DISTANCE/DURATION^3")
+
+    assert "ACCELERATION_RATE = DIV[DISTANCE, MUL[DURATION, MUL[DURATION, DURATION]]]" in source
+    assert "{DISTANCE: 1, DURATION: -3}" in source
+    assert 'm_per_s3 = Unit(AccelerationRate, "m/s³", 1, systems={"metric"})' in source
+
+
+def test_fraction_multiplier(tmp_path: pathlib.Path):
+    third = u.Unit(u.Duration, "thirdsecond", u.seconds.fraction_multiplier / 3)
+
+    path = tmp_path / "cooling_time.py"
+    path.write_text(
+        generate_module("COOLING_TIME", "DURATION/TEMPERATURE", units=["thirdsecond/K"]),
+        encoding="utf-8",
+    )
+    module = import_module(path)
+
+    expected_multiplier = third.fraction_multiplier / u.kelvin.fraction_multiplier
+    assert module.thirdsecond_per_K.fraction_multiplier == expected_multiplier
+
+
+@pytest.mark.parametrize(
+    "equation, units, prefixes",
+    [
+        ("DIV[DISTANCE, FOO]", [], []),
+        ("DISTANCE/DISTANCE", [], []),
+        ("DIV[DISTANCE, DURATION]", ["kg/s"], []),
+        ("DIV[MUL[DISTANCE, DISTANCE], DURATION]", ["m²/s"], ["k"]),
+    ],
+)
+def test_errors(equation: str, units: list[str], prefixes: list[str]):
+    with pytest.raises(ValueError):
+        generate_module("NAME", equation, units=units, prefixes=prefixes)
@@ -1,3 +1,5 @@
+import datetime
+import decimal
 import typing as t
 
 import pytest
@@ -114,6 +116,13 @@ def test_format(value: u.Quantity, format_: str, expected_result: t.Union[str, t
         ("2m/s²", u.Acceleration, u.mps2(2)),
         ("4m/s/s", u.Acceleration, u.mps2(4)),
         ("3C", u.ElectricCharge, u.coulombs(3)),
+        ("1.2e-3 s", u.Duration, u.seconds(0.0012)),
+        ("-2E3 m", u.Distance, u.km(-2)),
+        ("5 m^2", u.Area, u.m2(5)),
+        ("5 m**2", u.Area, u.m2(5)),
+        ("2 m/s^2", u.Acceleration, u.mps2(2)),
+        ("1 kg*m/(s*s)", u.Force, u.newtons(1)),
+        ("3 (m/s)²", u.Quantity, u.mps(1) * u.mps(3)),
     ],
 )
 def test_parse(text: str, quantity: type[u.Quantity], expected_result: u.Quantity):
@@ -133,3 +142,68 @@ def test_parse(text: str, quantity: type[u.Quantity], expected_result: u.Quantit
 def test_parse_as_wrong_quantity(text: str, quantity: type[u.Quantity]):
     with pytest.raises(ValueError):
         quantity.parse(text)
+
+
+@pytest.mark.parametrize(
+    "text", ["km", "5 m/", "5 m//s", "5 m²s", "5 (m", "5 m)", "5 m^2^3", "5 m(s)"]
+)
+def test_parse_invalid(text: str):
+    with pytest.raises(ValueError):
+        u.Quantity.parse(text)
+
+
+def test_parse_preserves_precision():
+    assert u.Quantity.parse("12345678901234567890123 m")._value == 12345678901234567890123
+    assert type(u.Quantity.parse("1.0e3 m")._value) is int
+
+    value = u.Quantity.parse("0.1 m", decimal.Decimal)._value
+    assert value == decimal.Decimal("0.1")
+
+
+def test_parsed_units_are_cached_by_stripped_symbol():
+    u.Unit.parse("km/h")
+    cache_size = u.Unit._from_compound_symbol.cache_info().currsize
+
+    assert u.Unit.parse(" km/h ") is u.Unit.parse("km/h")
+    assert u.Unit._from_compound_symbol.cache_info().currsize == cache_size
+
+
+def test_parsed_symbols_round_trip():
+    unit = u.kg / (u.m * u.s)
+    assert u.Unit.parse(unit.symbol) is unit
+
+
+@pytest.mark.parametrize(
+    "timedelta, expected_value, expected_unit",
+    [
+        (datetime.timedelta(days=2), 172_800, u.seconds),
+        (datetime.timedelta(minutes=1, milliseconds=500), 60_500, u.milli(u.seconds)),
+        (datetime.timedelta(seconds=1, microseconds=3), 1_000_003, u.micro(u.seconds)),
+        (datetime.timedelta(microseconds=-3), -3, u.micro(u.seconds)),
+    ],
+)
+def test_from_timedelta(timedelta: datetime.timedelta, expected_value: int, expected_unit: u.Unit):
+    duration = u.Duration.from_timedelta(timedelta)
+
+    assert duration._value == expected_value
+    assert type(duration._value) is int
+    assert duration._unit is expected_unit
+    assert duration.to_timedelta() == timedelta
+
+
+def test_from_timedelta_wrong_quantity():
+    with pytest.raises(TypeError):
+        u.Distance.from_timedelta(datetime.timedelta(seconds=1))
+
+
+def test_to_timedelta():
+    assert u.minutes(1.5).to_timedelta() == datetime.timedelta(seconds=90)
+    assert u.hours(decimal.Decimal("1.1")).to_timedelta() == datetime.timedelta(minutes=66)
+    assert u.nano(u.seconds)(1500).to_timedelta() == datetime.timedelta(microseconds=2)
+
+    # Exact, even though a float number of seconds would lose the microsecond
+    big = u.days(10**6) + u.micro(u.seconds)(1)
+    assert big.to_timedelta() == datetime.timedelta(days=10**6, microseconds=1)
+
+    with pytest.raises(TypeError):
+        u.meters(1).to_timedelta()  # type: ignore
@@ -0,0 +1,86 @@
+import io
+
+import pytest
+
+import u
+
+
+@pytest.mark.parametrize(
+    "header, expected_result",
+    [
+        ("latency [ms]", ("latency", u.milli(u.seconds))),
+        ("size (MiB)", ("size", u.mebibytes)),
+        ("speed [m/s]", ("speed", u.mps)),
+        ("size (total)", ("size (total)", None)),
+        ("host", ("host", None)),
+    ],
+)
+def test_parse_header(header: str, expected_result: tuple):
+    assert u.csv.parse_header(header) == expected_result
+
+
+def test_reader(ms: u.Unit[u.DURATION]):
+    file = io.StringIO("host,latency [ms]\na,12.5\nb,\n")
+
+    reader = u.csv.reader(file)
+    assert reader.fieldnames == ["host", "latency"]
+    assert reader.units == {"host": None, "latency": ms}
+    assert list(reader) == [
+        {"host": "a", "latency": ms(12.5)},
+        {"host": "b", "latency": None},
+    ]
+
+
+def test_reader_with_target_units():
+    file = io.StringIO("host,latency [ms]\na,1500\n")
+
+    rows = list(u.csv.reader(file, to={"latency": u.seconds}))
+    assert rows == [{"host": "a", "latency": 1.5}]
+
+
+def test_reader_skips_empty_lines():
+    file = io.StringIO("host,latency [ms]\n\na,1500\n")
+
+    assert list(u.csv.reader(file, to={"latency": u.seconds})) == [{"host": "a", "latency": 1.5}]
+
+
+@pytest.mark.parametrize("line", ["a", "a,1500,extra"])
+def test_reader_with_wrong_number_of_cells(line: str):
+    reader = u.csv.reader(io.StringIO(f"host,latency [ms]\n{line}\n"))
+
+    with pytest.raises(ValueError):
+        next(reader)
+
+
+@pytest.mark.parametrize("to", [{"host": u.seconds}, {"latency": u.meters}, {"size": u.bytes}])
+def test_reader_with_invalid_target_units(to: dict):
+    with pytest.raises(ValueError):
+        u.csv.reader(io.StringIO("host,latency [ms]\n"), to=to)
+
+
+def test_writer(ms: u.Unit[u.DURATION]):
+    file = io.StringIO()
+
+    writer = u.csv.writer(file, ["host", "latency"], {"latency": ms}, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(
+        [
+            {"host": "a", "latency": ms(3)},
+            {"host": "b", "latency": u.seconds(1.5)},
+            {"host": "c", "latency": 7},
+            {"host": "d"},
+        ]
+    )
+
+    assert file.getvalue() == "host,latency [ms]\na,3\nb,1500.0\nc,7\nd,\n"
+
+
+def test_round_trip(ms: u.Unit[u.DURATION]):
+    file = io.StringIO()
+
+    writer = u.csv.writer(file, ["latency"], {"latency": ms})
+    writer.writeheader()
+    writer.writerow({"latency": ms(2.5)})
+
+    file.seek(0)
+    assert list(u.csv.reader(file)) == [{"latency": ms(2.5)}]
@@ -0,0 +1,72 @@
+import decimal
+
+import pytest
+
+import u
+
+
+def test_decompose():
+    result = u.decompose(u.seconds(5025), [u.seconds, u.hours, u.minutes])
+
+    assert result == [u.hours(1), u.minutes(23), u.seconds(45)]
+    assert [type(component._value) for component in result] == [int, int, int]
+
+
+def test_decompose_decimal():
+    result = u.decompose(u.seconds(decimal.Decimal("5025.5")), [u.hours, u.minutes, u.seconds])
+    assert result == [u.hours(1), u.minutes(23), u.seconds(decimal.Decimal("45.5"))]
+
+
+def test_decompose_negative():
+    assert u.decompose(u.feet(-100), [u.yards, u.feet]) == [u.yards(-33), u.feet(-1)]
+
+
+def test_decompose_is_exact():
+    result = u.decompose(u.hours(1.1), [u.hours, u.minutes, u.seconds])
+
+    assert result == [u.hours(1), u.minutes(6), u.seconds(0)]
+    assert [type(component._value) for component in result] == [int, int, float]
+
+
+def test_decompose_default_units():
+    assert u.decompose(u.seconds(5025)) == [u.hours(1), u.minutes(23), u.seconds(45)]
+    assert u.decompose(u.feet(100)) == [u.yards(33), u.feet(1)]
+
+
+def test_decompose_incompatible_units():
+    with pytest.raises(ValueError):
+        u.decompose(u.seconds(1), [u.meters])
+
+    with pytest.raises(ValueError):
+        u.decompose(u.seconds(1), [u.minutes, u.meters])
+
+
+@pytest.mark.parametrize(
+    "value, format_, expected_result",
+    [
+        (u.seconds(5025), "h+min+s", "1 h 23 min 45 s"),
+        (u.seconds(3605), "h+min+s", "1 h 5 s"),
+        (u.seconds(-3605), "h+min+s", "-1 h 5 s"),
+        (u.seconds(0), "h+min+s", "0 s"),
+        (u.seconds(65.123), ".2f h+min+s", "1 min 5.12 s"),
+        (u.miles(1.125), "mi+yd", "1 mi 220 yd"),
+        (u.hours(1.1), "h+min+s", "1 h 6 min"),
+        # Rounding up to a whole larger unit is carried over
+        (u.seconds(119.999), ".2f min+s", "2 min"),
+        (u.seconds(3599.96), ".1f h+min+s", "1 h"),
+        (u.seconds(119.96), "min+s", "2 min"),
+        (u.seconds(-119.999), ".2f min+s", "-2 min"),
+        (u.seconds(-0.001), ".2f min+s", "0.00 s"),
+        # The sign applies to the whole result
+        (u.seconds(3605), "+.1f h+min+s", "+1 h 5.0 s"),
+        (u.seconds(-3605), "+.1f h+min+s", "-1 h 5.0 s"),
+        (u.seconds(3605), " .1f h+min+s", " 1 h 5.0 s"),
+    ],
+)
+def test_format(value: u.Quantity, format_: str, expected_result: str):
+    assert format(value, format_) == expected_result
+
+
+def test_decompose_infinity():
+    with pytest.raises(ValueError):
+        u.decompose(u.seconds(float("inf")), [u.minutes, u.seconds])
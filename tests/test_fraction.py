@@ -0,0 +1,43 @@
+from decimal import Decimal
+from fractions import Fraction
+
+import u
+
+
+def test_fraction_quantity():
+    dist = u.meter(Fraction(1, 3))
+
+    assert dist.to_fraction(u.meter) == Fraction(1, 3)
+    assert dist.to_number(u.meter) == 1 / 3
+
+
+def test_fraction_conversion_is_exact():
+    assert u.seconds(1).to_fraction(u.minutes) == Fraction(1, 60)
+    assert u.seconds(Fraction(20)).to_fraction(u.hours) * 180 == 1
+    assert u.inches(Fraction(1)).to_fraction(u.mils) == 1000
+
+
+def test_fraction_multiplier():
+    thirds = u.Unit(u.Duration, "third", Fraction(1, 3))
+
+    assert thirds.fraction_multiplier == Fraction(1, 3)
+    assert thirds(Fraction(3)).to_fraction(u.seconds) == 1
+    assert thirds(3) == u.seconds(1)
+
+
+def test_compound_fraction_multiplier():
+    assert (u.seconds / u.minutes).fraction_multiplier == Fraction(1, 60)
+    assert (u.km**2).fraction_multiplier == 1_000_000
+
+
+def test_mixed_math():
+    res = u.meter(Fraction(1, 2)) + u.meter(Decimal("0.25"))
+    assert res.to_fraction(u.meter) == Fraction(3, 4)
+
+    res = u.meter(Decimal("0.25")) + u.meter(Fraction(1, 2))
+    assert res.to_decimal(u.meter) == Decimal("0.75")
+
+
+def test_str():
+    assert str(u.meters(Fraction(3, 2))) == "1.5 m"
+    assert str(u.km(Fraction(3, 2))) == "1.5 km"
@@ -0,0 +1,56 @@
+import pytest
+
+import u
+
+
+def test_observe(histogram: u.Histogram[u.DURATION], ms: u.Unit[u.DURATION]):
+    histogram.observe(ms(3))
+    histogram.observe(ms(5))
+    histogram.observe(0.002, u.seconds)
+    histogram.observe(u.minutes(1))
+
+    assert histogram.counts == (0, 3, 0, 0, 1)
+    assert histogram.total == 4
+
+
+def test_observe_converted_bound(ms: u.Unit[u.DURATION]):
+    bound = u.seconds(1 / 7)
+    histogram = u.Histogram([bound])
+
+    histogram.observe(ms(bound.to_number(ms)))
+    histogram.observe(bound.to_number(ms), ms)
+
+    assert histogram.counts == (2, 0)
+
+
+def test_observe_many(histogram: u.Histogram[u.DURATION], ms: u.Unit[u.DURATION]):
+    histogram.observe_many([0.5, 10, 2000], ms)
+
+    assert histogram.counts == (1, 0, 1, 0, 1)
+
+
+def test_observe_incompatible(histogram: u.Histogram[u.DURATION]):
+    with pytest.raises(ValueError):
+        histogram.observe(u.meters(1))  # type: ignore
+
+    with pytest.raises(ValueError):
+        histogram.observe(1, u.meters)  # type: ignore
+
+
+def test_labels(histogram: u.Histogram[u.DURATION]):
+    assert histogram.labels() == ["≤ 1 ms", "≤ 5 ms", "≤ 25 ms", "≤ 1 s", "> 1 s"]
+    assert histogram.labels("ms")[-1] == "> 1000 ms"
+
+
+def test_merge_and_snapshot(histogram: u.Histogram[u.DURATION], ms: u.Unit[u.DURATION]):
+    histogram.observe(ms(3))
+    snapshot = histogram.snapshot()
+
+    histogram.observe(ms(3))
+    assert snapshot.counts == (0, 1, 0, 0, 0)
+
+    snapshot.merge(histogram)
+    assert snapshot.counts == (0, 3, 0, 0, 0)
+
+    with pytest.raises(ValueError):
+        snapshot.merge(u.Histogram([ms(1)]))
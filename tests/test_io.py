@@ -0,0 +1,141 @@
+import fractions
+
+import pytest
+
+import u
+
+np = pytest.importorskip("numpy")
+
+
+def test_load_column(tmp_path, ms: u.Unit[u.DURATION]):
+    path = tmp_path / "latencies.f8"
+    np.array([1.5, 2.5, 30.0], dtype="<f8").tofile(path)
+
+    column = u.io.load_column(path, ms, dtype="<f8")
+
+    assert column.unit is ms
+    assert column.values.tolist() == [1.5, 2.5, 30.0]
+    assert column.to_numbers(u.seconds).tolist() == [0.0015, 0.0025, 0.03]
+    assert u.stats.max(*column) == ms(30)
+
+
+def test_load_column_incompatible_unit(tmp_path, ms: u.Unit[u.DURATION]):
+    path = tmp_path / "latencies.f8"
+    np.array([1.0]).tofile(path)
+
+    with pytest.raises(ValueError):
+        u.io.load_column(path, ms).to_numbers(u.meters)
+
+
+def test_load_text_column(tmp_path, ms: u.Unit[u.DURATION]):
+    path = tmp_path / "data.csv"
+    path.write_text("host,latency\na,12.5\nb,8\n")
+
+    assert u.io.load_text_column(path, "latency", ms).values.tolist() == [12.5, 8.0]
+
+
+def test_load_text_column_by_index(tmp_path, ms: u.Unit[u.DURATION]):
+    path = tmp_path / "data.tsv"
+    path.write_text("a\t12.5\nb\t8\n")
+
+    column = u.io.load_text_column(path, 1, ms, delimiter="\t")
+    assert column.values.tolist() == [12.5, 8.0]
+
+
+def test_load_text_column_unknown_name(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("host,latency\na,12.5\n")
+
+    with pytest.raises(ValueError):
+        u.io.load_text_column(path, "size", u.bytes)
+
+
+@pytest.mark.parametrize(
+    "dtype, expected_unit, expected_values",
+    [
+        ("m8[ns]", u.nano(u.seconds), [1500, 20]),
+        ("m8[us]", u.micro(u.seconds), [1500, 20]),
+        ("m8[ms]", u.milli(u.seconds), [1500, 20]),
+        ("m8[s]", u.seconds, [1500, 20]),
+        ("m8[D]", u.days, [1500, 20]),
+        ("m8[10ms]", u.milli(u.seconds), [15000, 200]),
+    ],
+)
+def test_from_timedelta64(dtype: str, expected_unit: u.Unit, expected_values: list[int]):
+    array = u.io.from_timedelta64(np.array([1500, 20], dtype=dtype))
+
+    assert array.unit is expected_unit
+    assert array.values.dtype == np.int64
+    assert array.values.tolist() == expected_values
+
+
+@pytest.mark.parametrize("dtype", ["m8[Y]", "m8[M]", "m8"])
+def test_from_timedelta64_unsupported_resolution(dtype: str):
+    with pytest.raises(ValueError):
+        u.io.from_timedelta64(np.array([1], dtype=dtype))
+
+
+def test_from_timedelta64_nat():
+    with pytest.raises(ValueError):
+        u.io.from_timedelta64(np.array([1, "NaT"], dtype="m8[s]"))
+
+
+@pytest.mark.parametrize("resolution, divisor", [("us", 10**3), ("ms", 10**6), ("s", 10**9)])
+def test_to_timedelta64_coarser_resolution_is_exact(resolution: str, divisor: int):
+    rng = np.random.default_rng(0)
+    # Nanosecond timestamps between 2020 and 2027, plus some ties
+    values = rng.integers(1_600_000_000 * 10**9, 1_800_000_000 * 10**9, size=2000)
+    values = np.concatenate([values, -values, np.array([1, 3, 5, -1, -3, -5]) * divisor // 2])
+
+    result = u.io.to_timedelta64(u.io.UnitArray(values, u.nano(u.seconds)), resolution)
+
+    # `round` rounds Fractions exactly, with ties going to the even number
+    expected = [round(fractions.Fraction(value, divisor)) for value in values.tolist()]
+    assert result.view(np.int64).tolist() == expected
+
+
+def test_from_timedelta64_overflow():
+    array = u.io.from_timedelta64(np.array([2**59], dtype="m8[10ms]"))
+    assert array.values.tolist() == [10 * 2**59]
+
+    with pytest.raises(OverflowError):
+        u.io.from_timedelta64(np.array([2**62], dtype="m8[10ms]"))
+
+    with pytest.raises(OverflowError):
+        u.io.from_timedelta64(np.array([-(2**62)], dtype="m8[10ms]"))
+
+
+def test_to_timedelta64():
+    values = np.array([1500, 20], dtype="m8[ms]")
+    array = u.io.from_timedelta64(values)
+
+    assert (u.io.to_timedelta64(array, "ms") == values).all()
+
+    # Exact, even for values that don't fit into a float
+    big = u.io.UnitArray(np.array([2**60 + 1]), u.nano(u.seconds))
+    assert u.io.to_timedelta64(big, "ns").view(np.int64).tolist() == [2**60 + 1]
+
+    nanoseconds = u.io.to_timedelta64(array)
+    assert nanoseconds.dtype == np.dtype("m8[ns]")
+    assert nanoseconds.view(np.int64).tolist() == [1_500_000_000, 20_000_000]
+
+    minutes = u.io.UnitArray(np.array([1.5, 2.25]), u.minutes)
+    assert u.io.to_timedelta64(minutes, "s").view(np.int64).tolist() == [90, 135]
+
+    with pytest.raises(ValueError):
+        u.io.to_timedelta64(u.io.UnitArray(np.array([1]), u.meters))
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([2**62]),
+        np.array([-(2**62)]),
+        np.array([2**64 - 1], dtype=np.uint64),
+        np.array([2.0**62]),
+        np.array([-(2.0**62)]),
+    ],
+)
+def test_to_timedelta64_overflow(values: np.ndarray):
+    with pytest.raises(OverflowError):
+        u.io.to_timedelta64(u.io.UnitArray(values, u.seconds), "ns")
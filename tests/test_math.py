@@ -1,3 +1,5 @@
+import typing as t
+
 import pytest
 
 import u
@@ -75,3 +77,10 @@ def test_quantity_exponents_after_unit_math(
 )
 def test_quantity_equality_after_unit_math(unit: u.Unit, expected_quantity: type[u.Quantity]):
     assert unit.quantity == expected_quantity
+
+
+def test_unit_math_creates_introspectable_quantities():
+    quantity = (u.kg * u.m / u.s / u.s / u.amperes).quantity
+
+    [quantity_caps] = t.get_args(quantity)
+    assert u.Quantity[quantity_caps] is quantity
@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+import threading
+from decimal import Decimal
+
+import pytest
+
+import u
+
+
+def test_default_mode():
+    assert u.get_numeric_mode() == "decimal"
+
+
+def test_context_manager():
+    with u.numeric_mode("float"):
+        assert u.get_numeric_mode() == "float"
+
+        assert u.km(1.5).to_number(u.meters) == 1500
+        assert u.minutes(0.5) + u.seconds(30) == u.minutes(1)
+        assert str(u.meters(1500.0)) == "1.5 km"
+
+    assert u.get_numeric_mode() == "decimal"
+
+
+def test_str_doesnt_use_decimals_in_float_mode(monkeypatch: pytest.MonkeyPatch):
+    expected = [str(u.meters(1500.0)), str(u.km(0.0025)), f"{u.inches(30.0):m:km}"]
+
+    # Any arithmetic with the Decimal multipliers would now raise a TypeError
+    for unit in u.unit.units_by_symbol.values():
+        monkeypatch.setattr(unit, "multiplier", object())
+
+    with u.numeric_mode("float"):
+        assert [str(u.meters(1500.0)), str(u.km(0.0025)), f"{u.inches(30.0):m:km}"] == expected
+
+
+def test_decimals_stay_exact_in_float_mode():
+    with u.numeric_mode("float"):
+        result = u.km(Decimal("0.1")).to_decimal(u.meters)
+
+    assert result == Decimal("100")
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        u.set_numeric_mode("fast")  # type: ignore
+
+
+def test_mode_is_not_shared_between_threads():
+    modes = []
+
+    with u.numeric_mode("float"):
+        thread = threading.Thread(target=lambda: modes.append(u.get_numeric_mode()))
+        thread.start()
+        thread.join()
+
+    assert modes == ["decimal"]
+
+
+def test_invalid_environment_variable():
+    result = subprocess.run(
+        [sys.executable, "-c", "import u; print(u.get_numeric_mode())"],
+        env={**os.environ, "U_NUMERIC_MODE": "fast"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "decimal"
+    assert "RuntimeWarning" in result.stderr
+
+
+def test_float_multiplier():
+    assert u.km.float_multiplier == 1000.0
+    assert isinstance(u.inches.float_multiplier, float)
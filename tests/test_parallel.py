@@ -0,0 +1,120 @@
+import array
+import concurrent.futures
+import multiprocessing
+
+import typing as t
+
+import pytest
+
+import u
+
+
+@pytest.fixture(autouse=True)
+def restore_registry() -> t.Iterator[None]:
+    # The units created by each test are removed afterwards, so that they can't leak into others
+    units_cache = dict(u.unit.units_cache)
+    units_by_symbol = dict(u.unit.units_by_symbol)
+
+    yield
+
+    u.unit.units_cache.clear()
+    u.unit.units_cache.update(units_cache)
+    u.unit.units_by_symbol.clear()
+    u.unit.units_by_symbol.update(units_by_symbol)
+    u.Unit._from_compound_symbol.cache_clear()
+
+
+def make_gadgetness() -> type[u.Quantity]:
+    class GADGETNESS(u.QUANTITY):
+        pass
+
+    return u.Quantity[GADGETNESS]
+
+
+@pytest.fixture
+def widgets() -> u.Unit:
+    class WIDGETNESS(u.QUANTITY):
+        pass
+
+    return u.Unit(u.Quantity[WIDGETNESS], "wd", 1)
+
+
+@pytest.fixture
+def kilowidgets(widgets: u.Unit) -> u.Unit:
+    return u.Unit(widgets.quantity, "kwd", 1000)
+
+
+# Two different quantities with the same module and qualname
+@pytest.fixture
+def small_gadgets() -> u.Unit:
+    return u.Unit(make_gadgetness(), "sgd", 1)
+
+
+@pytest.fixture
+def large_gadgets() -> u.Unit:
+    return u.Unit(make_gadgetness(), "lgd", 1)
+
+
+def test_map_convert():
+    result = u.parallel.map_convert([1.0, 2.5, 3.0], u.km, u.m, workers=2, chunk_size=2)
+    assert result == array.array("d", [1000, 2500, 3000])
+
+
+def test_map_convert_incompatible():
+    with pytest.raises(ValueError):
+        u.parallel.map_convert([1.0], u.km, u.seconds)
+
+
+def test_parse_many():
+    texts = ["5 km", "300 m", "2 s", "1.5 km"]
+
+    column = u.parallel.parse_many(texts, workers=2, chunk_size=3)
+    assert list(column) == [u.km(5), u.m(300), u.seconds(2), u.km(1.5)]
+    assert column.units == (u.km, u.m, u.seconds)
+
+
+def test_parse_many_to_unit():
+    result = u.parallel.parse_many(["5 km", "300 m"], u.Distance, to=u.m, workers=2, chunk_size=1)
+    assert result == array.array("d", [5000, 300])
+
+
+def test_parse_many_with_custom_units(widgets: u.Unit, kilowidgets: u.Unit):
+    texts = ["5 kwd", "3 wd", "1.5 kwd"]
+
+    column = u.parallel.parse_many(texts, widgets.quantity, workers=2, chunk_size=2)
+    assert list(column) == [kilowidgets(5), widgets(3), kilowidgets(1.5)]
+    assert column.units[0] is kilowidgets
+
+
+def test_parse_many_wrong_quantity():
+    with pytest.raises(ValueError):
+        u.parallel.parse_many(["5 km", "3 s"], u.Distance, workers=1)
+
+
+def test_parse_many_same_named_quantities(small_gadgets: u.Unit, large_gadgets: u.Unit):
+    column = u.parallel.parse_many(["2 lgd"], large_gadgets.quantity, workers=1)
+    assert list(column) == [large_gadgets(2)]
+    assert column.units[0] is large_gadgets
+
+
+def test_reuse_executor(widgets: u.Unit):
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        result = u.parallel.map_convert([1.0, 2.5], u.km, u.m, chunk_size=1, executor=executor)
+        assert result == array.array("d", [1000, 2500])
+
+        # Units created after the pool was started are still known to the workers
+        u.Unit(widgets.quantity, "mwd", 1_000_000)
+        column = u.parallel.parse_many(["1 mwd", "2 wd"], widgets.quantity, executor=executor)
+        assert list(column) == [widgets(1_000_000), widgets(2)]
+
+
+def test_spawned_workers(small_gadgets: u.Unit, large_gadgets: u.Unit):
+    context = multiprocessing.get_context("spawn")
+
+    column: u.QuantityColumn[t.Any]
+
+    with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as executor:
+        column = u.parallel.parse_many(["2 lgd", "3 sgd/s"], executor=executor)
+
+    assert column.units[0] is large_gadgets
+    assert column.units[1] == small_gadgets / u.seconds
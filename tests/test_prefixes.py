@@ -18,3 +18,22 @@ def test_prefix_on_registered_compound_unit():
 def test_prefix_on_compound_unit():
     with pytest.raises(ValueError):
         u.kilo(u.square_meters)
+
+
+@pytest.mark.parametrize(
+    "symbol, expected_result",
+    [
+        ("Gs", u.giga(u.seconds)),
+        ("dam", u.deka(u.meters)),
+        ("µg", u.micro(u.grams)),
+        ("kHz", u.kilo(u.hertz)),
+    ],
+)
+def test_parse_prefixed_unit(symbol: str, expected_result: u.Unit):
+    assert u.Unit.parse(symbol) is expected_result
+
+
+@pytest.mark.parametrize("symbol", ["k", "kx", "xm"])
+def test_parse_unknown_prefixed_unit(symbol: str):
+    with pytest.raises(ValueError):
+        u.Unit.parse(symbol)
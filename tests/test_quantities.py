@@ -1,3 +1,5 @@
+import pytest
+
 import u
 
 
@@ -13,3 +15,68 @@ def test_equality():
 def test_hashing():
     mapping = {u.minutes(60): "foo"}
     assert mapping[u.hours(1)] == "foo"
+
+
+@pytest.mark.parametrize("mode", ["decimal", "float"])
+@pytest.mark.parametrize(
+    "lhs, rhs",
+    [
+        (u.minutes(60), u.hours(1)),
+        (u.inches(1), u.cm(2.54)),
+        (u.feet(1), u.inches(12)),
+        (u.miles(1), u.yards(1760)),
+        (u.km(1.1), u.meters(1100)),
+        (u.milli(u.seconds)(0.1), u.micro(u.seconds)(100)),
+        (u.meters(1 / 7), u.milli(u.meters)(1000 / 7)),
+    ],
+)
+def test_equal_quantities_have_equal_hashes(mode: u.NumericMode, lhs: u.Quantity, rhs: u.Quantity):
+    with u.numeric_mode(mode):
+        assert lhs == rhs
+        assert hash(lhs) == hash(rhs)
+        assert {lhs: "foo"}[rhs] == "foo"
+        assert len({lhs, rhs}) == 1
+
+
+def test_base_unit():
+    assert u.Distance.base_unit is u.meters
+    assert u.Acceleration.base_unit == u.meters / u.seconds**2
+    assert u.Acceleration.base_unit is u.Acceleration.base_unit
+
+
+def test_base_unit_is_updated_when_registering_units():
+    class BASE_UNIT_TEST(u.QUANTITY):
+        pass
+
+    BaseUnitTest = u.Quantity[BASE_UNIT_TEST]
+    Compound = u.Quantity[u.MUL[BASE_UNIT_TEST, u.DURATION]]
+
+    u.Unit(BaseUnitTest, "kbut", 1000)
+    with pytest.raises(ValueError):
+        BaseUnitTest.base_unit
+
+    base = u.Unit(BaseUnitTest, "but", 1)
+    assert BaseUnitTest.base_unit is base
+    assert Compound.base_unit.symbol == "but*s"
+
+
+def test_comparison_across_units():
+    assert u.milli(u.seconds)(1500) < u.seconds(2)
+    assert u.minutes(1) >= u.seconds(60)
+    assert u.km(1) > u.miles(0.5)
+    assert u.meters(0) == 0
+    assert float(u.minutes(2)) == 120
+
+
+def test_comparison_across_units():
+    mm = u.milli(u.meters)
+    value = u.meters(1 / 7)
+    converted = mm(value.to_number(mm))
+
+    assert value == converted
+    assert not value < converted
+    assert value <= converted
+
+    with u.numeric_mode("float"):
+        assert u.minutes(1) == u.seconds(60)
+        assert u.km(1) > u.miles(0.5)
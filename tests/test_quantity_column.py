@@ -0,0 +1,44 @@
+import array
+
+import pytest
+
+import u
+
+
+def test_parse_many():
+    column = u.Distance.parse_many(["5 km", "300 m", "1.2km", "7 m"])
+
+    assert len(column) == 4
+    assert column.units == (u.km, u.m)
+    assert column.unit_at(2) is u.km
+    assert list(column) == [u.km(5), u.m(300), u.km(1.2), u.m(7)]
+    assert column.to_numbers(u.m) == array.array("d", [5000, 300, 1200, 7])
+
+
+def test_parse_many_to_unit():
+    result = u.Distance.parse_many(["5 km", "300 m"], to=u.m)
+    assert result == array.array("d", [5000, 300])
+
+
+def test_parse_many_any_quantity():
+    column = u.Quantity.parse_many(["5 km", "3 s"])
+    assert list(column) == [u.km(5), u.seconds(3)]
+
+    with pytest.raises(ValueError):
+        column.to_numbers(u.m)
+
+
+@pytest.mark.parametrize("text", ["km", "3 s"])
+def test_parse_many_invalid(text: str):
+    with pytest.raises(ValueError):
+        u.Distance.parse_many(["5 km", text])
+
+
+def test_append():
+    column = u.QuantityColumn[u.DURATION]([u.seconds(1)])
+    column.append(u.minutes(2))
+    column.append(u.seconds(3))
+
+    assert column.units == (u.seconds, u.minutes)
+    assert column[1] == u.minutes(2)
+    assert column.to_numbers(u.seconds) == array.array("d", [1, 120, 3])
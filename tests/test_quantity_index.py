@@ -0,0 +1,69 @@
+import pytest
+
+import u
+
+
+def test_iteration_is_sorted(index: u.QuantityIndex[u.DURATION], ms: u.Unit[u.DURATION]):
+    assert list(index) == [ms(1), ms(30), ms(500), u.seconds(2), u.minutes(1)]
+    assert len(index) == 5
+
+
+def test_range(index: u.QuantityIndex[u.DURATION], ms: u.Unit[u.DURATION]):
+    assert index.range(ms(5), u.seconds(1)) == [ms(30), ms(500)]
+    assert index.range(0, ms(30)) == [ms(1), ms(30)]
+    assert index.range(u.hours(1), u.hours(2)) == []
+
+
+def test_count_between(index: u.QuantityIndex[u.DURATION], ms: u.Unit[u.DURATION]):
+    assert index.count_between(ms(5), u.seconds(2)) == 3
+    assert index.count_between(u.seconds(2), ms(5)) == 0
+
+
+def test_nearest(index: u.QuantityIndex[u.DURATION], ms: u.Unit[u.DURATION]):
+    assert index.nearest(ms(20)) == ms(30)
+    assert index.nearest(u.seconds(1)) == ms(500)
+    assert index.nearest(u.hours(1)) == u.minutes(1)
+    assert index.nearest(0) == ms(1)
+
+
+def test_nearest_empty():
+    with pytest.raises(ValueError):
+        u.QuantityIndex().nearest(u.seconds(1))
+
+
+def test_add_and_remove(index: u.QuantityIndex[u.DURATION], ms: u.Unit[u.DURATION]):
+    index.add(ms(100))
+    assert index.range(ms(50), ms(200)) == [ms(100)]
+
+    index.remove(u.seconds(0.1))
+    assert ms(100) not in index
+    assert ms(500) in index
+
+    with pytest.raises(ValueError):
+        index.remove(ms(100))
+
+
+def test_incompatible(index: u.QuantityIndex[u.DURATION]):
+    with pytest.raises(ValueError):
+        index.add(u.meters(1))  # type: ignore
+
+    with pytest.raises(ValueError):
+        index.range(u.meters(1), u.meters(2))  # type: ignore
+
+
+def test_contains_converted_quantity(ms: u.Unit[u.DURATION]):
+    value = u.seconds(1 / 7)
+    index = u.QuantityIndex([value])
+
+    assert ms(value.to_number(ms)) in index
+    assert index.count_between(ms(value.to_number(ms)), u.seconds(1)) == 1
+
+
+def test_quantities_with_the_same_key():
+    # These only differ beyond the rounding of the comparison key
+    one, almost_one = u.seconds(1.0), u.seconds(1.0000000000000002)
+    index = u.QuantityIndex([almost_one, one])
+
+    index.remove(almost_one)
+    assert list(index) == [one]
+    assert almost_one not in index
@@ -0,0 +1,153 @@
+import array
+
+import pytest
+
+import u
+
+
+@pytest.fixture
+def table() -> u.QuantityTable:
+    table = u.QuantityTable({"size": u.megabytes, "duration": u.seconds})
+    table.append({"size": u.gigabytes(3), "duration": u.minutes(1)})
+    table.append({"size": 500, "duration": 0.25})
+    table.append({"size": u.megabytes(20), "duration": u.milli(u.seconds)(100)})
+    return table
+
+
+def test_append(table: u.QuantityTable):
+    assert len(table) == 3
+    assert table.columns == ("size", "duration")
+    assert table.units == {"size": u.megabytes, "duration": u.seconds}
+    assert table["size"].values == array.array("d", [3000, 500, 20])
+    assert table["duration"].values == array.array("d", [60, 0.25, 0.1])
+
+
+def test_append_invalid_row(table: u.QuantityTable):
+    with pytest.raises(ValueError):
+        table.append({"size": u.megabytes(1)})
+
+    with pytest.raises(ValueError):
+        table.append({"size": u.megabytes(1), "duration": u.meters(3)})
+
+    # Nothing was appended
+    assert len(table) == 3
+    assert len(table["size"]) == 3
+
+
+def test_rows(table: u.QuantityTable):
+    rows = list(table)
+
+    assert dict(rows[0]) == {"size": u.megabytes(3000), "duration": u.seconds(60)}
+    assert rows[1]["size"] == u.megabytes(500)
+    assert table.row(-1)["duration"] == u.seconds(0.1)
+
+    with pytest.raises(IndexError):
+        table.row(3)
+
+
+def test_from_rows():
+    table = u.QuantityTable.from_rows(
+        [
+            {"latency": u.milli(u.seconds)(30), "distance": u.km(3)},
+            {"latency": u.seconds(1), "distance": 5},
+        ],
+        {"distance": u.meters},
+    )
+
+    assert table.units == {"distance": u.meters, "latency": u.milli(u.seconds)}
+    assert table["latency"].values == array.array("d", [30, 1000])
+    assert table["distance"].values == array.array("d", [3000, 5])
+
+
+def test_from_rows_missing_unit():
+    with pytest.raises(ValueError):
+        u.QuantityTable.from_rows([{"latency": 30}])
+
+
+def test_to(table: u.QuantityTable):
+    converted = table.to(size=u.gigabytes, duration=u.milli(u.seconds))
+
+    assert converted.units == {"size": u.gigabytes, "duration": u.milli(u.seconds)}
+    assert converted["size"].values == array.array("d", [3, 0.5, 0.02])
+    assert list(converted["duration"]) == list(table["duration"])
+
+    # The original table is unchanged
+    assert table.units == {"size": u.megabytes, "duration": u.seconds}
+
+    with pytest.raises(ValueError):
+        table.to(size=u.seconds)
+
+    with pytest.raises(ValueError):
+        table.to(latency=u.seconds)
+
+
+def test_filter(table: u.QuantityTable):
+    filtered = table[table["duration"] < u.seconds(1)]
+
+    assert len(filtered) == 2
+    assert list(filtered["size"]) == [u.megabytes(500), u.megabytes(20)]
+
+    assert len(table.filter([False, False, False])) == 0
+
+    with pytest.raises(ValueError):
+        table.filter([True])
+
+
+def test_derived_column(table: u.QuantityTable):
+    table["bandwidth"] = table["size"] / table["duration"]
+
+    assert table["bandwidth"].unit == u.megabytes_per_second
+    assert table["bandwidth"].values == array.array("d", [50, 2000, 200])
+    assert [str(row["bandwidth"]) for row in table] == ["50 MB/s", "2 GB/s", "200 MB/s"]
+
+    with pytest.raises(ValueError):
+        table["too_short"] = u.TableColumn([1], u.meters)
+
+    del table["bandwidth"]
+    assert table.columns == ("size", "duration")
+
+
+def test_columns_are_copied(table: u.QuantityTable):
+    table["size_copy"] = table["size"]
+    table.append({"size": 1, "duration": 2, "size_copy": 3})
+
+    assert len(table["size"]) == len(table["duration"]) == len(table["size_copy"]) == 4
+    assert table["size"].values[-1] == 1
+    assert table["size_copy"].values[-1] == 3
+
+    values = array.array("i", [1, 2])
+    column = u.TableColumn(values, u.meters)
+    column.append(u.meters(0.5))
+
+    assert values == array.array("i", [1, 2])
+    assert column.values == array.array("d", [1, 2, 0.5])
+
+
+def test_column_arithmetic():
+    a = u.TableColumn([1, 2], u.km)
+    b = u.TableColumn([500, 1000], u.m)
+
+    assert list(a + b) == [u.km(1.5), u.km(3)]
+    assert list(a - b) == [u.km(0.5), u.km(1)]
+    assert list(a * 2) == [u.km(2), u.km(4)]
+    assert list(a / 2) == [u.km(0.5), u.km(1)]
+    assert list(a * b) == [u.km(1) * u.m(500), u.km(2) * u.m(1000)]
+    assert (a > b) == [True, True]
+    assert (a <= u.m(1500)) == [True, False]
+
+    with pytest.raises(ValueError):
+        a + u.TableColumn([1, 2], u.seconds)
+
+    with pytest.raises(ValueError):
+        a * u.TableColumn([1], u.seconds)
+
+
+def test_column_from_quantities():
+    column = u.TableColumn.from_quantities([u.km(1), u.m(500)])
+
+    assert column.unit is u.km
+    assert column.values == array.array("d", [1, 0.5])
+    assert column.to(u.m).values == array.array("d", [1000, 500])
+
+    with pytest.raises(ValueError):
+        u.TableColumn.from_quantities([])
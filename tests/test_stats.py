@@ -0,0 +1,56 @@
+import pytest
+
+import u
+
+np = pytest.importorskip("numpy")
+
+
+def test_array_with_unit(ms: u.Unit[u.DURATION]):
+    values = np.array([1.0, 2.0, 3.0, 4.0])
+
+    assert u.stats.mean(values, ms) == ms(2.5)
+    assert u.stats.median(values, ms) == ms(2.5)
+    assert u.stats.min(values, ms) == ms(1)
+    assert u.stats.max(values, ms) == ms(4)
+    assert repr(u.stats.max(values, ms)) == "4.0 ms"
+
+
+def test_array_without_unit():
+    with pytest.raises(TypeError):
+        u.stats.mean(np.array([1.0]))
+
+
+def test_quantities(ms: u.Unit[u.DURATION]):
+    values = [u.seconds(1), ms(500), u.seconds(2)]
+
+    assert u.stats.mean(values) == u.seconds(3.5 / 3)
+    assert u.stats.median(iter(values)) == u.seconds(1)
+    assert repr(u.stats.min(values, ms)) == "500.0 ms"
+
+
+def test_incompatible_quantities():
+    with pytest.raises(ValueError):
+        u.stats.mean([u.seconds(1), u.meters(1)])  # type: ignore
+
+
+def test_std_and_var():
+    values = np.array([2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0])
+
+    assert u.stats.std(values, u.meters) == u.meters(2)
+    assert u.stats.var(values, u.meters) == u.square_meters(4)
+
+
+def test_percentile():
+    values = np.arange(101, dtype=float)
+
+    assert u.stats.percentile(values, u.meters, q=90) == u.meters(90)
+    assert u.stats.percentile(values, u.meters, q=[10, 50]) == [u.meters(10), u.meters(50)]
+
+
+def test_histogram(ms: u.Unit[u.DURATION]):
+    values = np.array([0.5, 2.0, 3.0, 1500.0])
+
+    counts, edges = u.stats.histogram(values, ms, bins=[ms(0), ms(1), u.seconds(1), u.seconds(2)])
+
+    assert list(counts) == [1, 2, 1]
+    assert edges == [ms(0), ms(1), u.seconds(1), u.seconds(2)]
@@ -0,0 +1,52 @@
+import pytest
+
+import u
+
+
+def test_parse():
+    lines = ["5 km\n", "\n", "300 m\n", "  1.5km  \n"]
+
+    assert list(u.stream.parse(lines)) == [u.km(5), u.m(300), u.km(1.5)]
+
+
+def test_parse_with_quantity():
+    with pytest.raises(ValueError):
+        list(u.stream.parse(["5 km", "3 s"], u.Distance))
+
+
+def test_parse_is_lazy():
+    def lines():
+        yield "1 s"
+        raise AssertionError("Read too far")
+
+    assert next(u.stream.parse(lines())) == u.seconds(1)
+
+
+def test_convert():
+    result = list(u.stream.convert([u.km(5), u.m(300)], u.m))
+
+    assert [repr(quantity) for quantity in result] == ["5000.0 m", "300.0 m"]
+
+
+def test_to_numbers():
+    quantities = [u.minutes(1), u.seconds(30), u.hours(1)]
+
+    assert list(u.stream.to_numbers(quantities, u.seconds)) == [60, 30, 3600]
+
+
+def test_to_numbers_incompatible():
+    with pytest.raises(ValueError):
+        list(u.stream.to_numbers([u.seconds(1), u.meters(1)], u.seconds))  # type: ignore
+
+
+def test_filter_compatible():
+    quantities = [u.seconds(1), u.meters(1), u.minutes(1), u.km(1)]
+
+    assert list(u.stream.filter_compatible(quantities, u.Distance)) == [u.meters(1), u.km(1)]
+
+
+def test_pipeline():
+    lines = ["1 min", "2 km", "30 s"]
+
+    durations = u.stream.filter_compatible(u.stream.parse(lines), u.Duration)
+    assert list(u.stream.to_numbers(durations, u.seconds)) == [60, 30]
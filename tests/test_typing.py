@@ -56,6 +56,8 @@ def test_is_compatible_with():
         "charge: u.ElectricCharge = u.amperes(2) * u.sec(3)",
         "freq: u.Frequency = 1 / u.sec(4)",
         "u.megabytes(5) == u.mega(u.bytes)(5)",
+        "unit: u.Unit[u.DURATION] = u.Duration.base_unit",
+        "units: typing.Sequence[u.Unit[u.DISTANCE]] = u.Distance.units",
         """
 class TASTINESS(u.QUANTITY):
     pass
@@ -15,3 +15,19 @@ def test_unit_math_gives_predefined_units():
     assert 1 / u.seconds == u.hertz
     assert u.mega(1 / u.seconds) == u.megahertz
     assert repr((1 / u.seconds)(5)) == "5 Hz"
+
+
+def test_power():
+    assert u.m**2 == u.m * u.m
+    assert u.km**3 == u.km * u.km * u.km
+    assert u.s**-2 == u.one / u.s / u.s
+    assert (u.m / u.s) ** 2 == (u.m / u.s) * (u.m / u.s)
+    assert u.s**-1 is u.hertz
+    assert u.m**0 is u.one
+    assert u.m**1 is u.m
+
+
+def test_power_symbol():
+    assert (u.km**3).symbol == "km³"
+    assert (u.m**-1).symbol == "m⁻¹"
+    assert ((u.m / u.s) ** 2).symbol == "m²/s²"
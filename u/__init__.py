@@ -1,9 +1,18 @@
 __version__ = "4.0"
 
+from .maths import *
 from .prefixes import *
 from .quantity import *
 from .capital_quantities import *
 from .unit import *
+from .aggregation import *
+from .quantity_index import *
+from .quantity_column import *
+from .quantity_table import *
+from .histogram import *
+from .checking import *
+from .decomposition import *
+from . import aio, csv, io, parallel, stats, stream
 
 # This needs to be last to avoid circular import errors
 from .quantities import *
@@ -10,7 +10,7 @@ import typing as t
 
 import u
 
-from .maths import FloatOrDecimal
+from .maths import Number
 
 
 C = t.TypeVar("C", bound=t.Callable)
@@ -26,8 +26,28 @@ def is_union(obj: object) -> bool:
     return t.get_origin(obj) in UNION_TYPES
 
 
+# The caches of all `@cached` functions, by qualified function name. Used by the benchmarks to keep
+# an eye on memory usage.
+caches = dict[str, dict]()
+
+
+def import_numpy(module_name: str) -> types.ModuleType:
+    """
+    Imports numpy, which is an optional dependency. Raises an `ImportError` that mentions the
+    `numpy` extra if it isn't installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            f"`{module_name}` requires numpy. Install it with `pip install u[numpy]`."
+        ) from None
+
+    return numpy
+
+
 def cached(func: C) -> C:
-    cache = {}
+    cache = caches[f"{func.__module__}.{func.__qualname__}"] = {}
 
     @functools.wraps(func)
     def wrapper(*args):
@@ -42,27 +62,137 @@ def cached(func: C) -> C:
     return wrapper  # type: ignore
 
 
-SYMBOL_REGEX = re.compile(r"(^|[*/])([^*/]+?)([⁻⁺⁰¹²³⁴⁵⁶⁷⁸⁹]*)\s*(?=[*/]|$)")
+SUPERSCRIPT_DIGITS = "⁰¹²³⁴⁵⁶⁷⁸⁹"
+
+# Everything that isn't whitespace, an operator, a parenthesis or an exponent is part of a symbol.
+# Symbols may contain spaces (like "fl oz"), but not at the start or end.
+_SYMBOL_CHAR = rf"[^\s*/^()⁻⁺{SUPERSCRIPT_DIGITS}]"
+
+SYMBOL_TOKEN_REGEX = re.compile(
+    rf"""\s*(?:
+        (?:\*\*|\^)\s*(?P<exponent>[+-]?[0-9]+)
+        |(?P<superscript>[⁻⁺]?[{SUPERSCRIPT_DIGITS}]+)
+        |(?P<operator>[*/])
+        |(?P<open>\()
+        |(?P<close>\))
+        |(?P<symbol>{_SYMBOL_CHAR}+(?:\s+{_SYMBOL_CHAR}+)*)
+    )""",
+    re.VERBOSE,
+)
+
+# Symbols without parentheses or ASCII exponents (like "kg*m/s²") are by far the most common, so
+# they're parsed with a single regex. If anything ends up in the `invalid` group, the symbol is
+# tokenized with `SYMBOL_TOKEN_REGEX` instead.
+SIMPLE_TERM_REGEX = re.compile(
+    rf"""(?P<operator>[*/]?)\x20*
+        (?P<symbol>{_SYMBOL_CHAR}+(?:\x20+{_SYMBOL_CHAR}+)*)
+        (?P<exponent>[⁻⁺]?[{SUPERSCRIPT_DIGITS}]*)\x20*
+        |(?P<invalid>.)""",
+    re.VERBOSE | re.DOTALL,
+)
 
 
 def parse_symbol(symbol: str) -> t.Counter[str]:
     """
-    Parses a symbol into a Counter of exponents.
+    Parses a symbol into a Counter of exponents. Exponents can be written as superscripts or with
+    `^` or `**`, and parentheses can be used for grouping.
 
     ```
     >>> parse_symbol('1/s²')
     Counter({'1': 1, 's': -2})
+    >>> parse_symbol('kg/(m*s^2)')
+    Counter({'kg': 1, 'm': -1, 's': -2})
     ```
+
+    Raises a `ValueError` if the symbol is malformed.
     """
-    result = collections.Counter()
+    text = symbol.strip()
 
-    for op, sym, power in SYMBOL_REGEX.findall(symbol):
-        multiplier = -1 if op == "/" else 1
-        result[sym.strip()] += multiplier * parse_exponent(power)
+    result: t.Counter[str] = collections.Counter()
+
+    for operator, sym, power, invalid in SIMPLE_TERM_REGEX.findall(text):
+        # Every term except for the first one must be preceded by an operator
+        if invalid or (not operator) is bool(result):
+            break
+
+        result[sym] += (-1 if operator == "/" else 1) * parse_exponent(power)
+    else:
+        return result
+
+    result.clear()
+
+    # When a parenthesis is opened, the enclosing result and the sign of the group are saved here
+    stack = list[tuple[t.Counter[str], int]]()
+
+    # The most recent symbol or group, which hasn't been added to the result yet because it may
+    # still be followed by an exponent
+    term: t.Mapping[str, int] | None = None
+    sign = 1
+    exponent: int | None = None
+
+    pos = 0
+    while pos < len(text):
+        match = SYMBOL_TOKEN_REGEX.match(text, pos)
+        if match is None:
+            raise ValueError(f"Invalid symbol {symbol!r}")
+
+        pos = match.end()
+        kind = match.lastgroup
+        if kind is None:
+            raise ValueError(f"Invalid symbol {symbol!r}")
+
+        if kind == "symbol" or kind == "open":
+            if term is not None:
+                raise ValueError(f"Missing operator in symbol {symbol!r}")
+
+            if kind == "symbol":
+                term = {match["symbol"]: 1}
+            else:
+                stack.append((result, sign))
+                result = collections.Counter()
+                sign = 1
+        elif kind == "exponent" or kind == "superscript":
+            if term is None or exponent is not None:
+                raise ValueError(f"Misplaced exponent in symbol {symbol!r}")
+
+            if kind == "exponent":
+                exponent = int(match["exponent"])
+            else:
+                exponent = parse_exponent(match["superscript"])
+        else:
+            if term is None:
+                raise ValueError(f"Misplaced {match[kind]!r} in symbol {symbol!r}")
+
+            _add_powers(result, term, sign * (1 if exponent is None else exponent))
+            exponent = None
+
+            if kind == "operator":
+                term = None
+                sign = -1 if match["operator"] == "/" else 1
+            else:
+                if not stack:
+                    raise ValueError(f"Unbalanced parentheses in symbol {symbol!r}")
+
+                term = result
+                result, sign = stack.pop()
+
+    if stack:
+        raise ValueError(f"Unbalanced parentheses in symbol {symbol!r}")
+
+    if term is None:
+        if text:
+            raise ValueError(f"Symbol {symbol!r} ends with an operator")
+    else:
+        _add_powers(result, term, sign * (1 if exponent is None else exponent))
 
     return result
 
 
+def _add_powers(result: t.Counter[str], powers: t.Mapping[str, int], exponent: int) -> None:
+    for symbol, power in powers.items():
+        result[symbol] += power * exponent
+
+
 POW_TO_NUM = str.maketrans("⁻⁺⁰¹²³⁴⁵⁶⁷⁸⁹", "-+0123456789")
 NUM_TO_POW = {value: key for key, value in POW_TO_NUM.items()}
 
@@ -89,21 +219,46 @@ def join_symbols(symbol1: str, symbol2: str, operator: str) -> str:
         powers2 = {symbol: -exponent for symbol, exponent in powers2.items()}
 
     powers1.update(powers2)
-    powers1.pop("1", None)
+    return format_symbol(powers1)
+
+
+def power_symbol(symbol: str, exponent: int) -> str:
+    """
+    Raises a symbol to the given power.
+
+    ```
+    >>> power_symbol('m/s', 2)
+    'm²/s²'
+    >>> power_symbol('s', -1)
+    's⁻¹'
+    ```
+    """
+    powers = parse_symbol(symbol)
+    powers.pop("1", None)
+
+    if len(powers) == 1:
+        [(sym, exp)] = powers.items()
+        return f"{sym}{str_exponent(exp * exponent)}"
+
+    return format_symbol({sym: exp * exponent for sym, exp in powers.items()})
+
+
+def format_symbol(powers: t.MutableMapping[str, int]) -> str:
+    powers.pop("1", None)
 
     # Find the first symbol with a positive exponent
     segments = []
 
-    for symbol, exponent in powers1.items():
+    for symbol, exponent in powers.items():
         if exponent > 0:
-            del powers1[symbol]
+            del powers[symbol]
             segments.append(f"{symbol}{str_exponent(exponent)}")
             break
     else:
         segments.append("1")
 
     # Add the remaining symbols
-    for symbol, exponent in powers1.items():
+    for symbol, exponent in powers.items():
         segments += [
             "*" if exponent > 0 else "/",
             symbol,
@@ -120,6 +275,10 @@ class ExponentDict(collections.abc.Mapping[type["u.QUANTITY"], int]):
         # 2. If it's a defaultdict, we don't have to worry about accidentally mutating it
         self._exponents = dict(exponents)
 
+        # Units and quantities are hashed all the time (they're used as keys in many caches), so
+        # it's worth precomputing this
+        self._hash = hash(tuple(self._exponents.items()))
+
     def __getitem__(self, quantity: type[u.QUANTITY]) -> int:
         return self._exponents.get(quantity, 0)
 
@@ -130,7 +289,7 @@ class ExponentDict(collections.abc.Mapping[type["u.QUANTITY"], int]):
         return len(self._exponents)
 
     def __hash__(self) -> int:
-        return hash(tuple(self.items()))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, __class__):
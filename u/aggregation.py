@@ -0,0 +1,221 @@
+"""
+Functions that reduce an iterable of quantities to a single quantity. Unlike the builtin `sum`,
+`min` and `max`, these don't convert every single element to a common unit. Instead, the values are
+grouped by their unit, and each group is converted only once.
+"""
+
+from __future__ import annotations
+
+import decimal
+import fractions
+import math
+import statistics
+import typing as t
+
+import u
+
+from .capital_quantities import QUANTITY
+from .maths import Number, convert, divide
+from .quantity import find_most_suitable_unit
+
+
+__all__ = ["fsum", "mean", "minimum", "maximum", "common_unit"]
+
+
+Q = t.TypeVar("Q", bound=QUANTITY)
+
+
+def fsum(
+    quantities: t.Iterable[u.Quantity[Q]], /, unit: u.Unit[Q] | None = None
+) -> u.Quantity[Q]:
+    """
+    Adds up all the given quantities. The result is exact for Decimals and Fractions, and for floats
+    it's as accurate as `math.fsum`.
+
+    ```python
+    >>> u.fsum([u.seconds(30), u.minutes(1), u.seconds(30)])
+    120 s
+    ```
+
+    The result uses the unit of the first quantity, unless a `unit` is passed. If the iterable is
+    empty, a `unit` is required.
+    """
+    groups = _group_by_unit(quantities)
+    unit = _result_unit(groups, unit)
+
+    return u.Quantity(_sum_groups(groups, unit), unit)
+
+
+def mean(
+    quantities: t.Iterable[u.Quantity[Q]], /, unit: u.Unit[Q] | None = None
+) -> u.Quantity[Q]:
+    """
+    Calculates the arithmetic mean of the given quantities.
+
+    ```python
+    >>> u.mean([u.seconds(30), u.minutes(1)])
+    45 s
+    ```
+
+    The result uses the unit of the first quantity, unless a `unit` is passed. Raises a
+    `ValueError` if the iterable is empty.
+    """
+    groups = _group_by_unit(quantities)
+    if not groups:
+        raise ValueError("Cannot calculate the mean of an empty iterable")
+
+    unit = _result_unit(groups, unit)
+    count = sum(len(values) for values in groups.values())
+
+    return u.Quantity(divide(_sum_groups(groups, unit), count), unit)
+
+
+def minimum(quantities: t.Iterable[u.Quantity[Q]], /) -> u.Quantity[Q]:
+    """
+    Returns the smallest of the given quantities. Raises a `ValueError` if the iterable is empty.
+
+    (This function can't be called `min`, because that's the name of a unit.)
+    """
+    return min(_extremes_by_unit(quantities, min, "minimum"))
+
+
+def maximum(quantities: t.Iterable[u.Quantity[Q]], /) -> u.Quantity[Q]:
+    """
+    Returns the largest of the given quantities. Raises a `ValueError` if the iterable is empty.
+    """
+    return max(_extremes_by_unit(quantities, max, "maximum"))
+
+
+def common_unit(
+    quantities: t.Iterable[u.Quantity[Q]],
+    /,
+    *,
+    systems: t.Iterable[str] | None = None,
+    by: t.Literal["median", "max"] = "median",
+) -> u.Unit[Q]:
+    """
+    Picks a single human-readable unit for a collection of quantities, for example for the axis of
+    a chart or a column of a table.
+
+    ```python
+    >>> u.common_unit([u.meters(500), u.kilometers(3), u.kilometers(30)])
+    Unit(Quantity[DISTANCE], 'km', Decimal('1000'))
+    ```
+
+    The unit is chosen the same way as in `str(quantity)`, but based on a representative magnitude
+    of all quantities: either the `"median"` or the `"max"` of their absolute values. The
+    representative is converted to the base unit only once per quantity, using the cached base
+    value.
+
+    If no `systems` are given, the unit systems of the first quantity's unit are used. Raises a
+    `ValueError` if the iterable is empty or contains incompatible quantities.
+
+    Added in version 4.1.
+    """
+    magnitudes = list[float]()
+    first: u.Quantity[Q] | None = None
+
+    for quantity in quantities:
+        if first is None:
+            first = quantity
+        elif quantity.quantity is not first.quantity and not quantity.is_compatible_with(first):
+            raise ValueError(f"Cannot combine {first} (a {first.quantity}) with {quantity}")
+
+        magnitudes.append(abs(float(quantity)))
+
+    if first is None:
+        raise ValueError("Cannot find a common unit for an empty iterable")
+
+    if by == "median":
+        magnitude = statistics.median(magnitudes)
+    elif by == "max":
+        magnitude = max(magnitudes)
+    else:
+        raise ValueError(f"Invalid value for `by`: {by!r}")
+
+    quantity_type = first._unit.quantity
+    if magnitude == 0:
+        return quantity_type.base_unit
+
+    systems = first._unit.systems if systems is None else frozenset(systems)
+    _, unit = find_most_suitable_unit(magnitude, quantity_type, systems)
+    return unit
+
+
+def _group_by_unit(quantities: t.Iterable[u.Quantity]) -> dict[u.Unit, list[Number]]:
+    groups = dict[u.Unit, list[Number]]()
+
+    for quantity in quantities:
+        try:
+            groups[quantity._unit].append(quantity._value)
+        except KeyError:
+            groups[quantity._unit] = [quantity._value]
+
+    return groups
+
+
+def _result_unit(groups: t.Mapping[u.Unit, t.Any], unit: u.Unit | None) -> u.Unit:
+    if unit is not None:
+        return unit
+
+    try:
+        return next(iter(groups))
+    except StopIteration:
+        raise ValueError("A `unit` is required if the iterable is empty") from None
+
+
+def _sum_groups(groups: t.Mapping[u.Unit, t.Sequence[Number]], unit: u.Unit):
+    totals = [
+        u.Quantity(_sum_numbers(values), group_unit)._to_number(unit)
+        for group_unit, values in groups.items()
+    ]
+
+    return _sum_numbers(totals)
+
+
+def _sum_numbers(numbers: t.Sequence[Number]) -> Number:
+    # Converting a float or Decimal to a Fraction, or a float to a Decimal, is lossless, so these
+    # sums are exact
+    if any(isinstance(number, fractions.Fraction) for number in numbers):
+        values = (convert(number, fractions.Fraction) for number in numbers)
+        return sum(values, fractions.Fraction(0))
+
+    if any(isinstance(number, decimal.Decimal) for number in numbers):
+        return sum((convert(number, decimal.Decimal) for number in numbers), decimal.Decimal(0))
+
+    if all(isinstance(number, int) for number in numbers):
+        return sum(numbers)
+
+    return math.fsum(numbers)
+
+
+def _extremes_by_unit(
+    quantities: t.Iterable[u.Quantity[Q]],
+    func: t.Callable[..., t.Any],
+    name: str,
+) -> list[u.Quantity[Q]]:
+    groups = dict[u.Unit, list[u.Quantity[Q]]]()
+
+    for quantity in quantities:
+        try:
+            groups[quantity._unit].append(quantity)
+        except KeyError:
+            groups[quantity._unit] = [quantity]
+
+    if not groups:
+        raise ValueError(f"Cannot calculate the {name} of an empty iterable")
+
+    # Within a group, the raw values can be compared directly. Only the winners of each group have
+    # to be compared in a unit-aware way.
+    extremes = [func(group, key=_get_value) for group in groups.values()]
+
+    first = extremes[0]
+    for quantity in extremes[1:]:
+        if not quantity.is_compatible_with(first):
+            raise ValueError(f"Cannot compare {first} (a {first.quantity}) to {quantity}")
+
+    return extremes
+
+
+def _get_value(quantity: u.Quantity) -> Number:
+    return quantity._value
@@ -0,0 +1,327 @@
+"""
+Async versions of the `u.stream` building blocks, for use in asyncio applications. They consume
+async iterables of strings (or bytes, like the lines of an `asyncio.StreamReader`) and quantities:
+
+```python
+async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    async for latency in u.aio.convert(reader, u.seconds):
+        ...
+```
+
+The items are processed in batches of at most `batch_size`. A batch is processed as soon as it's
+full, or as soon as the input has no more items ready, so items that trickle in slowly aren't held
+back. After each batch, control is returned to the event loop, so parsing many lines doesn't starve
+other tasks.
+
+If an `executor` is passed, the strings of each batch are split into numbers and unit symbols in
+that executor. The units are still looked up and the `Quantity` objects are still created in the
+event loop. Because of the GIL, this only pays off with a `concurrent.futures.ProcessPoolExecutor`
+and large batches, where the executor takes most of the regex work off the event loop. Only the
+strings and the split numbers are sent to the executor.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import typing as t
+
+import u
+
+from .capital_quantities import QUANTITY
+from .maths import Number
+from .quantity import split_number_and_unit
+
+
+__all__ = ["parse", "convert", "fsum", "mean", "minimum", "maximum"]
+
+
+Q = t.TypeVar("Q", bound=QUANTITY)
+
+Item = t.Union[str, bytes, "u.Quantity"]
+
+
+@t.overload
+def parse(
+    items: t.AsyncIterable[Item],
+    /,
+    *,
+    batch_size: int = ...,
+    executor: concurrent.futures.Executor | None = ...,
+) -> t.AsyncIterator[u.Quantity]: ...
+
+
+@t.overload
+def parse(
+    items: t.AsyncIterable[Item],
+    quantity: type[u.Quantity[Q]],
+    /,
+    *,
+    batch_size: int = ...,
+    executor: concurrent.futures.Executor | None = ...,
+) -> t.AsyncIterator[u.Quantity[Q]]: ...
+
+
+async def parse(
+    items: t.AsyncIterable[Item],
+    quantity: type[u.Quantity] = u.Quantity,
+    /,
+    *,
+    batch_size: int = 1000,
+    executor: concurrent.futures.Executor | None = None,
+) -> t.AsyncIterator[u.Quantity]:
+    """
+    Like `u.stream.parse`. Quantities are passed through unchanged (but are still checked against
+    the `quantity`), and bytes are decoded as UTF-8.
+
+    Added in version 4.1.
+    """
+    async for batch in _parse_batches(items, quantity, batch_size, executor):
+        for quantity_ in batch:
+            yield quantity_
+
+
+async def convert(
+    items: t.AsyncIterable[Item],
+    to: u.Unit[Q],
+    /,
+    *,
+    batch_size: int = 1000,
+    executor: concurrent.futures.Executor | None = None,
+) -> t.AsyncIterator[u.Quantity[Q]]:
+    """
+    Like `u.stream.convert`, but strings are parsed first.
+
+    Added in version 4.1.
+    """
+    async for batch in _parse_batches(items, u.Quantity, batch_size, executor):
+        for number in u.stream.to_numbers(batch, to):
+            yield u.Quantity(number, to)
+
+
+async def fsum(
+    items: t.AsyncIterable[Item],
+    unit: u.Unit[Q] | None = None,
+    /,
+    *,
+    batch_size: int = 1000,
+    executor: concurrent.futures.Executor | None = None,
+) -> u.Quantity[Q]:
+    """
+    Like `u.fsum`. Each batch is summed separately, and then the partial sums are added up.
+
+    Added in version 4.1.
+    """
+    partial_sums = list[u.Quantity[Q]]()
+
+    async for batch in _parse_batches(items, u.Quantity, batch_size, executor):
+        if unit is None:
+            unit = batch[0]._unit
+
+        partial_sums.append(u.fsum(batch, unit))
+
+    return u.fsum(partial_sums, unit)
+
+
+async def mean(
+    items: t.AsyncIterable[Item],
+    unit: u.Unit[Q] | None = None,
+    /,
+    *,
+    batch_size: int = 1000,
+    executor: concurrent.futures.Executor | None = None,
+) -> u.Quantity[Q]:
+    """
+    Like `u.mean`.
+
+    Added in version 4.1.
+    """
+    partial_sums = list[u.Quantity[Q]]()
+    count = 0
+
+    async for batch in _parse_batches(items, u.Quantity, batch_size, executor):
+        if unit is None:
+            unit = batch[0]._unit
+
+        partial_sums.append(u.fsum(batch, unit))
+        count += len(batch)
+
+    if not count:
+        raise ValueError("Cannot calculate the mean of an empty iterable")
+
+    return u.fsum(partial_sums, unit) / count
+
+
+async def minimum(
+    items: t.AsyncIterable[Item],
+    /,
+    *,
+    batch_size: int = 1000,
+    executor: concurrent.futures.Executor | None = None,
+) -> u.Quantity:
+    """
+    Like `u.minimum`.
+
+    Added in version 4.1.
+    """
+    minimums = [
+        u.minimum(batch)
+        async for batch in _parse_batches(items, u.Quantity, batch_size, executor)
+    ]
+    return u.minimum(minimums)
+
+
+async def maximum(
+    items: t.AsyncIterable[Item],
+    /,
+    *,
+    batch_size: int = 1000,
+    executor: concurrent.futures.Executor | None = None,
+) -> u.Quantity:
+    """
+    Like `u.maximum`.
+
+    Added in version 4.1.
+    """
+    maximums = [
+        u.maximum(batch)
+        async for batch in _parse_batches(items, u.Quantity, batch_size, executor)
+    ]
+    return u.maximum(maximums)
+
+
+async def _parse_batches(
+    items: t.AsyncIterable[Item],
+    quantity: type[u.Quantity],
+    batch_size: int,
+    executor: concurrent.futures.Executor | None,
+) -> t.AsyncIterator[list[u.Quantity]]:
+    if batch_size < 1:
+        raise ValueError(f"The batch_size must be at least 1, not {batch_size}")
+
+    loop = asyncio.get_running_loop()
+    units = dict[str, u.Unit]()
+
+    async for batch in _batches(items, batch_size):
+        texts = [item for item in batch if not isinstance(item, u.Quantity)]
+
+        if executor is None:
+            split_texts = _split_texts(texts)
+        else:
+            split_texts = await loop.run_in_executor(executor, _split_texts, texts)
+
+        split_texts_iter = iter(split_texts)
+        quantities = list[u.Quantity]()
+
+        for item in batch:
+            if isinstance(item, u.Quantity):
+                if quantity is not u.Quantity and not quantity.typecheck(item):
+                    raise ValueError(f"Expected a {quantity!r}, not {item!r}")
+
+                quantities.append(item)
+                continue
+
+            split_text = next(split_texts_iter)
+            if split_text is None:
+                continue
+
+            number, unit_str = split_text
+
+            try:
+                unit = units[unit_str]
+            except KeyError:
+                try:
+                    unit = units[unit_str] = u.Unit.parse(unit_str, quantity)
+                except ValueError as e:
+                    raise ValueError(f"Cannot parse {item!r} as a {quantity!r}") from e
+
+            quantities.append(u.Quantity(number, unit))
+
+        if quantities:
+            yield quantities
+
+        if executor is None:
+            # Give other tasks a chance to run
+            await asyncio.sleep(0)
+
+
+class _ItemBuffer:
+    """
+    Collects the items of an async iterable in a separate task, so that the items which are ready
+    can be taken as a batch without waiting for the source to produce more.
+    """
+
+    def __init__(self, items: t.AsyncIterable[Item], batch_size: int):
+        self._items = list[Item]()
+        self._batch_size = batch_size
+        self._done = False
+        self._error: Exception | None = None
+
+        # Set when there are items (or the source is exhausted), and when there's room for more
+        self._ready = asyncio.Event()
+        self._has_room = asyncio.Event()
+        self._has_room.set()
+
+        self._reader = asyncio.create_task(self._read(items))
+
+    async def take(self) -> list[Item]:
+        """
+        Returns the items that are ready, waiting for at least one if necessary. Returns an empty
+        list once the source is exhausted.
+        """
+        await self._ready.wait()
+
+        items = self._items
+        self._items = []
+
+        if not self._done:
+            self._ready.clear()
+        elif self._error is not None and not items:
+            raise self._error
+
+        self._has_room.set()
+        return items
+
+    def close(self) -> None:
+        self._reader.cancel()
+
+    async def _read(self, items: t.AsyncIterable[Item]) -> None:
+        try:
+            async for item in items:
+                self._items.append(item)
+                self._ready.set()
+
+                if len(self._items) >= self._batch_size:
+                    self._has_room.clear()
+                    await self._has_room.wait()
+        except Exception as error:
+            self._error = error
+
+        self._done = True
+        self._ready.set()
+
+
+async def _batches(items: t.AsyncIterable[Item], batch_size: int) -> t.AsyncIterator[list[Item]]:
+    # If the source doesn't have another item ready, the current batch is yielded right away instead
+    # of waiting for it to fill up
+    buffer = _ItemBuffer(items, batch_size)
+
+    try:
+        while batch := await buffer.take():
+            yield batch
+    finally:
+        buffer.close()
+
+
+# This runs in the executor, so it must be picklable and must only deal with picklable objects
+def _split_texts(texts: t.Sequence[str | bytes]) -> list[tuple[int | Number, str] | None]:
+    result = list[t.Optional[tuple[t.Union[int, Number], str]]]()
+
+    for text in texts:
+        if isinstance(text, bytes):
+            text = text.decode("utf-8")
+
+        text = text.strip()
+        result.append(split_number_and_unit(text) if text else None)
+
+    return result
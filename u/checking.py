@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import typing as t
+
+import u
+
+from ._utils import is_union
+from .quantity import QuantityAlias
+
+
+__all__ = ["checked", "set_checks_enabled"]
+
+
+P = t.ParamSpec("P")
+R = t.TypeVar("R")
+
+
+_checks_enabled = True
+
+
+def set_checks_enabled(enabled: bool, /) -> None:
+    """
+    Globally enables or disables the runtime checks of functions decorated with `@checked`. (When
+    python runs with the `-O` flag, `@checked` does nothing at all.)
+
+    Added in version 4.1.
+    """
+    global _checks_enabled
+    _checks_enabled = enabled
+
+
+@t.overload
+def checked(func: t.Callable[P, R], /) -> t.Callable[P, R]: ...
+
+
+@t.overload
+def checked(
+    *, convert: t.Mapping[str, u.Unit] | None = ...
+) -> t.Callable[[t.Callable[P, R]], t.Callable[P, R]]: ...
+
+
+def checked(
+    func: t.Callable[P, R] | None = None, /, *, convert: t.Mapping[str, u.Unit] | None = None
+) -> t.Any:
+    """
+    A decorator that checks whether the arguments passed to a function measure the quantities
+    specified by the function's annotations:
+
+    ```python
+    @u.checked
+    def travel_time(distance: u.Distance, speed: u.Speed) -> u.Duration:
+        return distance / speed
+
+    travel_time(u.km(5), u.seconds(3))  # TypeError
+    ```
+
+    Parameters without a `Quantity` annotation aren't checked. The return value is checked as well.
+
+    `convert` maps parameter names to units. These arguments are converted to the given unit before
+    they're passed to the function:
+
+    ```python
+    @u.checked(convert={"duration": u.seconds})
+    def sleep(duration: u.Duration):
+        print(repr(duration))
+
+    sleep(u.minutes(1))  # Prints "60.0 s"
+    ```
+
+    A `TypeError` is raised right away if `convert` contains names that aren't parameters of the
+    function. The annotations are evaluated only once, when the function is called for the first
+    time.
+
+    Added in version 4.1.
+    """
+    if func is None:
+        return functools.partial(checked, convert=convert)
+
+    conversions: t.Mapping[str, u.Unit] = {} if convert is None else convert
+
+    # Check for typos when decorating, even if the checks are disabled
+    unknown_names = conversions.keys() - inspect.signature(func).parameters.keys()
+    if unknown_names:
+        raise TypeError(f"{func.__qualname__}() has no parameters named {sorted(unknown_names)}")
+
+    # Don't add any overhead in optimized mode
+    if not __debug__:
+        return func
+
+    checker: _Checker | None = None
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if not _checks_enabled:
+            return func(*args, **kwargs)
+
+        nonlocal checker
+        if checker is None:
+            checker = _Checker(func, conversions)
+
+        args, kwargs = checker.check_arguments(args, kwargs)  # type: ignore
+        result = func(*args, **kwargs)
+        checker.check_return_value(result)
+        return result
+
+    return wrapper
+
+
+# For each parameter, a tuple of (position, name, expected quantity, unit to convert to)
+_ParameterCheck = tuple[t.Optional[int], str, t.Any, t.Optional["u.Unit"]]
+
+
+class _Checker:
+    def __init__(self, func: t.Callable, convert: t.Mapping[str, u.Unit]):
+        self.func_name = func.__qualname__
+
+        hints = t.get_type_hints(func)
+        parameters = inspect.signature(func).parameters
+
+        self.checks = list[_ParameterCheck]()
+        self.var_positional_check: _ParameterCheck | None = None
+
+        for position, (name, parameter) in enumerate(parameters.items()):
+            expected = _get_expected_quantity(hints.get(name))
+            unit = convert.get(name)
+
+            if expected is None and unit is None:
+                continue
+
+            if parameter.kind is parameter.VAR_POSITIONAL:
+                self.var_positional_check = (position, name, expected, unit)
+            elif parameter.kind is parameter.KEYWORD_ONLY:
+                self.checks.append((None, name, expected, unit))
+            elif parameter.kind is not parameter.VAR_KEYWORD:
+                self.checks.append((position, name, expected, unit))
+
+        self.return_check = _get_expected_quantity(hints.get("return"))
+
+    def check_arguments(
+        self, args: tuple[t.Any, ...], kwargs: dict[str, t.Any]
+    ) -> tuple[t.Sequence[t.Any], dict[str, t.Any]]:
+        args_list: list[t.Any] | None = None
+
+        for position, name, expected, unit in self.checks:
+            if position is not None and position < len(args):
+                value = self._check(args[position], name, expected, unit)
+
+                if value is not args[position]:
+                    if args_list is None:
+                        args_list = list(args)
+
+                    args_list[position] = value
+            elif name in kwargs:
+                kwargs[name] = self._check(kwargs[name], name, expected, unit)
+
+        if self.var_positional_check is not None:
+            start, name, expected, unit = self.var_positional_check
+            assert start is not None
+
+            if args_list is None:
+                args_list = list(args)
+
+            for position in range(start, len(args)):
+                args_list[position] = self._check(args[position], name, expected, unit)
+
+        return args if args_list is None else args_list, kwargs
+
+    def check_return_value(self, value: object) -> None:
+        if self.return_check is not None and not _matches(value, self.return_check):
+            raise TypeError(
+                f"{self.func_name}() should return a {_describe(self.return_check)}, but returned"
+                f" {value!r}"
+            )
+
+    def _check(self, value: t.Any, name: str, expected: t.Any, unit: u.Unit | None) -> t.Any:
+        if expected is not None and not _matches(value, expected):
+            raise TypeError(
+                f"Argument {name!r} of {self.func_name}() must be a {_describe(expected)}, not"
+                f" {value!r}"
+            )
+
+        if unit is not None and isinstance(value, u.Quantity):
+            value = unit(value)
+
+        return value
+
+
+# The expected quantity is either a `QuantityAlias`, the `Quantity` class itself (which accepts any
+# quantity), or a tuple of these, which may also contain `None` (for Optional parameters).
+def _get_expected_quantity(annotation: t.Any) -> t.Any:
+    if isinstance(annotation, QuantityAlias) or annotation is u.Quantity:
+        return annotation
+
+    if is_union(annotation):
+        options = tuple(
+            None if arg is type(None) else _get_expected_quantity(arg)
+            for arg in t.get_args(annotation)
+        )
+
+        # Only check unions that consist solely of quantities (and None)
+        if all(
+            option is not None or arg is type(None)
+            for arg, option in zip(t.get_args(annotation), options)
+        ):
+            return options
+
+    return None
+
+
+def _matches(value: object, expected: t.Any) -> bool:
+    if isinstance(expected, tuple):
+        return any(
+            value is None if option is None else _matches(value, option) for option in expected
+        )
+
+    if not isinstance(value, u.Quantity):
+        return False
+
+    if expected is u.Quantity:
+        return True
+
+    return value._unit.quantity is expected
+
+
+def _describe(expected: t.Any) -> str:
+    if isinstance(expected, tuple):
+        return " or ".join(_describe(option) for option in expected)
+
+    if expected is None:
+        return "None"
+
+    return repr(expected)
@@ -1,10 +1,450 @@
+"""
+Generates a module that defines a derived quantity and its units, for example:
+
+```
+u-make-derived-quantity SPECIFIC_HEAT "DIV[ENERGY, MUL[MASS, TEMPERATURE]]" \\
+    --unit "J/(kg*K)" --prefix k -o specific_heat.py
+```
+
+The equation can also be written like a unit symbol, as in `"ENERGY/(MASS*TEMPERATURE)"`.
+
+Defining a quantity by hand (like `Quantity[DIV[ENERGY, MUL[MASS, TEMPERATURE]]]`) means that its
+exponents have to be worked out from the typing construct at import time, and units like
+`joules / (kilograms * kelvin)` are built through several `Unit` multiplications. The generated
+module contains the results of all that work instead, so importing it is cheap.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fractions
+import importlib
+import keyword
+import re
 import sys
-from typing import Mapping
+import typing as t
+
+import u
+from u._utils import SUPERSCRIPT_DIGITS, format_symbol, parse_symbol
+from u.capital_quantities import QUANTITY
+from u.quantity import get_exponents
+
+
+__all__ = ["main", "generate_module"]
+
+
+CAPITAL_QUANTITY_OPERATORS = ("MUL", "DIV", "SQUARE", "CUBE", "TESSERACT")
+
+
+class UnitSpec(t.NamedTuple):
+    # The name of the module-level variable
+    name: str
+    # The symbol as written by the user. (The symbol of the parsed `unit` may be different.)
+    symbol: str
+    unit: u.Unit
+
+
+def main(argv: t.Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="u-make-derived-quantity",
+        description="Generates a module that defines a derived quantity and its units.",
+    )
+    parser.add_argument("name", help="The name of the quantity, like SPECIFIC_HEAT")
+    parser.add_argument(
+        "equation",
+        nargs="+",
+        help='Like "DIV[ENERGY, MUL[MASS, TEMPERATURE]]" or "ENERGY/(MASS*TEMPERATURE)"',
+    )
+    parser.add_argument(
+        "--alias",
+        help="The name of the Quantity alias. Defaults to the CamelCase version of the name.",
+    )
+    parser.add_argument(
+        "--unit",
+        action="append",
+        default=[],
+        metavar="[NAME=]SYMBOL",
+        help="A unit to define, like 'J/(kg*K)'. Can be given multiple times.",
+    )
+    parser.add_argument(
+        "--prefix",
+        action="append",
+        default=[],
+        metavar="SYMBOL",
+        help="A prefix that is applied to each unit, like 'k'. Can be given multiple times.",
+    )
+    parser.add_argument(
+        "--system",
+        action="append",
+        default=None,
+        metavar="SYSTEM",
+        help="The unit systems of the units. Defaults to the systems of the units they're made of.",
+    )
+    parser.add_argument(
+        "--module",
+        action="append",
+        default=[],
+        help="A module that defines additional quantities used in the equation.",
+    )
+    parser.add_argument("-o", "--output", help="The file to write to. Defaults to stdout.")
+
+    args = parser.parse_args(argv)
+
+    try:
+        source = generate_module(
+            args.name,
+            " ".join(args.equation),
+            alias=args.alias,
+            units=args.unit,
+            prefixes=args.prefix,
+            systems=args.system,
+            modules=args.module,
+        )
+    except ValueError as error:
+        parser.error(str(error))
+
+    if args.output is None:
+        sys.stdout.write(source)
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(source)
+
+
+def generate_module(
+    name: str,
+    equation: str,
+    *,
+    alias: str | None = None,
+    units: t.Iterable[str] = (),
+    prefixes: t.Iterable[str] = (),
+    systems: t.Iterable[str] | None = None,
+    modules: t.Iterable[str] = (),
+) -> str:
+    """
+    Returns the source code of a module that defines the quantity `name` (as `equation`), its
+    `Quantity` alias and the given units.
+
+    Each of the `units` is a unit symbol, optionally preceded by the name of its variable (as in
+    `"joules_per_kilogram_kelvin=J/(kg*K)"`). If no units are given, the unit made of the base units
+    of the quantities in the equation is defined. Each of the `prefixes` is applied to every unit.
+    """
+    if not name.isidentifier():
+        raise ValueError(f"{name!r} is not a valid name")
+
+    if alias is None:
+        alias = "".join(word.capitalize() for word in name.split("_"))
+
+    namespace = _get_namespace(modules)
+
+    if "[" not in equation:
+        equation = _symbol_to_capital_quantities(equation)
+
+    quantity_caps = _evaluate_equation(equation, namespace)
+    exponents = {
+        quantity_class: exponent
+        for quantity_class, exponent in get_exponents(quantity_caps).items()
+        if exponent
+    }
+
+    if not exponents:
+        raise ValueError(f"{equation!r} is dimensionless")
+
+    quantity = u.quantity.get_quantity_for_exponents(exponents)
+
+    unit_specs = [_parse_unit_spec(spec, quantity) for spec in units]
+    if not unit_specs:
+        unit_specs.append(_base_unit_spec(exponents))
+
+    unit_specs += [
+        _apply_prefix(prefix, unit_spec) for unit_spec in list(unit_specs) for prefix in prefixes
+    ]
+
+    unit_lines = list[str]()
+    for unit_spec in unit_specs:
+        unit_systems = unit_spec.unit.systems if systems is None else frozenset(systems)
+        arguments = [alias, _string_literal(unit_spec.symbol), _multiplier_literal(unit_spec.unit)]
+
+        if unit_systems:
+            systems_literal = ", ".join(_string_literal(system) for system in sorted(unit_systems))
+            arguments.append(f"systems={{{systems_literal}}}")
+
+        unit_lines += _wrap_call(f"{unit_spec.name} = Unit", arguments)
+
+    imports = _Imports()
+    imports.add_module("typing", "t")
+
+    if any("decimal." in line for line in unit_lines):
+        imports.add_module("decimal")
+    if any("fractions." in line for line in unit_lines):
+        imports.add_module("fractions")
+
+    imports.add("u.capital_quantities", *_used_operators(equation))
+
+    for used_name in set(re.findall(r"\w+", equation)) - set(CAPITAL_QUANTITY_OPERATORS):
+        imports.add(namespace[used_name].module, used_name)
+
+    for quantity_class in exponents:
+        imports.add_quantity_class(quantity_class)
+
+    imports.add("u.quantity", "get_quantity_for_exponents")
+    imports.add("u.unit", "Unit")
+
+    exponents_literal = ", ".join(
+        f"{quantity_class.__qualname__}: {exponent}"
+        for quantity_class, exponent in exponents.items()
+    )
+
+    lines = [
+        '"""',
+        f"Defines the {name} quantity and its units.",
+        "",
+        "This module was generated by `u-make-derived-quantity`. Don't edit it by hand.",
+        '"""',
+        "",
+        *imports.lines(),
+        "",
+        "if t.TYPE_CHECKING:",
+        "    from u.quantity import Quantity",
+        "",
+        "",
+        "# fmt: off",
+        "__all__ = [",
+        f'    "{name}",',
+        f'    "{alias}",',
+        *(f'    "{unit_spec.name}",' for unit_spec in unit_specs),
+        "]",
+        "# fmt: on",
+        "",
+        "",
+        f"{name} = {equation}",
+        "",
+        "if t.TYPE_CHECKING:",
+        f"    {alias} = Quantity[{name}]",
+        "else:",
+        "    # The exponents are precomputed, so the typing construct doesn't have to be analyzed",
+        *(
+            f"    {line}"
+            for line in _wrap_call(
+                f"{alias} = get_quantity_for_exponents", [f"{{{exponents_literal}}}", name]
+            )
+        ),
+        "",
+        "",
+        *unit_lines,
+    ]
+
+    return "\n".join(lines) + "\n"
+
+
+class _NamespaceEntry(t.NamedTuple):
+    value: t.Any
+    # The module that this object should be imported from
+    module: str
+
+
+def _get_namespace(modules: t.Iterable[str]) -> dict[str, _NamespaceEntry]:
+    namespace = {
+        name: _NamespaceEntry(getattr(u, name), "u") for name in dir(u) if name.isupper()
+    }
+
+    for module_name in modules:
+        module = importlib.import_module(module_name)
+
+        for name in dir(module):
+            if name.isupper() and name not in CAPITAL_QUANTITY_OPERATORS:
+                namespace[name] = _NamespaceEntry(getattr(module, name), module_name)
+
+    return namespace
+
+
+def _symbol_to_capital_quantities(equation: str) -> str:
+    """
+    Turns an equation like `"ENERGY/(MASS*TEMPERATURE)"` into `"DIV[ENERGY, MUL[MASS,
+    TEMPERATURE]]"`.
+    """
+    numerator = list[str]()
+    denominator = list[str]()
+
+    for name, exponent in parse_symbol(equation).items():
+        if exponent > 0:
+            numerator += [name] * exponent
+        else:
+            denominator += [name] * -exponent
+
+    if not numerator:
+        raise ValueError(f"The equation {equation!r} has no numerator")
+
+    if not denominator:
+        return _nest_mul(numerator)
+
+    return f"DIV[{_nest_mul(numerator)}, {_nest_mul(denominator)}]"
+
+
+def _nest_mul(names: list[str]) -> str:
+    if len(names) == 1:
+        return names[0]
+
+    return f"MUL[{names[0]}, {_nest_mul(names[1:])}]"
+
+
+def _evaluate_equation(equation: str, namespace: t.Mapping[str, _NamespaceEntry]) -> t.Any:
+    for name in re.findall(r"[^\W\d]\w*", equation):
+        if name not in namespace and name not in CAPITAL_QUANTITY_OPERATORS:
+            raise ValueError(f"Unknown quantity: {name!r}")
+
+    if re.fullmatch(r"[\w\s,\[\]]+", equation) is None:
+        raise ValueError(f"Invalid equation: {equation!r}")
+
+    globals_ = {name: entry.value for name, entry in namespace.items()}
+    globals_.update((name, getattr(u, name)) for name in CAPITAL_QUANTITY_OPERATORS)
+    globals_["__builtins__"] = {}
+
+    try:
+        return eval(equation, globals_)
+    except Exception:
+        raise ValueError(f"Invalid equation: {equation!r}") from None
+
+
+def _used_operators(equation: str) -> list[str]:
+    return [name for name in CAPITAL_QUANTITY_OPERATORS if re.search(rf"\b{name}\[", equation)]
+
+
+def _parse_unit_spec(spec: str, quantity: u.quantity.QuantityAlias) -> UnitSpec:
+    name, equals_sign, symbol = spec.rpartition("=")
+    if not equals_sign:
+        name = _identifier_for_symbol(symbol)
+
+    if not name.isidentifier() or keyword.iskeyword(name):
+        raise ValueError(f"{name!r} is not a valid name for the unit {symbol!r}")
+
+    unit: u.Unit = u.Unit.parse(symbol)
+
+    if unit.quantity.exponents != quantity.exponents:
+        raise ValueError(f"{symbol!r} is a unit of {unit.quantity}, not {quantity}")
+
+    return UnitSpec(name, symbol, unit)
+
+
+def _base_unit_spec(exponents: t.Mapping[type[QUANTITY], int]) -> UnitSpec:
+    powers = {
+        u.quantity.get_quantity_for_exponents({quantity_class: 1}).base_unit.symbol: exponent
+        for quantity_class, exponent in sorted(exponents.items(), key=lambda item: item[1] < 0)
+    }
+    symbol = format_symbol(powers)
+
+    return UnitSpec(_identifier_for_symbol(symbol), symbol, u.Unit.parse(symbol))
+
+
+def _apply_prefix(prefix_symbol: str, unit_spec: UnitSpec) -> UnitSpec:
+    prefix = u.Prefix.from_symbol(prefix_symbol)
+
+    # The prefix only applies to the first unit of the symbol, so that unit must not have an
+    # exponent. (A "km²" is not 1000 m².)
+    first_symbol, first_exponent = next(iter(parse_symbol(unit_spec.symbol).items()))
+    if first_exponent != 1 or not unit_spec.symbol.startswith(first_symbol):
+        raise ValueError(f"The prefix {prefix_symbol!r} can't be applied to {unit_spec.symbol!r}")
+
+    symbol = prefix.symbol + unit_spec.symbol
+    unit = u.unit.lookup_unit(
+        unit_spec.unit.quantity,
+        symbol,
+        fractions.Fraction(prefix.multiplier) * unit_spec.unit.fraction_multiplier,
+        unit_spec.unit.systems,
+    )
+    return UnitSpec(_identifier_for_symbol(symbol), symbol, unit)
+
+
+def _identifier_for_symbol(symbol: str) -> str:
+    """
+    Turns a symbol like `"J/(kg*K)"` into a variable name like `"J_per_kg_K"`.
+    """
+    name = symbol.translate(str.maketrans(SUPERSCRIPT_DIGITS + "⁻", "0123456789_"))
+    name = re.sub(r"\s*/\s*", "_per_", name)
+    name = re.sub(r"\^|\*\*", "", name)
+    name = re.sub(r"[\s*·()_]+", "_", name)
+    name = name.strip("_")
+
+    if not name.isidentifier() or keyword.iskeyword(name):
+        raise ValueError(f"Please specify a name for the unit {symbol!r}, like NAME={symbol}")
+
+    return name
+
+
+def _multiplier_literal(unit: u.Unit) -> str:
+    # The Decimal `multiplier` is what identifies a unit, so it must be reproduced exactly. If the
+    # unit can't be represented exactly as a Decimal, the Fraction is used instead.
+    if fractions.Fraction(unit.multiplier) == unit.fraction_multiplier:
+        if unit.multiplier == unit.multiplier.to_integral_value():
+            return str(int(unit.multiplier))
+
+        return f"decimal.Decimal({_string_literal(str(unit.multiplier))})"
+
+    fraction = unit.fraction_multiplier
+    return f"fractions.Fraction({fraction.numerator}, {fraction.denominator})"
+
+
+def _string_literal(text: str) -> str:
+    literal = repr(text)
+
+    # Prefer double quotes, like black
+    if literal.startswith("'") and '"' not in text:
+        literal = '"' + literal[1:-1] + '"'
+
+    return literal
+
+
+def _wrap_call(callee: str, arguments: list[str]) -> list[str]:
+    line = f"{callee}({', '.join(arguments)})"
+    if len(line) <= 96:
+        return [line]
+
+    return [f"{callee}(", f"    {', '.join(arguments)}", ")"]
+
+
+class _Imports:
+    def __init__(self) -> None:
+        # Maps module names to the names they're imported as
+        self._modules = dict[str, str]()
+        self._names_by_module = dict[str, set[str]]()
+
+    def add_module(self, module: str, as_name: str | None = None) -> None:
+        self._modules[module] = as_name or module
+
+    def add(self, module: str, *names: str) -> None:
+        if names:
+            self._names_by_module.setdefault(module, set()).update(names)
+
+    def add_quantity_class(self, quantity_class: type[QUANTITY]) -> None:
+        name = quantity_class.__qualname__
+
+        if getattr(u, name, None) is quantity_class:
+            self.add("u", name)
+        else:
+            self.add(quantity_class.__module__, name)
+
+    def lines(self) -> list[str]:
+        lines = list[str]()
+
+        for module, as_name in sorted(self._modules.items()):
+            if as_name == module:
+                lines.append(f"import {module}")
+            else:
+                lines.append(f"import {module} as {as_name}")
+
+        lines.append("")
+
+        for module, names in sorted(self._names_by_module.items()):
+            line = f"from {module} import {', '.join(sorted(names))}"
+
+            if len(line) > 100:
+                line = "\n".join(
+                    [f"from {module} import (", *(f"    {name}," for name in sorted(names)), ")"]
+                )
+
+            lines.append(line)
 
-from u._utils import parse_symbol
+        return lines
 
 
-def main() -> None:
-    equation = "".join(sys.argv[1:])
-    exponents = parse_symbol(equation)
-    print(exponents)
+if __name__ == "__main__":
+    main()
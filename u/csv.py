@@ -0,0 +1,259 @@
+"""
+Reading and writing CSV files whose headers specify the unit of each column, like `latency [ms]` or
+`size (MiB)`. The unit of each column is parsed only once, so the overhead compared to the `csv`
+module is small.
+
+```python
+with open("requests.csv", newline="") as file:
+    for row in u.csv.reader(file, to={"latency": u.seconds}):
+        print(row["host"], row["latency"])
+```
+"""
+
+from __future__ import annotations
+
+import csv
+import re
+import typing as t
+
+import u
+
+
+__all__ = ["Reader", "Writer", "reader", "writer", "parse_header", "format_header"]
+
+
+HEADER_REGEX = re.compile(r"(.*?)\s*(?:\[([^\]]*)\]|\(([^)]*)\))\s*", re.DOTALL)
+
+
+def parse_header(header: str, /) -> tuple[str, u.Unit | None]:
+    """
+    Splits a column header like `"latency [ms]"` or `"size (MiB)"` into the column name and the
+    unit. If the header doesn't end with a unit in brackets or parentheses, or if that unit can't be
+    parsed, the unit is `None`.
+
+    ```python
+    >>> u.csv.parse_header("latency [ms]")
+    ('latency', Unit(Quantity[DURATION], 'ms', Decimal('0.001')))
+    >>> u.csv.parse_header("host")
+    ('host', None)
+    ```
+
+    Added in version 4.1.
+    """
+    match = HEADER_REGEX.fullmatch(header)
+    if match is None:
+        return header.strip(), None
+
+    name, bracketed_symbol, parenthesized_symbol = match.groups()
+
+    unit: u.Unit
+
+    try:
+        unit = u.Unit.parse(bracketed_symbol or parenthesized_symbol)
+    except ValueError:
+        # Something like "size (total)"
+        return header.strip(), None
+
+    return name, unit
+
+
+def format_header(name: str, unit: u.Unit | None, /) -> str:
+    """
+    The inverse of `parse_header`.
+
+    Added in version 4.1.
+    """
+    if unit is None:
+        return name
+
+    return f"{name} [{unit.symbol}]"
+
+
+class Reader:
+    """
+    Reads the rows of a CSV file as dicts. The first row of the file must contain the headers.
+
+    The values of columns with a unit are turned into `Quantity` objects. If the column's name is
+    contained in `to`, the values are instead converted to the given unit and returned as floats.
+    Empty cells are returned as `None`. All other values are returned as strings. Empty lines are
+    skipped, and a `ValueError` is raised if a row doesn't have exactly one cell per column.
+
+    Any additional keyword arguments are passed on to `csv.reader`.
+
+    Added in version 4.1.
+    """
+
+    def __init__(
+        self,
+        file: t.Iterable[str],
+        /,
+        *,
+        to: t.Mapping[str, u.Unit] | None = None,
+        **fmtparams: t.Any,
+    ):
+        if to is None:
+            to = {}
+
+        self._rows = csv.reader(file, **fmtparams)
+
+        try:
+            headers = next(self._rows)
+        except StopIteration:
+            headers = []
+
+        self.fieldnames = list[str]()
+        self.units = dict[str, t.Optional[u.Unit]]()
+        self._converters = list[t.Optional[t.Callable[[str], t.Any]]]()
+
+        for header in headers:
+            name, unit = parse_header(header)
+
+            self.fieldnames.append(name)
+            self.units[name] = unit
+            self._converters.append(_make_converter(name, unit, to.get(name)))
+
+        unknown_names = to.keys() - self.units.keys()
+        if unknown_names:
+            raise ValueError(f"The file has no columns named {sorted(unknown_names)}")
+
+    def __iter__(self) -> Reader:
+        return self
+
+    def __next__(self) -> dict[str, t.Any]:
+        row = next(self._rows)
+        while not row:
+            row = next(self._rows)
+
+        if len(row) != len(self.fieldnames):
+            raise ValueError(
+                f"Line {self._rows.line_num} has {len(row)} cells, but there are"
+                f" {len(self.fieldnames)} columns"
+            )
+
+        return {
+            name: cell if converter is None else converter(cell)
+            for name, converter, cell in zip(self.fieldnames, self._converters, row)
+        }
+
+
+class Writer:
+    """
+    Writes dicts as rows of a CSV file. The values of columns with a unit are converted to that unit
+    before they're written, and the unit is included in the header (like `latency [ms]`).
+    Quantities are written as plain numbers, so there's no search for the most readable unit.
+
+    Values of columns with a unit can be either `Quantity` objects, plain numbers (which are
+    assumed to be measured in the column's unit), or `None` (which is written as an empty cell).
+
+    Any additional keyword arguments are passed on to `csv.writer`.
+
+    Added in version 4.1.
+    """
+
+    def __init__(
+        self,
+        file: t.Any,
+        /,
+        fieldnames: t.Sequence[str],
+        units: t.Mapping[str, u.Unit] | None = None,
+        **fmtparams: t.Any,
+    ):
+        if units is None:
+            units = {}
+
+        unknown_names = units.keys() - set(fieldnames)
+        if unknown_names:
+            raise ValueError(f"There are no columns named {sorted(unknown_names)}")
+
+        self.fieldnames = list(fieldnames)
+        self.units = {name: units.get(name) for name in fieldnames}
+        self._writer = csv.writer(file, **fmtparams)
+
+    def writeheader(self) -> None:
+        """
+        Writes the header row.
+        """
+        self._writer.writerow([format_header(name, unit) for name, unit in self.units.items()])
+
+    def writerow(self, row: t.Mapping[str, t.Any], /) -> None:
+        """
+        Writes a single row. Missing values are written as empty cells.
+        """
+        self._writer.writerow(
+            [_format_cell(row.get(name), unit) for name, unit in self.units.items()]
+        )
+
+    def writerows(self, rows: t.Iterable[t.Mapping[str, t.Any]], /) -> None:
+        """
+        Writes many rows.
+        """
+        for row in rows:
+            self.writerow(row)
+
+
+def reader(
+    file: t.Iterable[str], /, *, to: t.Mapping[str, u.Unit] | None = None, **fmtparams
+) -> Reader:
+    """
+    Shorthand for `Reader(file, to=to, **fmtparams)`.
+
+    Added in version 4.1.
+    """
+    return Reader(file, to=to, **fmtparams)
+
+
+def writer(
+    file: t.Any,
+    /,
+    fieldnames: t.Sequence[str],
+    units: t.Mapping[str, u.Unit] | None = None,
+    **fmtparams,
+) -> Writer:
+    """
+    Shorthand for `Writer(file, fieldnames, units, **fmtparams)`.
+
+    Added in version 4.1.
+    """
+    return Writer(file, fieldnames, units, **fmtparams)
+
+
+def _make_converter(
+    name: str, unit: u.Unit | None, target_unit: u.Unit | None
+) -> t.Callable[[str], t.Any] | None:
+    if target_unit is None:
+        if unit is None:
+            return None
+
+        def to_quantity(cell: str) -> u.Quantity | None:
+            return u.Quantity(float(cell), unit) if cell else None
+
+        return to_quantity
+
+    if unit is None:
+        raise ValueError(f"Cannot convert column {name!r} to {target_unit}, since it has no unit")
+
+    if not unit.is_compatible_with(target_unit):
+        raise ValueError(
+            f"Cannot convert column {name!r} (measured in {unit}) to {target_unit} (a unit of"
+            f" {target_unit.quantity})"
+        )
+
+    factor = unit.float_multiplier / target_unit.float_multiplier
+
+    def to_number(cell: str) -> float | None:
+        return float(cell) * factor if cell else None
+
+    return to_number
+
+
+def _format_cell(value: t.Any, unit: u.Unit | None) -> t.Any:
+    if value is None:
+        return ""
+
+    if unit is None or not isinstance(value, u.Quantity):
+        return value
+
+    if value._unit is unit:
+        return value._value
+
+    return value.to_number(unit)
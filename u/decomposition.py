@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import decimal
+import fractions
+import typing as t
+
+import u
+
+from ._utils import cached
+from .capital_quantities import QUANTITY
+from .maths import Number, convert, divide
+from .quantity import quantity_to_string
+
+
+__all__ = ["decompose"]
+
+
+Q = t.TypeVar("Q", bound=QUANTITY)
+
+
+def decompose(
+    quantity: u.Quantity[Q], units: t.Iterable[u.Unit[Q]] | None = None, /
+) -> list[u.Quantity[Q]]:
+    """
+    Splits a quantity into a sum of quantities in different units. All components except the one
+    in the smallest unit are integers.
+
+    ```python
+    >>> u.decompose(u.seconds(5025), [u.hours, u.minutes, u.seconds])
+    [1 h, 23 min, 45 s]
+    ```
+
+    The order of the `units` doesn't matter; the result is always sorted from the largest unit to
+    the smallest. If no `units` are given, the quantity's unit is used together with all larger
+    units that belong to the same unit systems, except for those that would result in leading
+    zeros.
+
+    The split is exact, without any floating point error. (Floats are taken to mean the number
+    they're printed as, so `u.hours(1.1)` is split into exactly 1 h and 6 min.)
+
+    The same decomposition is available through string formatting, where zero components are
+    omitted:
+
+    ```python
+    >>> f"{u.seconds(5025):h+min+s}"
+    '1 h 23 min 45 s'
+    ```
+
+    If the quantity is negative, all components are negative.
+
+    Added in version 4.1.
+    """
+    if units is None:
+        units = _default_units(quantity)
+
+    chain = _get_unit_chain(tuple(units))
+    total = _to_smallest_unit(quantity, chain)
+
+    counts, remainder = _split(abs(total), chain.divisors)
+    sign = -1 if total < 0 else 1
+
+    components = [u.Quantity(sign * count, unit) for count, unit in zip(counts, chain.units)]
+    components.append(
+        u.Quantity(_from_fraction(sign * remainder, quantity._value), chain.units[-1])
+    )
+    return components
+
+
+def format_decomposition(quantity: u.Quantity, units_spec: str, number_format: str | None) -> str:
+    """
+    Implements format specs like `"h+min+s"`. The result looks like "1 h 23 min 45 s". Components
+    that are 0 are omitted, unless all of them are 0.
+
+    The `number_format` applies to the component in the smallest unit. If rounding it results in a
+    whole larger unit (like "60.00 s"), that is carried over into the larger units. A sign option
+    (like `"+"`) applies to the result as a whole.
+    """
+    chain = _parse_unit_chain(units_spec, quantity.quantity)
+    total = _to_smallest_unit(quantity, chain)
+
+    sign_option = ""
+    if number_format is not None and number_format[:1] in ("+", "-", " "):
+        sign_option, number_format = number_format[0], number_format[1:]
+
+    counts, remainder = _split(abs(total), chain.divisors)
+    remainder_str, rounded_remainder = _format_remainder(remainder, quantity._value, number_format)
+
+    if chain.divisors and rounded_remainder >= chain.divisors[-1]:
+        total_count = sum(count * divisor for count, divisor in zip(counts, chain.divisors))
+        counts, remainder = _split(total_count + rounded_remainder, chain.divisors)
+        remainder_str, rounded_remainder = _format_remainder(
+            remainder, quantity._value, number_format
+        )
+
+    segments = [
+        quantity_to_string(count, unit) for count, unit in zip(counts, chain.units) if count != 0
+    ]
+    if rounded_remainder != 0 or not segments:
+        segments.append(quantity_to_string(remainder_str, chain.units[-1]))
+
+    if total < 0 and (rounded_remainder != 0 or any(counts)):
+        sign = "-"
+    elif sign_option in ("+", " "):
+        sign = sign_option
+    else:
+        sign = ""
+
+    return sign + " ".join(segments)
+
+
+def _to_smallest_unit(quantity: u.Quantity, chain: _UnitChain) -> fractions.Fraction:
+    smallest_unit = chain.units[-1]
+
+    if quantity._unit is not smallest_unit and not (
+        quantity._unit.quantity is smallest_unit.quantity
+        or quantity._unit.is_compatible_with(smallest_unit)
+    ):
+        raise ValueError(
+            f"Cannot decompose {quantity} (a {quantity.quantity}) into units of"
+            f" {smallest_unit.quantity}"
+        )
+
+    value = quantity._value
+
+    try:
+        # A float's repr is the shortest string that round-trips, i.e. the number that was meant
+        exact = fractions.Fraction(repr(value) if isinstance(value, float) else value)
+    except (ValueError, OverflowError) as e:
+        raise ValueError(f"Cannot decompose {quantity}") from e
+
+    if quantity._unit is smallest_unit:
+        return exact
+
+    return exact * quantity._unit.fraction_multiplier / smallest_unit.fraction_multiplier
+
+
+def _split(
+    total: fractions.Fraction, divisors: t.Iterable[fractions.Fraction]
+) -> tuple[list[int], fractions.Fraction]:
+    counts = list[int]()
+
+    for divisor in divisors:
+        count, total = divmod(total, divisor)
+        counts.append(int(count))
+
+    return counts, total
+
+
+def _from_fraction(fraction: fractions.Fraction, original: Number) -> Number:
+    # Returns the number in the same type as the quantity's original value
+    if isinstance(original, (fractions.Fraction, decimal.Decimal)):
+        return convert(fraction, type(original))
+
+    if isinstance(original, float):
+        return float(fraction)
+
+    if fraction.denominator == 1:
+        return fraction.numerator
+
+    return divide(fraction.numerator, fraction.denominator)
+
+
+def _format_remainder(
+    remainder: fractions.Fraction, original: Number, number_format: str | None
+) -> tuple[str, fractions.Fraction]:
+    """
+    Formats the component in the smallest unit, and returns the string along with the exact value
+    it represents after rounding.
+    """
+    if remainder.denominator == 1:
+        value: Number = remainder.numerator
+    else:
+        value = _from_fraction(remainder, original)
+
+        # Fractions only support float-style formatting since python 3.12
+        if isinstance(value, fractions.Fraction):
+            value = float(value)
+
+    if number_format is not None:
+        value_str = format(value, number_format)
+    elif isinstance(value, int):
+        value_str = str(value)
+    else:
+        # Like `str(quantity)`
+        value_str = format(value, ".1f")
+
+    try:
+        return value_str, fractions.Fraction(value_str)
+    except ValueError:
+        # Formats like "%" or "," can't be parsed back, so there's nothing to round
+        return value_str, remainder
+
+
+class _UnitChain(t.NamedTuple):
+    # Sorted from largest to smallest
+    units: tuple[u.Unit, ...]
+    # For each unit except the smallest one, its multiplier divided by the multiplier of the
+    # smallest unit
+    divisors: tuple[fractions.Fraction, ...]
+
+
+@cached
+def _parse_unit_chain(units_spec: str, quantity: type[u.Quantity]) -> _UnitChain:
+    units = [u.Unit.parse(symbol, quantity=quantity) for symbol in units_spec.split("+")]
+    return _get_unit_chain(tuple(units))
+
+
+@cached
+def _get_unit_chain(units: tuple[u.Unit, ...]) -> _UnitChain:
+    if not units:
+        raise ValueError("At least one unit is required")
+
+    first = units[0]
+    for unit in units[1:]:
+        if not unit.is_compatible_with(first):
+            raise ValueError(f"Cannot decompose into incompatible units {first} and {unit}")
+
+    sorted_units = sorted(set(units), key=lambda unit: unit.fraction_multiplier, reverse=True)
+    smallest_unit = sorted_units[-1]
+
+    divisors = tuple(
+        unit.fraction_multiplier / smallest_unit.fraction_multiplier for unit in sorted_units[:-1]
+    )
+    return _UnitChain(tuple(sorted_units), divisors)
+
+
+def _default_units(quantity: u.Quantity) -> tuple[u.Unit, ...]:
+    magnitude = abs(float(quantity))
+
+    # Larger units than the quantity itself would only result in leading zeros
+    units = [
+        unit
+        for unit in _larger_units_in_same_systems(quantity._unit)
+        if unit.float_multiplier <= magnitude
+    ]
+    units.append(quantity._unit)
+    return tuple(units)
+
+
+@cached
+def _larger_units_in_same_systems(unit: u.Unit) -> tuple[u.Unit, ...]:
+    return tuple(
+        candidate
+        for candidate in unit.quantity.units
+        if candidate.multiplier > unit.multiplier
+        and (candidate.systems == unit.systems or candidate.systems & unit.systems)
+    )
+
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import bisect
+import typing as t
+
+import u
+
+from .capital_quantities import QUANTITY
+from .maths import NumericMode, get_numeric_mode
+
+
+__all__ = ["Histogram"]
+
+
+Q = t.TypeVar("Q", bound=QUANTITY)
+
+
+class Histogram(t.Generic[Q]):
+    """
+    Counts how many observed quantities fall into each of a fixed set of buckets.
+
+    ```python
+    >>> ms = u.milli(u.seconds)
+    >>> histogram = u.Histogram([ms(1), ms(5), ms(25), u.seconds(1)])
+    >>> histogram.observe(ms(3))
+    >>> histogram.observe(0.002, u.seconds)
+    >>> histogram.observe(u.seconds(5))
+    >>> dict(zip(histogram.labels(), histogram.counts))
+    {'≤ 1 ms': 0, '≤ 5 ms': 2, '≤ 25 ms': 0, '≤ 1 s': 0, '> 1 s': 1}
+    ```
+
+    A quantity is counted in the first bucket whose bound is greater than or equal to it. Quantities
+    that are larger than all bounds are counted in an additional overflow bucket at the end.
+
+    The bounds are converted to each unit that values are observed in once, so observing a value
+    only requires a binary search.
+    """
+
+    def __init__(self, bounds: t.Iterable[u.Quantity[Q]], /):
+        self._bounds = sorted(bounds)
+        if not self._bounds:
+            raise ValueError("A histogram needs at least one bound")
+
+        self._quantity = self._bounds[0].quantity
+        for bound in self._bounds:
+            if not bound.is_compatible_with(self._bounds[0]):
+                raise ValueError(f"{bound} is not a valid bound for a {self._quantity} histogram")
+
+        self._counts = [0] * (len(self._bounds) + 1)
+
+        # The bounds converted to the units that were used to observe values. This way, observed
+        # values are compared to the bounds just like quantities are compared to each other.
+        self._keys = dict[tuple[u.Unit, NumericMode], list[float]]()
+
+    @property
+    def bounds(self) -> t.Sequence[u.Quantity[Q]]:
+        """
+        The upper bounds of the buckets, in ascending order.
+        """
+        return tuple(self._bounds)
+
+    @property
+    def counts(self) -> t.Sequence[int]:
+        """
+        The number of observations in each bucket. This has one more element than `bounds`, because
+        the last bucket counts the observations that exceed all bounds.
+        """
+        return tuple(self._counts)
+
+    @property
+    def total(self) -> int:
+        """
+        The total number of observations.
+        """
+        return sum(self._counts)
+
+    @t.overload
+    def observe(self, value: u.Quantity[Q], /) -> None: ...
+
+    @t.overload
+    def observe(self, value: float, unit: u.Unit[Q], /) -> None: ...
+
+    def observe(self, value: u.Quantity[Q] | float, unit: u.Unit[Q] | None = None, /) -> None:
+        """
+        Counts a single value, which can either be a `Quantity` or a number together with a `unit`.
+        """
+        if unit is None:
+            assert isinstance(value, u.Quantity)
+
+            if not value.is_compatible_with(self._bounds[0]):
+                raise ValueError(f"Cannot count {value} in a histogram of {self._quantity}")
+
+            number, unit = float(value._value), value._unit
+        else:
+            number = float(value)
+
+        self._counts[bisect.bisect_left(self._keys_for(unit), number)] += 1
+
+    def observe_many(self, values: t.Iterable[float], unit: u.Unit[Q], /) -> None:
+        """
+        Counts many numbers, which are all measured in the given `unit`.
+        """
+        keys = self._keys_for(unit)
+        counts = self._counts
+
+        for value in values:
+            counts[bisect.bisect_left(keys, value)] += 1
+
+    def labels(self, format_spec: str = "") -> list[str]:
+        """
+        Returns a human-readable label for each bucket. The `format_spec` is used to format the
+        bounds, as in `format(bound, format_spec)`.
+        """
+        labels = [f"≤ {bound:{format_spec}}" for bound in self._bounds]
+        labels.append(f"> {self._bounds[-1]:{format_spec}}")
+        return labels
+
+    def merge(self, other: Histogram[Q], /) -> None:
+        """
+        Adds the counts of another histogram with the same bounds to this histogram.
+        """
+        if other._bounds != self._bounds:
+            raise ValueError("Only histograms with the same bounds can be merged")
+
+        self._counts = [a + b for a, b in zip(self._counts, other._counts)]
+
+    def snapshot(self) -> Histogram[Q]:
+        """
+        Returns a copy of this histogram. Observations made after taking the snapshot don't affect
+        the snapshot.
+        """
+        histogram = Histogram.__new__(Histogram)
+        histogram._bounds = self._bounds
+        histogram._quantity = self._quantity
+        histogram._counts = self._counts.copy()
+        histogram._keys = self._keys.copy()
+        return histogram
+
+    def reset(self) -> None:
+        """
+        Sets all counts to 0.
+        """
+        self._counts = [0] * len(self._counts)
+
+    def _keys_for(self, unit: u.Unit[Q]) -> list[float]:
+        # The conversion depends on the numeric mode, so it's part of the key
+        key = (unit, get_numeric_mode())
+
+        try:
+            return self._keys[key]
+        except KeyError:
+            pass
+
+        if not unit.is_compatible_with(self._quantity):
+            raise ValueError(f"Cannot count values in {unit} in a histogram of {self._quantity}")
+
+        keys = self._keys[key] = [bound.to_number(unit) for bound in self._bounds]
+        return keys
+
+    def __repr__(self) -> str:
+        buckets = ", ".join(
+            f"{label}: {count}" for label, count in zip(self.labels(), self._counts)
+        )
+        return f"<Histogram {buckets}>"
@@ -0,0 +1,244 @@
+"""
+Functions for loading large columns of numbers that are all measured in the same unit. Requires
+`numpy`.
+
+The numbers are never turned into `Quantity` objects. Instead, the functions return a `UnitArray`,
+which is a numpy array together with its unit. Since it's a tuple, it can be unpacked straight into
+the functions of `u.stats`:
+
+```python
+>>> latencies = u.io.load_column("latencies.f8", u.milli(u.seconds))
+>>> u.stats.percentile(*latencies, q=99)
+31.5 ms
+```
+"""
+
+from __future__ import annotations
+
+import os
+import typing as t
+
+import u
+
+from ._utils import import_numpy
+
+if t.TYPE_CHECKING:
+    import numpy as np
+
+
+__all__ = ["UnitArray", "load_column", "load_text_column", "from_timedelta64", "to_timedelta64"]
+
+
+class UnitArray(t.NamedTuple):
+    """
+    A numpy array of numbers, all of which are measured in the given `unit`.
+    """
+
+    values: np.ndarray
+    unit: u.Unit
+
+    def to_numbers(self, unit: u.Unit, /) -> np.ndarray:
+        """
+        Returns the values converted to the given unit, using the units' `float_multiplier`s. Raises
+        a `ValueError` if an incompatible unit is passed.
+        """
+        if not self.unit.is_compatible_with(unit):
+            raise ValueError(
+                f"Cannot convert {self.unit} (a unit of {self.unit.quantity}) to {unit} (a unit of"
+                f" {unit.quantity})"
+            )
+
+        return self.values * (self.unit.float_multiplier / unit.float_multiplier)
+
+
+def load_column(
+    path: str | os.PathLike[str], unit: u.Unit, /, *, dtype: str = "f8"
+) -> UnitArray:
+    """
+    Memory-maps a binary file of raw numbers, like a file of little-endian doubles. The file isn't
+    read into memory; the data is only loaded when it's accessed.
+
+    The `dtype` is a numpy dtype string. The default `"f8"` means native 64 bit floats. Use `"<f8"`
+    or `">f8"` to specify the byte order explicitly.
+
+    Added in version 4.1.
+    """
+    np = import_numpy("u.io")
+
+    values = np.memmap(path, dtype=np.dtype(dtype), mode="r")
+    return UnitArray(values, unit)
+
+
+def load_text_column(
+    path: str | os.PathLike[str],
+    column: int | str,
+    unit: u.Unit,
+    /,
+    *,
+    delimiter: str = ",",
+) -> UnitArray:
+    """
+    Loads one column of a delimited text file (like a CSV file) into a float array.
+
+    The `column` can be either the index of the column, or its name. If a name is given, the first
+    line of the file is treated as a header row.
+
+    The numbers are parsed by numpy in chunks, so no `float` objects are created for the individual
+    values.
+
+    Added in version 4.1.
+    """
+    np = import_numpy("u.io")
+
+    skip_rows = 0
+
+    if isinstance(column, str):
+        with open(path, encoding="utf-8") as file:
+            header = [name.strip() for name in file.readline().split(delimiter)]
+
+        try:
+            column = header.index(column)
+        except ValueError:
+            raise ValueError(f"{path!r} has no column named {column!r}") from None
+
+        skip_rows = 1
+
+    values = np.loadtxt(
+        path,
+        dtype=np.float64,
+        delimiter=delimiter,
+        usecols=column,
+        skiprows=skip_rows,
+        ndmin=1,
+        encoding="utf-8",
+    )
+    return UnitArray(values, unit)
+
+
+def from_timedelta64(values: np.ndarray, /) -> UnitArray:
+    """
+    Converts a `numpy.timedelta64` array to a `UnitArray` of integers. The unit corresponds to the
+    array's resolution, so no conversion is necessary: an array of `timedelta64[ns]` becomes an
+    array of nanoseconds (`u.nano(u.seconds)`), `timedelta64[s]` becomes seconds, and so on.
+
+    ```python
+    >>> u.io.from_timedelta64(np.array([1500, 20], dtype="m8[ms]"))
+    UnitArray(values=array([1500,   20]), unit=Unit(Quantity[DURATION], 'ms', Decimal('0.001')))
+    ```
+
+    Raises a `ValueError` if the array contains `NaT`, or if its resolution is years or months
+    (which have no fixed length). Raises an `OverflowError` if a resolution like `"m8[10ms]"` would
+    push a value out of the range of int64.
+
+    Added in version 4.1.
+    """
+    np = import_numpy("u.io")
+
+    values = np.asarray(values)
+    if values.dtype.kind != "m":
+        raise TypeError(f"Expected an array of timedelta64, not {values.dtype}")
+
+    resolution, count = np.datetime_data(values.dtype)
+    unit = _unit_for_resolution(resolution)
+
+    if np.isnat(values).any():
+        raise ValueError("Cannot convert NaT to a duration")
+
+    integers = values.view(np.int64)
+    if count != 1:
+        _check_int64_range(integers, np.iinfo(np.int64).max // count)
+        integers = integers * count
+
+    return UnitArray(integers, unit)
+
+
+def to_timedelta64(array: UnitArray, /, resolution: str = "ns") -> np.ndarray:
+    """
+    Converts a `UnitArray` of durations to a `numpy.timedelta64` array with the given resolution,
+    like `"ns"` or `"ms"`.
+
+    Integers are converted exactly, using integer arithmetic only. If the resolution is coarser
+    than the unit (like when converting nanoseconds to milliseconds), they're rounded to the nearest
+    multiple of the resolution, with ties going to the even one. Floats are scaled and rounded the
+    same way, subject to the usual floating point errors.
+
+    Raises an `OverflowError` if a value doesn't fit into a timedelta64 with that resolution.
+
+    Added in version 4.1.
+    """
+    np = import_numpy("u.io")
+
+    target_unit = _unit_for_resolution(resolution)
+
+    if not array.unit.is_compatible_with(target_unit):
+        raise ValueError(
+            f"Cannot convert {array.unit} (a unit of {array.unit.quantity}) to a timedelta"
+        )
+
+    factor = array.unit.fraction_multiplier / target_unit.fraction_multiplier
+    values = np.asarray(array.values)
+
+    int64_max = np.iinfo(np.int64).max
+
+    if values.dtype.kind in "iu" and factor.denominator <= int64_max:
+        _check_int64_range(values, int64_max // factor.numerator)
+        integers = values.astype(np.int64) * factor.numerator
+
+        if factor.denominator != 1:
+            integers = _divide_rounding_half_to_even(integers, factor.denominator)
+    else:
+        scaled = np.rint(values * float(factor))
+        # 2**63 is the first float that doesn't fit, and -2**63 is NaT
+        _check_int64_range(scaled, 2.0**63, inclusive=False)
+        integers = scaled.astype(np.int64)
+
+    return integers.view(f"m8[{resolution}]")
+
+
+def _divide_rounding_half_to_even(integers: np.ndarray, divisor: int) -> np.ndarray:
+    quotients, remainders = divmod(integers, divisor)
+
+    # `divmod` rounds down, so the remainders are in [0, divisor). Comparing against
+    # `divisor - remainders` instead of doubling the remainders avoids an overflow.
+    halfway = divisor - remainders
+    round_up = (remainders > halfway) | ((remainders == halfway) & (quotients % 2 == 1))
+
+    return quotients + round_up
+
+
+def _check_int64_range(values: np.ndarray, limit: float, *, inclusive: bool = True) -> None:
+    # Values outside of [-limit, limit] would silently wrap around when converted to int64. (`abs`
+    # can't be used for this, since it wraps around itself for the smallest int64.)
+    if inclusive:
+        out_of_range = (values > limit) | (values < -limit)
+    else:
+        out_of_range = (values >= limit) | (values <= -limit)
+
+    if out_of_range.any():
+        raise OverflowError("The values don't fit into a timedelta64 with this resolution")
+
+
+# The units that correspond to numpy's timedelta64 resolutions. Years and months are missing because
+# their length isn't fixed.
+_RESOLUTION_PREFIXES = {
+    "ms": "m",
+    "us": "µ",
+    "μs": "µ",
+    "ns": "n",
+    "ps": "p",
+    "fs": "f",
+    "as": "a",
+}
+
+
+def _unit_for_resolution(resolution: str) -> u.Unit:
+    if resolution in _RESOLUTION_PREFIXES:
+        prefix = u.Prefix.from_symbol(_RESOLUTION_PREFIXES[resolution])
+        return prefix(u.seconds)
+
+    units = {"W": u.weeks, "D": u.days, "h": u.hours, "m": u.minutes, "s": u.seconds}
+
+    try:
+        return units[resolution]
+    except KeyError:
+        raise ValueError(f"Unsupported timedelta64 resolution: {resolution!r}") from None
@@ -1,47 +1,122 @@
 """
-Floats and Decimals refuse to cooperate, so any math involving mixed types will throw an error. This
-module can be used to safely perform math without worrying about the types of the operands.
+Floats, Decimals and Fractions refuse to cooperate, so math involving mixed types often throws an
+error. This module can be used to safely perform math without worrying about the types of the
+operands.
 """
 
+import contextlib
+import contextvars
 import decimal
+import fractions
 import operator
+import os
 import typing as t
+import warnings
 
 
-FloatOrDecimal = float | decimal.Decimal
-TypePreference = type[float] | type[decimal.Decimal] | None
+__all__ = ["NumericMode", "get_numeric_mode", "set_numeric_mode", "numeric_mode"]
+
+
+Number = float | decimal.Decimal | fractions.Fraction
+TypePreference = type[float] | type[decimal.Decimal] | type[fractions.Fraction] | None
+
+NumericMode = t.Literal["decimal", "float"]
+NUMERIC_MODES = t.get_args(NumericMode)
+
+
+def get_numeric_mode() -> NumericMode:
+    """
+    Returns the current numeric mode. See `set_numeric_mode` for details.
+    """
+    return _numeric_mode.get()
+
+
+def set_numeric_mode(mode: NumericMode, /) -> None:
+    """
+    Sets the numeric mode, which determines how quantities are converted between units.
+
+    - In `"decimal"` mode (the default), conversions use the exact `Decimal` unit multipliers. This
+      maximizes precision, but Decimal arithmetic is slow.
+    - In `"float"` mode, conversions of quantities that were created with a float (or int) use the
+      units' `float_multiplier` instead. This is much faster, but the results are subject to the
+      usual floating point rounding errors. Quantities created with a `Decimal` or a `Fraction` are
+      still converted exactly.
+
+    The initial mode can also be set via the `U_NUMERIC_MODE` environment variable. The mode is
+    stored in a `contextvars.ContextVar`, so changing it only affects the current thread (or asyncio
+    task).
+
+    Added in version 4.1.
+    """
+    if mode not in NUMERIC_MODES:
+        raise ValueError(f"Invalid numeric mode {mode!r}, expected one of {NUMERIC_MODES}")
+
+    _numeric_mode.set(mode)
+
+
+@contextlib.contextmanager
+def numeric_mode(mode: NumericMode, /) -> t.Iterator[None]:
+    """
+    A context manager that temporarily changes the numeric mode:
+
+    ```python
+    with u.numeric_mode("float"):
+        seconds = [duration.to_number(u.seconds) for duration in durations]
+    ```
+
+    Added in version 4.1.
+    """
+    if mode not in NUMERIC_MODES:
+        raise ValueError(f"Invalid numeric mode {mode!r}, expected one of {NUMERIC_MODES}")
+
+    token = _numeric_mode.set(mode)
+
+    try:
+        yield
+    finally:
+        _numeric_mode.reset(token)
+
+
+def use_floats(value: Number) -> t.TypeGuard[float]:
+    """
+    Returns whether calculations involving the given value should use float multipliers.
+    """
+    if _numeric_mode.get() != "float":
+        return False
+
+    return not isinstance(value, (decimal.Decimal, fractions.Fraction))
 
 
 def add(
-    lhs: FloatOrDecimal, rhs: FloatOrDecimal, type_preference: TypePreference = None
-) -> FloatOrDecimal:
+    lhs: Number, rhs: Number, type_preference: TypePreference = None
+) -> Number:
     return apply_operator(operator.add, lhs, rhs, type_preference)
 
 
 def subtract(
-    lhs: FloatOrDecimal, rhs: FloatOrDecimal, type_preference: TypePreference = None
-) -> FloatOrDecimal:
+    lhs: Number, rhs: Number, type_preference: TypePreference = None
+) -> Number:
     return apply_operator(operator.sub, lhs, rhs, type_preference)
 
 
 def multiply(
-    lhs: FloatOrDecimal, rhs: FloatOrDecimal, type_preference: TypePreference = None
-) -> FloatOrDecimal:
+    lhs: Number, rhs: Number, type_preference: TypePreference = None
+) -> Number:
     return apply_operator(operator.mul, lhs, rhs, type_preference)
 
 
 def divide(
-    lhs: FloatOrDecimal, rhs: FloatOrDecimal, type_preference: TypePreference = None
-) -> FloatOrDecimal:
+    lhs: Number, rhs: Number, type_preference: TypePreference = None
+) -> Number:
     return apply_operator(operator.truediv, lhs, rhs, type_preference)
 
 
 def apply_operator(
     operator: t.Callable[[float, float], float],
-    lhs: FloatOrDecimal,
-    rhs: FloatOrDecimal,
+    lhs: Number,
+    rhs: Number,
     type_preference: TypePreference = None,
-) -> FloatOrDecimal:
+) -> Number:
     try:
         return operator(lhs, rhs)  # type: ignore
     except TypeError:
@@ -50,7 +125,36 @@ def apply_operator(
     if type_preference is None:
         type_preference = type(lhs)
 
-    lhs = type_preference(lhs)
-    rhs = type_preference(rhs)
+    lhs = convert(lhs, type_preference)
+    rhs = convert(rhs, type_preference)
 
     return operator(lhs, rhs)  # type: ignore
+
+
+def convert(value: Number, type_: type[Number]) -> Number:
+    """
+    Converts a number to the given type. Unlike calling `type_(value)`, this also works for
+    converting a `Fraction` to a `Decimal`.
+    """
+    if type_ is decimal.Decimal and isinstance(value, fractions.Fraction):
+        return decimal.Decimal(value.numerator) / decimal.Decimal(value.denominator)
+
+    return type_(value)  # type: ignore
+
+
+def _initial_numeric_mode() -> NumericMode:
+    mode = os.environ.get("U_NUMERIC_MODE", "decimal")
+
+    if mode not in NUMERIC_MODES:
+        warnings.warn(
+            f"Ignoring invalid U_NUMERIC_MODE {mode!r}, expected one of {NUMERIC_MODES}",
+            RuntimeWarning,
+        )
+        return "decimal"
+
+    return t.cast(NumericMode, mode)
+
+
+_numeric_mode = contextvars.ContextVar[NumericMode](
+    "numeric_mode", default=_initial_numeric_mode()
+)
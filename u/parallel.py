@@ -0,0 +1,346 @@
+"""
+Functions that split large batches of work across multiple processes, to get around the GIL.
+
+Worker processes start with a freshly imported `u`, which doesn't know about any units or
+quantities that were created at runtime. Because of that, each chunk of work is sent along with a
+snapshot of the parent's unit registry. Quantity classes that can't be imported in the worker (for
+example because they were created dynamically) are recreated there, once per class in the parent.
+
+By default, every call starts (and shuts down) its own `ProcessPoolExecutor`. To avoid paying for
+that on every call, pass the same `executor` to several calls.
+
+Results are sent back as compact `array.array`s rather than lists of `Quantity` objects.
+
+As always with `multiprocessing`, the calling code must be guarded with
+`if __name__ == "__main__":` when the "spawn" start method is used.
+"""
+
+from __future__ import annotations
+
+import array
+import concurrent.futures
+import contextlib
+import fractions
+import importlib
+import itertools
+import typing as t
+
+import u
+
+from .capital_quantities import QUANTITY
+from .maths import Number
+from .quantity import get_quantity_for_exponents
+from .unit import lookup_unit, units_by_symbol
+
+
+__all__ = ["map_convert", "parse_many"]
+
+
+Q = t.TypeVar("Q", bound=QUANTITY)
+
+# A picklable description of a `QUANTITY` class (its module, qualname, and - if it can't be
+# imported by that name - its `id()` in the parent, to tell apart classes with the same name) ...
+QuantityClassSpec = tuple[str, str, t.Optional[int]]
+# ... of a quantity (its exponents) ...
+QuantitySpec = tuple[tuple[QuantityClassSpec, int], ...]
+# ... and of a unit (its quantity, symbol, multiplier and systems)
+UnitSpec = tuple[QuantitySpec, str, Number, tuple[str, ...]]
+
+ParsedChunk = tuple["array.array[float]", "array.array[int]", list[UnitSpec]]
+
+
+def map_convert(
+    values: t.Sequence[float],
+    unit: u.Unit[Q],
+    to: u.Unit[Q],
+    /,
+    *,
+    workers: int | None = None,
+    chunk_size: int = 1_000_000,
+    executor: concurrent.futures.Executor | None = None,
+) -> array.array[float]:
+    """
+    Converts many numbers from `unit` to `to`, using the units' `float_multiplier`s. Raises a
+    `ValueError` if the units are incompatible.
+
+    The work is done by `executor` if one is passed, or else by a new pool of `workers` processes.
+
+    Since the conversion itself is only a multiplication, this is only worthwhile for very large
+    inputs. For anything else, prefer `u.stream.to_numbers` or numpy.
+
+    Added in version 4.1.
+    """
+    if not unit.is_compatible_with(to):
+        raise ValueError(
+            f"Cannot convert {unit} (a unit of {unit.quantity}) to {to} (a unit of {to.quantity})"
+        )
+
+    factor = unit.float_multiplier / to.float_multiplier
+    chunks = [
+        array.array("d", values[start : start + chunk_size])
+        for start in range(0, len(values), chunk_size)
+    ]
+
+    result = array.array("d")
+
+    with _executor(executor, workers) as pool:
+        for chunk in pool.map(_multiply_chunk, chunks, itertools.repeat(factor)):
+            result.extend(chunk)
+
+    return result
+
+
+@t.overload
+def parse_many(
+    texts: t.Sequence[str],
+    quantity: type[u.Quantity[Q]] = ...,
+    /,
+    *,
+    to: None = None,
+    workers: int | None = ...,
+    chunk_size: int = ...,
+    executor: concurrent.futures.Executor | None = ...,
+) -> u.QuantityColumn[Q]: ...
+
+
+@t.overload
+def parse_many(
+    texts: t.Sequence[str],
+    quantity: type[u.Quantity[Q]] = ...,
+    /,
+    *,
+    to: u.Unit[Q],
+    workers: int | None = ...,
+    chunk_size: int = ...,
+    executor: concurrent.futures.Executor | None = ...,
+) -> array.array[float]: ...
+
+
+def parse_many(
+    texts: t.Sequence[str],
+    quantity: type[u.Quantity] = u.Quantity,
+    /,
+    *,
+    to: u.Unit | None = None,
+    workers: int | None = None,
+    chunk_size: int = 100_000,
+    executor: concurrent.futures.Executor | None = None,
+) -> u.QuantityColumn | array.array[float]:
+    """
+    Like `Quantity.parse_many`, but the strings are parsed by `executor` if one is passed, or else
+    by a new pool of `workers` processes.
+
+    ```python
+    if __name__ == "__main__":
+        with concurrent.futures.ProcessPoolExecutor(8) as executor:
+            for lines in batches:
+                seconds = u.parallel.parse_many(lines, u.Duration, to=u.seconds, executor=executor)
+    ```
+
+    Added in version 4.1.
+    """
+    quantity_spec = _quantity_to_spec(quantity) if quantity is not u.Quantity else None
+    to_spec = None if to is None else _unit_to_spec(to)
+
+    registry = _registry_snapshot()
+    chunks = [texts[start : start + chunk_size] for start in range(0, len(texts), chunk_size)]
+
+    with _executor(executor, workers) as pool:
+        results = pool.map(
+            _parse_chunk,
+            chunks,
+            itertools.repeat(registry),
+            itertools.repeat(quantity_spec),
+            itertools.repeat(to_spec),
+        )
+
+        if to is not None:
+            numbers = array.array("d")
+            for values, _, _ in results:
+                numbers.extend(values)
+
+            return numbers
+
+        column = u.QuantityColumn[t.Any]()
+
+        for values, unit_indices, unit_specs in results:
+            # Translate the chunk's unit indices into the column's unit indices
+            column_indices = [column._unit_index(_unit_from_spec(spec)) for spec in unit_specs]
+
+            column._values.extend(values)
+            column._unit_indices.extend(column_indices[index] for index in unit_indices)
+
+        return column
+
+
+@contextlib.contextmanager
+def _executor(
+    executor: concurrent.futures.Executor | None, workers: int | None
+) -> t.Iterator[concurrent.futures.Executor]:
+    if executor is not None:
+        yield executor
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        yield pool
+
+
+def _multiply_chunk(chunk: array.array[float], factor: float) -> array.array[float]:
+    return array.array("d", [value * factor for value in chunk])
+
+
+def _parse_chunk(
+    texts: t.Sequence[str],
+    registry: list[UnitSpec],
+    quantity_spec: QuantitySpec | None,
+    to_spec: UnitSpec | None,
+) -> ParsedChunk:
+    _register_units(registry)
+
+    quantity = u.Quantity if quantity_spec is None else _quantity_from_spec(quantity_spec)
+    to = None if to_spec is None else _unit_from_spec(to_spec)
+
+    if to is not None:
+        return quantity.parse_many(texts, to=to), array.array("I"), []
+
+    column = quantity.parse_many(texts)
+
+    unit_specs = [_unit_to_spec(unit) for unit in column._units]
+    return column._values, column._unit_indices, unit_specs
+
+
+def _registry_snapshot() -> list[UnitSpec]:
+    return [_unit_to_spec(unit) for unit in units_by_symbol.values()]
+
+
+def _register_units(unit_specs: list[UnitSpec]) -> None:
+    missing = list[UnitSpec]()
+
+    for spec in unit_specs:
+        quantity_spec, symbol, _, _ = spec
+        unit = units_by_symbol.get(symbol)
+
+        if unit is None:
+            missing.append(spec)
+            continue
+
+        # The unit already exists in this process (because the worker was forked, or because it
+        # imported the module that created it), so its quantity classes are the ones to use
+        for (class_spec, _), cls in zip(quantity_spec, unit.quantity.exponents):
+            # (The module names may differ, since the "__main__" module is "__mp_main__" there)
+            if class_spec[1] == cls.__qualname__:
+                _link_quantity_class(class_spec, cls)
+
+    for quantity_spec, symbol, multiplier, systems in missing:
+        u.Unit(_quantity_from_spec(quantity_spec), symbol, multiplier, systems)
+
+
+def _unit_to_spec(unit: u.Unit) -> UnitSpec:
+    return (
+        _quantity_to_spec(unit.quantity),
+        unit.symbol,
+        _exact_multiplier(unit),
+        tuple(unit.systems),
+    )
+
+
+def _exact_multiplier(unit: u.Unit) -> Number:
+    # The Decimal `multiplier` is what identifies a unit, so it must be reproduced exactly. If the
+    # unit was created with a Fraction, the Decimal is only an approximation, though.
+    if fractions.Fraction(unit.multiplier) == unit.fraction_multiplier:
+        return unit.multiplier
+
+    return unit.fraction_multiplier
+
+
+def _unit_from_spec(spec: UnitSpec) -> u.Unit:
+    quantity_spec, symbol, multiplier, systems = spec
+    return lookup_unit(_quantity_from_spec(quantity_spec), symbol, multiplier, systems)
+
+
+def _quantity_to_spec(quantity: type[u.Quantity]) -> QuantitySpec:
+    return tuple(
+        (_quantity_class_to_spec(quantity_class), exponent)
+        for quantity_class, exponent in quantity.exponents.items()
+    )
+
+
+def _quantity_class_to_spec(cls: type[QUANTITY]) -> QuantityClassSpec:
+    # Classes that stand in for one of the parent's classes are described the way the parent did
+    try:
+        return _specs_by_quantity_class[cls]
+    except KeyError:
+        pass
+
+    module_name, qualname = cls.__module__, cls.__qualname__
+
+    if _import_quantity_class(module_name, qualname) is cls:
+        return module_name, qualname, None
+
+    return module_name, qualname, id(cls)
+
+
+def _quantity_from_spec(spec: QuantitySpec) -> type[u.Quantity]:
+    exponents = {_quantity_class_from_spec(class_spec): exponent for class_spec, exponent in spec}
+    # A `QuantityAlias` stands in for the `Quantity[...]` class it describes
+    return t.cast(type[u.Quantity], get_quantity_for_exponents(exponents))
+
+
+# The classes in this process that stand in for the classes described by the parent's specs
+_quantity_classes_by_spec: dict[QuantityClassSpec, type[QUANTITY]] = {}
+_specs_by_quantity_class: dict[type[QUANTITY], QuantityClassSpec] = {}
+
+
+def _link_quantity_class(spec: QuantityClassSpec, cls: type[QUANTITY]) -> None:
+    _quantity_classes_by_spec.setdefault(spec, cls)
+    _specs_by_quantity_class.setdefault(cls, spec)
+
+
+def _quantity_class_from_spec(spec: QuantityClassSpec) -> type[QUANTITY]:
+    try:
+        return _quantity_classes_by_spec[spec]
+    except KeyError:
+        pass
+
+    module_name, qualname, class_id = spec
+    cls = None
+
+    if class_id is None:
+        cls = _import_quantity_class(module_name, qualname)
+    else:
+        # The class can't be imported, but it may still exist in this process (because this is the
+        # parent, or the worker was forked from it)
+        for subclass in _iter_quantity_classes(QUANTITY):
+            if id(subclass) == class_id and (subclass.__module__, subclass.__qualname__) == (
+                module_name,
+                qualname,
+            ):
+                cls = subclass
+                break
+
+    if cls is None:
+        namespace = {"__module__": module_name, "__qualname__": qualname}
+        cls = type(qualname.rpartition(".")[2], (QUANTITY,), namespace)
+
+    _link_quantity_class(spec, cls)
+    return cls
+
+
+def _import_quantity_class(module_name: str, qualname: str) -> type[QUANTITY] | None:
+    try:
+        obj: t.Any = importlib.import_module(module_name)
+        for name in qualname.split("."):
+            obj = getattr(obj, name)
+    except (ImportError, AttributeError):
+        return None
+
+    if isinstance(obj, type) and issubclass(obj, QUANTITY):
+        return obj
+
+    return None
+
+
+def _iter_quantity_classes(cls: type[QUANTITY]) -> t.Iterator[type[QUANTITY]]:
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _iter_quantity_classes(subclass)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import decimal
+import fractions
 import typing as t
 
 import u
 
-from .maths import multiply
 from ._utils import cached
 
 __all__ = [
@@ -46,7 +46,23 @@ Q = t.TypeVar("Q", bound="u.QUANTITY")
 
 
 prefix_by_symbol = dict[str, "Prefix"]()
-max_prefix_length = 0
+
+
+class PrefixTrieNode:
+    """
+    A node in the trie of all prefix symbols.
+    """
+
+    __slots__ = ("children", "prefix")
+
+    def __init__(self) -> None:
+        # The next node for each character
+        self.children = dict[str, PrefixTrieNode]()
+        # The prefix whose symbol ends at this node, if any
+        self.prefix: Prefix | None = None
+
+
+prefix_trie = PrefixTrieNode()
 
 
 class Prefix:
@@ -56,8 +72,11 @@ class Prefix:
 
         prefix_by_symbol[symbol] = self
 
-        global max_prefix_length
-        max_prefix_length = max(max_prefix_length, len(symbol))
+        node = prefix_trie
+        for char in symbol:
+            node = node.children.setdefault(char, PrefixTrieNode())
+
+        node.prefix = self
 
     @classmethod
     def from_symbol(cls, symbol: str) -> Prefix:
@@ -74,7 +93,7 @@ class Prefix:
         return u.unit.lookup_unit(
             unit.quantity,
             self.symbol + unit.symbol,
-            multiply(self.multiplier, unit.multiplier, decimal.Decimal),
+            fractions.Fraction(self.multiplier) * unit.fraction_multiplier,
             unit.systems,
         )
 
@@ -82,6 +101,33 @@ class Prefix:
         return f"<Prefix {self.symbol}>"
 
 
+def find_prefixes(symbol: str) -> list[Prefix]:
+    """
+    Returns all prefixes that the given symbol starts with, longest first. Prefixes that span the
+    entire symbol (and the empty prefix) are excluded, since a prefix must be followed by a unit.
+
+    ```
+    >>> find_prefixes("dam")
+    [<Prefix da>, <Prefix d>]
+    ```
+    """
+    result = list[Prefix]()
+    node = prefix_trie
+
+    for char in symbol[:-1]:
+        child = node.children.get(char)
+        if child is None:
+            break
+
+        node = child
+
+        if node.prefix is not None:
+            result.append(node.prefix)
+
+    result.reverse()
+    return result
+
+
 DUMMY_PREFIX = Prefix("", 1)
 
 
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import array
 import collections
+import datetime
 import decimal
+import fractions
 import math
+import operator
 import re
 import types
 import typing_extensions as t
@@ -11,7 +15,16 @@ import u
 
 from ._utils import UNION_TYPES, ExponentDict, str_exponent
 from .capital_quantities import QUANTITY, DIV, MUL, MUL_
-from .maths import FloatOrDecimal, TypePreference, add, subtract, multiply, divide
+from .maths import (
+    Number,
+    TypePreference,
+    add,
+    subtract,
+    multiply,
+    divide,
+    convert,
+    use_floats,
+)
 
 
 __all__ = ["Quantity", "NullableQuantity"]
@@ -25,7 +38,10 @@ Q2 = t.TypeVar("Q2", bound=QUANTITY)
 V = t.TypeVar("V", float, decimal.Decimal)
 
 
-NUMBER_WITH_UNIT_REGEX = re.compile(r"([+-]?[0-9._]+)(.*)")
+# A python-style number literal, optionally in scientific notation, followed by the unit
+NUMBER_WITH_UNIT_REGEX = re.compile(
+    r"\s*([+-]?(?:[0-9][0-9_]*(?:\.[0-9_]*)?|\.[0-9][0-9_]*)(?:[eE][+-]?[0-9]+)?)(.*)", re.DOTALL
+)
 
 # We support a subset of python's usual formatting spec. Reference:
 # https://docs.python.org/3/library/string.html#formatspec
@@ -39,13 +55,20 @@ class QuantityAlias(types.GenericAlias):
     exponents: ExponentDict
     units: t.Sequence[u.Unit]
     prefixes: t.Sequence[u.Prefix]
+    _base_unit: u.Unit | None
+    _args: tuple[t.Any, ...] | None
 
     def __new__(cls, typ, subtype, exponents: ExponentDict):
-        self = super().__new__(cls, typ, subtype)
+        # The `subtype` can be `None`, in which case a suitable combination of `MUL`s and `DIV`s is
+        # created on demand. (Building these typing constructs is surprisingly slow, and they're
+        # only needed if someone introspects the alias.)
+        self = super().__new__(cls, typ, QUANTITY if subtype is None else subtype)
 
+        self._args = None if subtype is None else (subtype,)
         self.exponents = exponents
         self.units = []
         self.prefixes = u.STANDARD_SI_PREFIXES
+        self._base_unit = None
 
         return self
 
@@ -60,10 +83,34 @@ class QuantityAlias(types.GenericAlias):
 
         return super().__getattribute__(name)
 
+    @property
+    def __args__(self) -> tuple[t.Any, ...]:
+        args = self._args
+
+        if args is None:
+            args = self._args = (make_quantity_caps(self.exponents),)
+
+        return args
+
     @property
     def base_unit(self) -> u.Unit:
-        if self.units:
-            return next(unit for unit in self.units if unit.multiplier == 1)
+        # This is computed lazily and cached, because the units might not be registered yet. The
+        # cache is reset by the `Unit` constructor whenever a new unit is registered.
+        base_unit = self._base_unit
+
+        if base_unit is None:
+            base_unit = self._base_unit = self._find_base_unit()
+
+        return base_unit
+
+    def _find_base_unit(self) -> u.Unit:
+        for unit in self.units:
+            if unit.multiplier == 1:
+                return unit
+
+        # Base quantities can't be decomposed any further
+        if list(self.exponents.values()) == [1]:
+            raise ValueError(f"{self} has no unit with a multiplier of 1")
 
         unit = u.one
         for quantity, exponent in self.exponents.items():
@@ -74,6 +121,12 @@ class QuantityAlias(types.GenericAlias):
     def parse(self, *args, **kwargs):
         return Quantity.parse.__func__(self, *args, **kwargs)  # type: ignore
 
+    def parse_many(self, *args, **kwargs):
+        return Quantity.parse_many.__func__(self, *args, **kwargs)  # type: ignore
+
+    def from_timedelta(self, *args, **kwargs):
+        return Quantity.from_timedelta.__func__(self, *args, **kwargs)  # type: ignore
+
     def typecheck(self, value: Quantity, /) -> bool:
         return value.quantity == self
 
@@ -155,14 +208,75 @@ class NotFullyParameterized(Exception):
     pass
 
 
+def make_quantity_caps(exponents: t.Mapping[type[QUANTITY], int]) -> type[QUANTITY]:
+    """
+    Builds a `MUL`/`DIV` construct with the given exponents. This is the inverse of
+    `get_exponents`.
+
+    ```
+    >>> make_quantity_caps({DISTANCE: 1, DURATION: -2})
+    DIV[DISTANCE, MUL_[DURATION, DURATION]]
+    ```
+    """
+    numerator = [quantity for quantity, exp in exponents.items() for _ in range(exp)]
+    denominator = [quantity for quantity, exp in exponents.items() for _ in range(-exp)]
+
+    if not denominator:
+        return _multiply_quantity_caps(numerator)
+
+    numerator_caps = _multiply_quantity_caps(numerator)
+    denominator_caps = _multiply_quantity_caps(denominator)
+    return DIV[numerator_caps, denominator_caps]  # type: ignore
+
+
+def _multiply_quantity_caps(quantities: t.Sequence[type[QUANTITY]]) -> type[QUANTITY]:
+    if not quantities:
+        return u.ONE
+
+    result = quantities[0]
+    for quantity in quantities[1:]:
+        result = MUL_[result, quantity]  # type: ignore
+
+    return result
+
+
+def get_quantity_for_exponents(
+    exponents: t.Mapping[type[QUANTITY], int], quantity_caps: t.Any = None
+) -> QuantityAlias:
+    """
+    Returns the `QuantityAlias` with the given exponents, creating it if necessary. If no
+    `quantity_caps` are given, they'll be created on demand.
+    """
+    exponents = {quantity: exp for quantity, exp in exponents.items() if exp}
+    frozen_exponents = frozenset(exponents.items())
+
+    try:
+        return QUANTITY_ALIASES_BY_EXPONENTS[frozen_exponents]
+    except KeyError:
+        pass
+
+    alias = QuantityAlias(Quantity, quantity_caps, ExponentDict(exponents))
+
+    QUANTITY_ALIASES_BY_EXPONENTS[frozen_exponents] = alias
+    return alias
+
+
 # Regular properties can't be annotated to return Units that match the Quantity (for example, make
 # `Speed.base_unit` return a `Unit[SPEED]`), so we have to use custom descriptors. They're designed
 # to be used as decorators because that way the IDE preserves the docstring.
+# Type checkers don't understand the dynamic base class of `QuantityMeta`, so they treat these as
+# if they were defined on `Quantity` itself and pass `None` as the instance. Hence the overloads.
 class UnitProperty:
     def __init__(self, func):
         self.func = func
 
-    def __get__(self, instance: type[Quantity[Q_co]], owner: t.Any = None) -> u.Unit[Q_co]:
+    @t.overload
+    def __get__(self, instance: None, owner: type[Quantity[Q_co]]) -> u.Unit[Q_co]: ...
+
+    @t.overload
+    def __get__(self, instance: type[Quantity[Q_co]], owner: t.Any = None) -> u.Unit[Q_co]: ...
+
+    def __get__(self, instance, owner=None):
         return self.func(instance)
 
 
@@ -170,9 +284,15 @@ class UnitSequenceProperty:
     def __init__(self, func):
         self.func = func
 
+    @t.overload
+    def __get__(self, instance: None, owner: type[Quantity[Q_co]]) -> t.Sequence[u.Unit[Q_co]]: ...
+
+    @t.overload
     def __get__(
         self, instance: type[Quantity[Q_co]], owner: t.Any = None
-    ) -> t.Sequence[u.Unit[Q_co]]:
+    ) -> t.Sequence[u.Unit[Q_co]]: ...
+
+    def __get__(self, instance, owner=None):
         return self.func(instance)
 
 
@@ -236,6 +356,10 @@ class Quantity(t.Generic[Q_co], metaclass=QuantityMeta):
 
     @classmethod  # This is only here to shut up the type checker
     def __class_getitem(cls, quantity_caps) -> QuantityAlias:
+        # `typing.get_type_hints()` passes the arguments as a tuple
+        if isinstance(quantity_caps, tuple) and len(quantity_caps) == 1:
+            [quantity_caps] = quantity_caps
+
         # Make sure that all equivalent quantities return the same QuantityAlias
         try:
             if isinstance(quantity_caps, t.TypeVar):
@@ -245,17 +369,7 @@ class Quantity(t.Generic[Q_co], metaclass=QuantityMeta):
         except NotFullyParameterized:
             return super().__class_getitem__(quantity_caps)  # type: ignore (wtf?)
 
-        frozen_exponents = frozenset(exponents.items())
-
-        try:
-            return QUANTITY_ALIASES_BY_EXPONENTS[frozen_exponents]
-        except KeyError:
-            pass
-
-        alias = QuantityAlias(cls, quantity_caps, exponents)
-
-        QUANTITY_ALIASES_BY_EXPONENTS[frozen_exponents] = alias
-        return alias
+        return get_quantity_for_exponents(exponents, quantity_caps)
 
     if not t.TYPE_CHECKING:
         __class_getitem__ = __class_getitem
@@ -264,9 +378,9 @@ class Quantity(t.Generic[Q_co], metaclass=QuantityMeta):
     def __init__(self, value: t.Literal[0]): ...
 
     @t.overload
-    def __init__(self, value: float | decimal.Decimal, unit: u.Unit[Q_co]): ...
+    def __init__(self, value: float | decimal.Decimal | fractions.Fraction, unit: u.Unit[Q_co]): ...
 
-    def __init__(self, value: FloatOrDecimal, unit: u.Unit[Q_co] | None = None):
+    def __init__(self, value: Number, unit: u.Unit[Q_co] | None = None):
         # We actually can't implement the case with the optional unit here because `self` is a
         # `Quantity` instance and not a `QuantityAlias`. So `QuantityAlias.__call__` is responsible
         # for giving us a unit.
@@ -275,6 +389,8 @@ class Quantity(t.Generic[Q_co], metaclass=QuantityMeta):
 
         self._value = value
         self._unit = unit
+        self._base_value: float | None = None
+        self._comparison_key: float | None = None
 
     @property
     def quantity(self) -> type[Quantity[Q_co]]:
@@ -317,21 +433,48 @@ class Quantity(t.Generic[Q_co], metaclass=QuantityMeta):
         Added in version 3.0.
         """
         num = self._to_number(unit, decimal.Decimal)
-        return decimal.Decimal(num)
+        return t.cast(decimal.Decimal, convert(num, decimal.Decimal))
+
+    def to_fraction(self, unit: u.Unit[Q_co]) -> fractions.Fraction:
+        """
+        Converts this measurement to an exact number in the given unit, using the units'
+        `fraction_multiplier`s. For example:
+
+        ```python
+        >>> u.seconds(1).to_fraction(u.minutes)
+        Fraction(1, 60)
+        ```
+
+        Raises a `ValueError` if an incompatible unit is passed.
+
+        Added in version 4.1.
+        """
+        num = self._to_number(unit, fractions.Fraction)
+        return fractions.Fraction(num)
 
     def _to_number(
         self, unit: u.Unit[Q_co], type_preference: TypePreference = None
-    ) -> FloatOrDecimal:
-        if self.quantity != unit.quantity:
+    ) -> Number:
+        if self.quantity is not unit.quantity and self.quantity != unit.quantity:
             raise ValueError(
                 f"Cannot convert {self} (a {self.quantity}) to {unit} (a unit of {unit.quantity})"
             )
 
+        if type_preference is fractions.Fraction or isinstance(self._value, fractions.Fraction):
+            return (
+                fractions.Fraction(self._value)
+                * self._unit.fraction_multiplier
+                / unit.fraction_multiplier
+            )
+
+        if type_preference is not decimal.Decimal and use_floats(self._value):
+            return self._value * (self._unit.float_multiplier / unit.float_multiplier)
+
         multiplier = divide(self._unit.multiplier, unit.multiplier, type_preference)
         return multiply(self._value, multiplier, type_preference)
 
     @classmethod
-    def parse(cls, text: str, /) -> Quantity[Q_co]:
+    def parse(cls, text: str, /, number_type: type[Number] = float) -> Quantity[Q_co]:
         """
         Parses a string containing a number followed by a unit.
 
@@ -354,17 +497,22 @@ class Quantity(t.Generic[Q_co], metaclass=QuantityMeta):
         >>> u.Duration.parse('5 km')
         ValueError: Cannot parse '5 km' as a Duration
         ```
-        """
 
-        match = NUMBER_WITH_UNIT_REGEX.match(text)
-        if not match:
-            raise ValueError(f"Cannot parse {text!r} as a Quantity")
+        The number may use scientific notation, and the unit may contain exponents (written as
+        superscripts or with `^` or `**`) and parentheses:
+
+        ```python
+        >>> u.Quantity.parse('1.5e-3 (m/s)^2')
+        0.0015 m²/s²
+        ```
 
-        number_str, unit_str = match.groups()
+        Integers are parsed exactly. Other numbers are parsed as the given `number_type`, so passing
+        `decimal.Decimal` or `fractions.Fraction` preserves all digits.
 
-        number = float(number_str)
-        if number.is_integer():
-            number = int(number)
+        Added in version 4.1: Scientific notation, ASCII exponents, parentheses and `number_type`.
+        """
+
+        number, unit_str = split_number_and_unit(text, number_type)
 
         try:
             unit = u.Unit.parse(unit_str, cls)
@@ -373,6 +521,119 @@ class Quantity(t.Generic[Q_co], metaclass=QuantityMeta):
 
         return cls(number, unit)
 
+    @t.overload
+    @classmethod
+    def parse_many(
+        cls, texts: t.Iterable[str], /, *, to: None = None
+    ) -> u.QuantityColumn[Q_co]: ...
+
+    @t.overload
+    @classmethod
+    def parse_many(cls, texts: t.Iterable[str], /, *, to: u.Unit[Q_co]) -> array.array[float]: ...
+
+    @classmethod
+    def parse_many(
+        cls, texts: t.Iterable[str], /, *, to: u.Unit[Q_co] | None = None
+    ) -> u.QuantityColumn[Q_co] | array.array[float]:
+        """
+        Parses many strings like `Quantity.parse`, but returns the results in a compact
+        `QuantityColumn` instead of creating a `Quantity` object for each string. Each distinct
+        unit is only parsed once.
+
+        ```python
+        >>> column = u.Distance.parse_many(["5 km", "300 m", "1.2 km"])
+        >>> list(column)
+        [5.0 km, 300.0 m, 1.2 km]
+        ```
+
+        If a unit is passed as `to`, all values are converted to that unit and returned as an
+        array of floats instead:
+
+        ```python
+        >>> u.Distance.parse_many(["5 km", "300 m"], to=u.meters)
+        array('d', [5000.0, 300.0])
+        ```
+
+        Unlike `Quantity.parse`, the numbers are always parsed as floats.
+
+        Added in version 4.1.
+        """
+        column = u.QuantityColumn[Q_co]()
+        values = column._values
+        unit_indices = column._unit_indices
+
+        # Maps each distinct unit string to the index of its unit in the column
+        indices_by_unit_str = dict[str, int]()
+
+        for text in texts:
+            number, unit_str = split_number_and_unit(text)
+
+            try:
+                index = indices_by_unit_str[unit_str]
+            except KeyError:
+                try:
+                    unit = u.Unit.parse(unit_str, cls)
+                except ValueError as e:
+                    raise ValueError(f"Cannot parse {text!r} as a {cls!r}") from e
+
+                index = indices_by_unit_str[unit_str] = column._unit_index(unit)
+
+            values.append(float(number))
+            unit_indices.append(index)
+
+        if to is None:
+            return column
+
+        return column.to_numbers(to)
+
+    @classmethod
+    def from_timedelta(
+        cls: type[Quantity[u.DURATION]], timedelta: datetime.timedelta, /
+    ) -> Quantity[u.DURATION]:
+        """
+        Converts a `datetime.timedelta` to a duration. The conversion is exact: the value is an
+        integer number of seconds, milliseconds or microseconds, whichever is the largest unit that
+        can represent the timedelta without a fractional part.
+
+        ```python
+        >>> u.Duration.from_timedelta(datetime.timedelta(minutes=1, milliseconds=500))
+        60500 ms
+        ```
+
+        Added in version 4.1.
+        """
+        if cls is not Quantity and cls != u.Duration:
+            raise TypeError(f"Cannot create a {cls!r} from a timedelta")
+
+        microseconds = (timedelta.days * 86_400 + timedelta.seconds) * 1_000_000
+        microseconds += timedelta.microseconds
+
+        if microseconds % 1_000_000 == 0:
+            return u.seconds(microseconds // 1_000_000)
+
+        if microseconds % 1_000 == 0:
+            return u.milli(u.seconds)(microseconds // 1_000)
+
+        return u.micro(u.seconds)(microseconds)
+
+    def to_timedelta(self: Quantity[u.DURATION]) -> datetime.timedelta:
+        """
+        Converts this duration to a `datetime.timedelta`. The conversion is exact, except that the
+        result is rounded to the nearest microsecond (the resolution of `timedelta`).
+
+        ```python
+        >>> u.minutes(1.5).to_timedelta()
+        datetime.timedelta(seconds=90)
+        ```
+
+        Added in version 4.1.
+        """
+        if not self._unit.is_compatible_with(u.seconds):
+            raise TypeError(f"Cannot convert {self} (a {self.quantity}) to a timedelta")
+
+        microseconds = fractions.Fraction(self._value) * self._unit.fraction_multiplier * 1_000_000
+        return datetime.timedelta(microseconds=round(microseconds))
+
     @classmethod
     def typecheck(cls, value: Quantity, /) -> t.TypeGuard[Quantity[Q_co]]:
         """
@@ -412,83 +673,61 @@ class Quantity(t.Generic[Q_co], metaclass=QuantityMeta):
         return bool(self._value)
 
     def __float__(self) -> float:
-        return float(self._value) * float(self._unit.multiplier)
+        # The value in the base unit is cached, since it's used for the comparison key
+        base_value = self._base_value
+
+        if base_value is None:
+            base_value = self._base_value = float(self._value) * self._unit.float_multiplier
+
+        return base_value
 
     def __neg__(self) -> Quantity[Q_co]:
         return Quantity(-self._value, self._unit)
 
     def __hash__(self) -> int:
-        return hash((self._value, self._unit))
+        return hash(self._get_comparison_key())
 
     def __eq__(self, quantity: object, /) -> bool:
-        if quantity == 0:
-            num = float(self)
-            expected = 0.0
-        elif not isinstance(quantity, __class__):
-            return NotImplemented
-        elif not self.is_compatible_with(quantity):
-            return False
-        else:
-            num = self.to_number(quantity._unit)
-            expected = float(quantity._value)
-
-        return num == expected
+        return self._compare(quantity, operator.eq)
 
     def __lt__(self, quantity: NullableQuantity[Q_co], /) -> bool:
-        if quantity == 0:
-            num = float(self)
-            expected = 0.0
-        elif not isinstance(quantity, __class__):
-            return NotImplemented
-        elif not self.is_compatible_with(quantity):
-            return False
-        else:
-            num = self.to_number(quantity._unit)
-            expected = float(quantity._value)
-
-        return num < expected
+        return self._compare(quantity, operator.lt)
 
     def __le__(self, quantity: object, /) -> bool:
-        if quantity == 0:
-            num = float(self)
-            expected = 0.0
-        elif not isinstance(quantity, __class__):
-            return NotImplemented
-        elif not self.is_compatible_with(quantity):
-            return False
-        else:
-            num = self.to_number(quantity._unit)
-            expected = float(quantity._value)
-
-        return num <= expected
+        return self._compare(quantity, operator.le)
 
     def __gt__(self, quantity: object, /) -> bool:
-        if quantity == 0:
-            num = float(self)
-            expected = 0.0
-        elif not isinstance(quantity, __class__):
-            return NotImplemented
-        elif not self.is_compatible_with(quantity):
-            return False
-        else:
-            num = self.to_number(quantity._unit)
-            expected = float(quantity._value)
-
-        return num > expected
+        return self._compare(quantity, operator.gt)
 
     def __ge__(self, quantity: object, /) -> bool:
+        return self._compare(quantity, operator.ge)
+
+    def _compare(self, quantity: object, compare: t.Callable[[t.Any, t.Any], bool]) -> bool:
+        if isinstance(quantity, Quantity):
+            if not self.is_compatible_with(quantity):
+                return False
+
+            if quantity._unit is self._unit:
+                return compare(float(self._value), float(quantity._value))
+
+            return compare(self._get_comparison_key(), quantity._get_comparison_key())
+
         if quantity == 0:
-            num = float(self)
-            expected = 0.0
-        elif not isinstance(quantity, __class__):
-            return NotImplemented
-        elif not self.is_compatible_with(quantity):
-            return False
-        else:
-            num = self.to_number(quantity._unit)
-            expected = float(quantity._value)
+            return compare(float(self._value), 0.0)
 
-        return num >= expected
+        return NotImplemented
+
+    def _get_comparison_key(self) -> float:
+        # The value in the base unit, rounded to 15 significant digits. This is what `__hash__` and
+        # the comparisons of different units are based on, so that quantities that compare equal
+        # also have the same hash. The rounding hides the error of the float conversion, which
+        # would otherwise make `u.inches(1)` (0.0254 m) differ from `u.cm(2.54)` (0.0254...02 m).
+        key = self._comparison_key
+
+        if key is None:
+            key = self._comparison_key = float(format(self.__float__(), ".15g"))
+
+        return key
 
     def __add__(self, quantity: NullableQuantity[Q_co], /) -> Quantity[Q_co]:
         if quantity == 0:
@@ -572,6 +811,9 @@ class Quantity(t.Generic[Q_co], metaclass=QuantityMeta):
         else:
             number_format = None
 
+        if "+" in format_:
+            return u.decomposition.format_decomposition(self, format_, number_format)
+
         if ":" in format_:
             min_unit_symbol, max_unit_symbol = format_.split(":", 1)
             min_unit = u.Unit.parse(min_unit_symbol, quantity=self.quantity)
@@ -579,9 +821,11 @@ class Quantity(t.Generic[Q_co], metaclass=QuantityMeta):
 
             _, unit = self._find_unit_for_str()
 
-            if unit.multiplier < min_unit.multiplier:
+            get_multiplier = _multiplier_getter(self._value)
+
+            if get_multiplier(unit) < get_multiplier(min_unit):
                 unit = min_unit
-            elif unit.multiplier > max_unit.multiplier:
+            elif get_multiplier(unit) > get_multiplier(max_unit):
                 unit = max_unit
         else:
             unit = u.Unit.parse(format_, quantity=self.quantity)
@@ -591,17 +835,21 @@ class Quantity(t.Generic[Q_co], metaclass=QuantityMeta):
         if number_format is not None:
             value = format(value, number_format)
 
-        return _quantity_to_string(value, unit)
+        return quantity_to_string(value, unit)
 
     def __repr__(self) -> str:
         return f"{self._value} {self._unit.symbol}"
 
     def __str__(self) -> str:
         value, unit = self._find_unit_for_str()
-        return _quantity_to_string(value, unit)
+        return quantity_to_string(value, unit)
 
-    def _find_unit_for_str(self) -> tuple[float | decimal.Decimal, u.Unit[Q_co]]:
-        value = multiply(self._value, self._unit.multiplier)
+    def _find_unit_for_str(self) -> tuple[Number, u.Unit[Q_co]]:
+        value: Number
+        if use_floats(self._value):
+            value = self.__float__()
+        else:
+            value = multiply(self._value, self._unit.multiplier)
 
         # Special case: If the value is 0, use the base unit
         if math.isclose(value, 0):
@@ -614,17 +862,56 @@ class Quantity(t.Generic[Q_co], metaclass=QuantityMeta):
         if len(digits.lstrip("-")) < 4 and len(decimal_digits) < 4:
             return self._value, self._unit
 
-        return _find_most_suitable_unit(value, self._unit.quantity, self._unit.systems)
+        return find_most_suitable_unit(value, self._unit.quantity, self._unit.systems)
 
 
 NullableQuantity = t.Union[Quantity[Q2], t.Literal[0]]
 
 
-def _find_most_suitable_unit(
-    value: FloatOrDecimal,
+def split_number_and_unit(
+    text: str, number_type: type[Number] = float
+) -> tuple[int | Number, str]:
+    """
+    Splits a string like "5 km" into the number and the unit symbol. Raises a `ValueError` if the
+    string doesn't start with a number.
+
+    Integers are returned as `int`s, without any loss of precision. All other numbers are
+    converted to the `number_type`.
+    """
+    match = NUMBER_WITH_UNIT_REGEX.match(text)
+    if not match:
+        raise ValueError(f"Cannot parse {text!r} as a Quantity")
+
+    number_str, unit_str = match.groups()
+    number_str = number_str.replace("_", "")
+
+    if "." not in number_str and "e" not in number_str and "E" not in number_str:
+        return int(number_str), unit_str
+
+    number = number_type(number_str)  # type: ignore
+
+    if isinstance(number, float):
+        is_integer = number.is_integer()
+    else:
+        is_integer = number == int(number)
+
+    if is_integer:
+        # Go through Decimal, because large floats are imprecise
+        return int(decimal.Decimal(number_str)), unit_str
+
+    return number, unit_str
+
+
+def find_most_suitable_unit(
+    value: Number,
     quantity: type[Quantity],
     systems: frozenset[str],
-) -> tuple[FloatOrDecimal, u.Unit]:
+) -> tuple[Number, u.Unit]:
+    """
+    Finds the (registered or compound) unit of the `quantity` in which the `value` (given in the
+    base unit) is most human-readable, like `str(quantity)` does. Returns the value converted to
+    that unit, and the unit.
+    """
     # Goal: Find the combination of units that results in the *shortest* (i.e. fewest digits)
     # number.
     #
@@ -643,7 +930,7 @@ def _find_most_suitable_unit(
 
         if candidates:
             unit = _find_most_suitable_unit_and_prefix(value, candidates, systems=systems)
-            value = divide(value, unit.multiplier)
+            value = _divide_by_multiplier(value, unit)
             return value, unit
 
     # No suitable registered units found, or it's a compound quantity without dedicated units.
@@ -657,14 +944,21 @@ def _find_most_suitable_unit(
             value, Quantity[quantity_caps].units, exponent, systems=systems
         )
 
-        value = divide(value, best_unit.multiplier)
+        value = _divide_by_multiplier(value, best_unit)
         unit *= best_unit
 
     return value, unit
 
 
+def _divide_by_multiplier(value: Number, unit: u.Unit) -> Number:
+    if use_floats(value):
+        return value / unit.float_multiplier
+
+    return divide(value, unit.multiplier)
+
+
 def _find_most_suitable_unit_and_prefix(
-    value: float | decimal.Decimal,
+    value: Number,
     sorted_units: t.Sequence[u.Unit],
     exponent: int = 1,
     systems: frozenset[str] = frozenset(),
@@ -693,7 +987,12 @@ def _find_most_suitable_unit_and_prefix(
         except IndexError:
             pass
         else:
-            add_prefix = next_unit.multiplier / unit.multiplier > 1000
+            if use_floats(value):
+                gap = next_unit.float_multiplier / unit.float_multiplier
+            else:
+                gap = float(next_unit.multiplier / unit.multiplier)
+
+            add_prefix = gap > 1000
 
     if add_prefix:
         prefixes = list(unit.quantity.prefixes)
@@ -706,22 +1005,36 @@ def _find_most_suitable_unit_and_prefix(
     return unit**exponent
 
 
-T = t.TypeVar("T", "u.Unit", "u.Prefix")
-
-
 def _find_most_suitable_multiplier(
-    value: FloatOrDecimal, things: t.Iterable[T], exponent: int = 1
-) -> T:
-    value = abs(float(value))
-    candidates = [thing for thing in things if thing.multiplier**exponent <= value]
+    value: Number, units: t.Sequence[u.Unit], exponent: int = 1
+) -> u.Unit:
+    get_multiplier = _multiplier_getter(value)
+
+    magnitude = abs(float(value))
+    candidates = [unit for unit in units if get_multiplier(unit) ** exponent <= magnitude]
 
     if candidates:
-        return max(candidates, key=lambda thing: thing.multiplier)
+        return max(candidates, key=get_multiplier)
     else:
-        return min(things, key=lambda thing: thing.multiplier)
+        return min(units, key=get_multiplier)
+
 
+def _multiplier_getter(value: Number) -> t.Callable[[u.Unit], Number]:
+    # In float mode, the Decimal multipliers aren't needed for choosing a unit
+    if use_floats(value):
+        return operator.attrgetter("float_multiplier")
+
+    return operator.attrgetter("multiplier")
+
+
+def quantity_to_string(value: Number | str, unit: u.Unit) -> str:
+    """
+    Formats a number (or an already formatted number) with a unit symbol, like `str(quantity)`.
+    """
+    # Fractions only support float-style formatting since python 3.12
+    if isinstance(value, fractions.Fraction):
+        value = float(value)
 
-def _quantity_to_string(value: FloatOrDecimal | str, unit: u.Unit) -> str:
     if isinstance(value, str):
         value_str = value
     elif isinstance(value, int) or (isinstance(value, float) and value.is_integer()):
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import array
+import typing as t
+
+import u
+
+from .capital_quantities import QUANTITY
+
+
+__all__ = ["QuantityColumn"]
+
+
+Q = t.TypeVar("Q", bound=QUANTITY)
+
+
+class QuantityColumn(t.Generic[Q]):
+    """
+    A compact sequence of quantities. Instead of storing `Quantity` objects, it stores the values in
+    a buffer of floats, and for each value the index of its unit in a table of distinct units.
+
+    ```python
+    >>> column = u.Distance.parse_many(["5 km", "300 m", "1.2 km"])
+    >>> column.units
+    (Unit(Quantity[DISTANCE], 'km', Decimal('1000')), Unit(Quantity[DISTANCE], 'm', Decimal('1')))
+    >>> column[1]
+    300.0 m
+    >>> column.to_numbers(u.meters)
+    array('d', [5000.0, 300.0, 1200.0])
+    ```
+
+    The arrays returned by `values` and `to_numbers` support the buffer protocol, so they can be
+    turned into numpy arrays without copying: `numpy.frombuffer(column.to_numbers(u.meters))`.
+
+    Added in version 4.1.
+    """
+
+    def __init__(self, quantities: t.Iterable[u.Quantity[Q]] = (), /):
+        self._values = array.array("d")
+        self._unit_indices = array.array("I")
+        self._units = list[u.Unit[Q]]()
+        self._indices_by_unit = dict[u.Unit[Q], int]()
+
+        for quantity in quantities:
+            self.append(quantity)
+
+    @property
+    def values(self) -> array.array[float]:
+        """
+        The values, each one measured in its own unit. (See `unit_at`.)
+        """
+        return self._values
+
+    @property
+    def units(self) -> tuple[u.Unit[Q], ...]:
+        """
+        All distinct units in this column, in the order in which they first appeared.
+        """
+        return tuple(self._units)
+
+    def unit_at(self, index: int, /) -> u.Unit[Q]:
+        """
+        Returns the unit of the value at the given index.
+        """
+        return self._units[self._unit_indices[index]]
+
+    def append(self, quantity: u.Quantity[Q], /) -> None:
+        """
+        Appends a quantity. Its value is converted to a float.
+        """
+        self._append(float(quantity._value), quantity._unit)
+
+    def to_numbers(self, unit: u.Unit[Q], /) -> array.array[float]:
+        """
+        Converts all values to the given unit, using the units' `float_multiplier`s. Raises a
+        `ValueError` if the column contains an incompatible quantity.
+        """
+        factors = []
+        for column_unit in self._units:
+            if not column_unit.is_compatible_with(unit):
+                raise ValueError(
+                    f"Cannot convert {column_unit} (a unit of {column_unit.quantity}) to {unit} (a"
+                    f" unit of {unit.quantity})"
+                )
+
+            factors.append(column_unit.float_multiplier / unit.float_multiplier)
+
+        if len(factors) == 1:
+            [factor] = factors
+            if factor == 1:
+                return array.array("d", self._values)
+
+            return array.array("d", [value * factor for value in self._values])
+
+        return array.array(
+            "d", [value * factors[index] for value, index in zip(self._values, self._unit_indices)]
+        )
+
+    def _append(self, value: float, unit: u.Unit[Q]) -> None:
+        self._values.append(value)
+        self._unit_indices.append(self._unit_index(unit))
+
+    def _unit_index(self, unit: u.Unit[Q]) -> int:
+        try:
+            return self._indices_by_unit[unit]
+        except KeyError:
+            pass
+
+        index = self._indices_by_unit[unit] = len(self._units)
+        self._units.append(unit)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> u.Quantity[Q]:
+        return u.Quantity(self._values[index], self._units[self._unit_indices[index]])
+
+    def __iter__(self) -> t.Iterator[u.Quantity[Q]]:
+        units = self._units
+
+        for value, index in zip(self._values, self._unit_indices):
+            yield u.Quantity(value, units[index])
+
+    def __repr__(self) -> str:
+        return f"QuantityColumn({list(self)!r})"
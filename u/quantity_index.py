@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import bisect
+import typing as t
+
+import u
+
+from .capital_quantities import QUANTITY
+from .quantity import NullableQuantity
+
+
+__all__ = ["QuantityIndex"]
+
+
+Q = t.TypeVar("Q", bound=QUANTITY)
+
+
+class QuantityIndex(t.Generic[Q]):
+    """
+    A collection of quantities that is kept sorted, which allows for fast range queries:
+
+    ```python
+    >>> latencies = u.QuantityIndex[u.DURATION]([u.seconds(2), u.milli(u.seconds)(30)])
+    >>> latencies.range(u.milli(u.seconds)(5), u.seconds(1))
+    [30 ms]
+    ```
+
+    All quantities must measure the same quantity. The bounds of queries can be given in any
+    compatible unit, or as `0`.
+
+    Every quantity is converted to the base unit once, when it's added, and queries only convert
+    their bounds. After that, all searches compare plain floats. Queries take O(log n) time,
+    insertion and removal take O(n) time.
+    """
+
+    def __init__(self, quantities: t.Iterable[u.Quantity[Q]] = (), /):
+        self._quantity: type[u.Quantity[Q]] | None = None
+
+        quantities = list(quantities)
+        for quantity in quantities:
+            self._check_compatible(quantity)
+
+        quantities.sort(key=u.Quantity._get_comparison_key)
+        self._quantities = quantities
+        # The comparison keys (values in the base unit) of the quantities, in the same order
+        self._keys = [quantity._get_comparison_key() for quantity in quantities]
+
+    def add(self, quantity: u.Quantity[Q], /) -> None:
+        """
+        Inserts a quantity into the index.
+        """
+        self._check_compatible(quantity)
+
+        key = quantity._get_comparison_key()
+        index = bisect.bisect_right(self._keys, key)
+
+        self._keys.insert(index, key)
+        self._quantities.insert(index, quantity)
+
+    def remove(self, quantity: u.Quantity[Q], /) -> None:
+        """
+        Removes a quantity from the index. Raises a `ValueError` if there is no equal quantity in
+        the index.
+        """
+        index = self._find(quantity, self._key(quantity))
+        if index is None:
+            raise ValueError(f"{quantity} is not in the index")
+
+        del self._keys[index]
+        del self._quantities[index]
+
+    def range(self, lo: NullableQuantity[Q], hi: NullableQuantity[Q], /) -> list[u.Quantity[Q]]:
+        """
+        Returns all quantities `q` with `lo <= q <= hi`, in ascending order.
+        """
+        start, stop = self._slice(lo, hi)
+        return self._quantities[start:stop]
+
+    def count_between(self, lo: NullableQuantity[Q], hi: NullableQuantity[Q], /) -> int:
+        """
+        Returns the number of quantities `q` with `lo <= q <= hi`.
+        """
+        start, stop = self._slice(lo, hi)
+        return max(stop - start, 0)
+
+    def nearest(self, quantity: NullableQuantity[Q], /) -> u.Quantity[Q]:
+        """
+        Returns the quantity that is closest to the given one. Raises a `ValueError` if the index
+        is empty.
+        """
+        quantities = self._quantities
+        if not quantities:
+            raise ValueError("The index is empty")
+
+        keys = self._keys
+        key = self._key(quantity)
+        index = bisect.bisect_left(keys, key)
+
+        if index == len(quantities):
+            return quantities[-1]
+
+        if index > 0 and key - keys[index - 1] <= keys[index] - key:
+            return quantities[index - 1]
+
+        return quantities[index]
+
+    def _slice(self, lo: NullableQuantity[Q], hi: NullableQuantity[Q]) -> tuple[int, int]:
+        start = bisect.bisect_left(self._keys, self._key(lo))
+        stop = bisect.bisect_right(self._keys, self._key(hi))
+        return start, stop
+
+    def _find(self, quantity: u.Quantity, key: float) -> int | None:
+        # Quantities with the same key aren't necessarily equal (if they have the same unit and only
+        # differ beyond the rounding of the key), so all of them have to be checked
+        index = bisect.bisect_left(self._keys, key)
+
+        while index < len(self._keys) and self._keys[index] == key:
+            if self._quantities[index] == quantity:
+                return index
+
+            index += 1
+
+        return None
+
+    def _key(self, quantity: NullableQuantity[Q]) -> float:
+        if isinstance(quantity, u.Quantity):
+            # Don't let queries determine which quantity this index holds
+            if self._quantity is not None:
+                self._check_compatible(quantity)
+
+            return quantity._get_comparison_key()
+
+        if quantity != 0:
+            raise TypeError(f"Expected a Quantity, not {quantity!r}")
+
+        return 0.0
+
+    def _check_compatible(self, quantity: u.Quantity) -> None:
+        expected_quantity = self._quantity
+
+        if expected_quantity is None:
+            self._quantity = quantity.quantity
+        elif quantity.quantity is not expected_quantity and quantity.quantity != expected_quantity:
+            raise ValueError(
+                f"Cannot use {quantity} (a {quantity.quantity}) in an index of {expected_quantity}"
+            )
+
+    def __len__(self) -> int:
+        return len(self._quantities)
+
+    def __iter__(self) -> t.Iterator[u.Quantity[Q]]:
+        return iter(self._quantities)
+
+    def __contains__(self, quantity: object) -> bool:
+        if not isinstance(quantity, u.Quantity):
+            return False
+
+        expected_quantity = self._quantity
+        if expected_quantity is None or (
+            quantity.quantity is not expected_quantity and quantity.quantity != expected_quantity
+        ):
+            return False
+
+        return self._find(quantity, quantity._get_comparison_key()) is not None
+
+    def __repr__(self) -> str:
+        return f"QuantityIndex({self._quantities!r})"
@@ -0,0 +1,415 @@
+from __future__ import annotations
+
+import array
+import operator
+import typing as t
+
+import u
+
+from .capital_quantities import DIV, MUL, QUANTITY
+
+
+__all__ = ["QuantityTable", "TableColumn"]
+
+
+Q = t.TypeVar("Q", bound=QUANTITY)
+Q2 = t.TypeVar("Q2", bound=QUANTITY)
+
+
+class TableColumn(t.Generic[Q]):
+    """
+    A column of a `QuantityTable`: a buffer of floats, all of which are measured in the same `unit`.
+
+    Columns support arithmetic. Multiplying or dividing two columns multiplies or divides their
+    values and their units, so no conversions are necessary. Adding or subtracting converts the
+    other column to this column's unit first.
+
+    ```python
+    >>> sizes = u.TableColumn([1500, 3000], u.megabytes)
+    >>> durations = u.TableColumn([3, 2], u.seconds)
+    >>> list(sizes / durations)
+    [500.0 MB/s, 1500.0 MB/s]
+    ```
+
+    Comparing a column to a quantity or another column returns a list of bools, which can be used
+    to filter a `QuantityTable`.
+
+    Added in version 4.1.
+    """
+
+    def __init__(self, values: t.Iterable[float], unit: u.Unit[Q], /):
+        # Always copy, so that appending to one column never affects another one
+        self.values = array.array("d", values)
+        self.unit = unit
+
+    @classmethod
+    def from_quantities(
+        cls, quantities: t.Iterable[u.Quantity[Q]], unit: u.Unit[Q] | None = None, /
+    ) -> TableColumn[Q]:
+        """
+        Creates a column from quantities. If no `unit` is given, the unit of the first quantity is
+        used. Raises a `ValueError` if there are no quantities and no `unit`.
+        """
+        quantities = iter(quantities)
+
+        if unit is None:
+            try:
+                first = next(quantities)
+            except StopIteration:
+                raise ValueError("Cannot determine the unit of an empty column") from None
+
+            unit = first._unit
+            column = cls([float(first._value)], unit)
+        else:
+            column = cls((), unit)
+
+        for quantity in quantities:
+            column.append(quantity)
+
+        return column
+
+    def append(self, value: u.Quantity[Q] | float, /) -> None:
+        """
+        Appends a value. Quantities are converted to the column's unit, and numbers are assumed to
+        be measured in it already.
+        """
+        self.values.append(_to_float(value, self.unit))
+
+    def to(self, unit: u.Unit[Q], /) -> TableColumn[Q]:
+        """
+        Returns a copy of this column, converted to the given unit. Raises a `ValueError` if the
+        unit is incompatible.
+        """
+        return TableColumn(self.to_numbers(unit), unit)
+
+    def to_numbers(self, unit: u.Unit[Q], /) -> array.array[float]:
+        """
+        Returns the values converted to the given unit, using the units' `float_multiplier`s. Raises
+        a `ValueError` if the unit is incompatible.
+        """
+        if unit is self.unit:
+            return array.array("d", self.values)
+
+        factor = _conversion_factor(self.unit, unit)
+        return array.array("d", [value * factor for value in self.values])
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> u.Quantity[Q]:
+        return u.Quantity(self.values[index], self.unit)
+
+    def __iter__(self) -> t.Iterator[u.Quantity[Q]]:
+        unit = self.unit
+
+        for value in self.values:
+            yield u.Quantity(value, unit)
+
+    def __add__(self, other: TableColumn[Q], /) -> TableColumn[Q]:
+        return TableColumn(map(operator.add, self.values, self._other_values(other)), self.unit)
+
+    def __sub__(self, other: TableColumn[Q], /) -> TableColumn[Q]:
+        return TableColumn(map(operator.sub, self.values, self._other_values(other)), self.unit)
+
+    @t.overload
+    def __mul__(self, other: float, /) -> TableColumn[Q]: ...
+
+    @t.overload
+    def __mul__(self, other: TableColumn[Q2], /) -> TableColumn[MUL[Q, Q2]]: ...
+
+    def __mul__(self, other: float | TableColumn) -> TableColumn:
+        if isinstance(other, TableColumn):
+            self._check_length(other)
+            return TableColumn(map(operator.mul, self.values, other.values), self.unit * other.unit)
+
+        return TableColumn([value * other for value in self.values], self.unit)
+
+    __rmul__ = __mul__
+
+    @t.overload
+    def __truediv__(self, other: float, /) -> TableColumn[Q]: ...
+
+    @t.overload
+    def __truediv__(self, other: TableColumn[Q2], /) -> TableColumn[DIV[Q, Q2]]: ...
+
+    def __truediv__(self, other: float | TableColumn) -> TableColumn:
+        if isinstance(other, TableColumn):
+            self._check_length(other)
+            return TableColumn(
+                map(operator.truediv, self.values, other.values), self.unit / other.unit
+            )
+
+        return TableColumn([value / other for value in self.values], self.unit)
+
+    def __lt__(self, other: TableColumn[Q] | u.Quantity[Q], /) -> list[bool]:  # type: ignore
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: TableColumn[Q] | u.Quantity[Q], /) -> list[bool]:  # type: ignore
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: TableColumn[Q] | u.Quantity[Q], /) -> list[bool]:  # type: ignore
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: TableColumn[Q] | u.Quantity[Q], /) -> list[bool]:  # type: ignore
+        return self._compare(other, operator.ge)
+
+    def _compare(
+        self,
+        other: TableColumn[Q] | u.Quantity[Q],
+        compare: t.Callable[[float, float], bool],
+    ) -> list[bool]:
+        if isinstance(other, u.Quantity):
+            threshold = _to_float(other, self.unit)
+            return [compare(value, threshold) for value in self.values]
+
+        return list(map(compare, self.values, self._other_values(other)))
+
+    def _other_values(self, other: TableColumn[Q]) -> t.Sequence[float]:
+        self._check_length(other)
+
+        if other.unit is self.unit:
+            return other.values
+
+        return other.to_numbers(self.unit)
+
+    def _check_length(self, other: TableColumn) -> None:
+        if len(other.values) != len(self.values):
+            raise ValueError(
+                f"Cannot combine columns of different lengths ({len(self.values)} and"
+                f" {len(other.values)})"
+            )
+
+    def __repr__(self) -> str:
+        return f"TableColumn({self.values.tolist()!r}, {self.unit!r})"
+
+
+class QuantityTable:
+    """
+    A table of quantities with named columns. Each column is stored as a `TableColumn`, which is a
+    buffer of floats plus a unit, so a table takes about as much memory as the raw numbers.
+
+    ```python
+    >>> table = u.QuantityTable({"size": u.megabytes, "duration": u.seconds})
+    >>> table.append({"size": u.gigabytes(3), "duration": u.minutes(1)})
+    >>> table.append({"size": 500, "duration": 0.25})
+    >>> table["bandwidth"] = table["size"] / table["duration"]
+    >>> for row in table:
+    ...     print(row["bandwidth"])
+    50 MB/s
+    2 GB/s
+    >>> fast = table[table["bandwidth"] > u.MBps(1000)]
+    >>> len(fast)
+    1
+    ```
+
+    Rows are read-only mappings from column names to quantities. The `Quantity` objects are only
+    created when a value is accessed.
+
+    Added in version 4.1.
+    """
+
+    def __init__(self, units: t.Mapping[str, u.Unit] | None = None, /):
+        if units is None:
+            units = {}
+
+        self._columns = {name: TableColumn((), unit) for name, unit in units.items()}
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: t.Iterable[t.Mapping[str, u.Quantity | float]],
+        units: t.Mapping[str, u.Unit] | None = None,
+    ) -> QuantityTable:
+        """
+        Creates a table from rows, like a list of dicts. Columns that aren't included in `units` are
+        measured in the unit of their value in the first row.
+        """
+        rows = iter(rows)
+        table = cls(units)
+
+        try:
+            first_row = next(rows)
+        except StopIteration:
+            return table
+
+        for name, value in first_row.items():
+            if name in table._columns:
+                continue
+
+            if not isinstance(value, u.Quantity):
+                raise ValueError(f"The unit of column {name!r} must be specified")
+
+            table._columns[name] = TableColumn((), value._unit)
+
+        table.append(first_row)
+
+        for row in rows:
+            table.append(row)
+
+        return table
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        """
+        The names of the columns.
+        """
+        return tuple(self._columns)
+
+    @property
+    def units(self) -> dict[str, u.Unit]:
+        """
+        The unit of each column.
+        """
+        return {name: column.unit for name, column in self._columns.items()}
+
+    def append(self, row: t.Mapping[str, u.Quantity | float], /) -> None:
+        """
+        Appends a row. It must contain a value for each column. Quantities are converted to their
+        column's unit, and numbers are assumed to be measured in it already.
+        """
+        if row.keys() != self._columns.keys():
+            raise ValueError(
+                f"Expected a row with the columns {list(self._columns)}, not {list(row)}"
+            )
+
+        values = [_to_float(row[name], column.unit) for name, column in self._columns.items()]
+
+        for column, value in zip(self._columns.values(), values):
+            column.values.append(value)
+
+    def to(self, **units: u.Unit) -> QuantityTable:
+        """
+        Returns a copy of this table in which the given columns are converted to other units.
+
+        ```python
+        >>> table.to(latency=u.milli(u.seconds))
+        ```
+        """
+        unknown_names = units.keys() - self._columns.keys()
+        if unknown_names:
+            raise ValueError(f"The table has no columns named {sorted(unknown_names)}")
+
+        table = QuantityTable()
+        table._columns = {
+            name: column.to(units.get(name, column.unit)) for name, column in self._columns.items()
+        }
+        return table
+
+    def filter(self, mask: t.Iterable[bool], /) -> QuantityTable:
+        """
+        Returns a table with only the rows for which the `mask` is true. This is the same as
+        `table[mask]`.
+        """
+        mask = list(mask)
+        if len(mask) != len(self):
+            raise ValueError(
+                f"The mask has {len(mask)} entries, but the table has {len(self)} rows"
+            )
+
+        table = QuantityTable()
+        table._columns = {
+            name: TableColumn(
+                [value for value, keep in zip(column.values, mask) if keep], column.unit
+            )
+            for name, column in self._columns.items()
+        }
+        return table
+
+    def row(self, index: int, /) -> t.Mapping[str, u.Quantity]:
+        """
+        Returns the row at the given index.
+        """
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("QuantityTable index out of range")
+
+        return _Row(self._columns, index)
+
+    def __len__(self) -> int:
+        for column in self._columns.values():
+            return len(column.values)
+
+        return 0
+
+    def __iter__(self) -> t.Iterator[t.Mapping[str, u.Quantity]]:
+        columns = self._columns
+
+        for index in range(len(self)):
+            yield _Row(columns, index)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._columns
+
+    @t.overload
+    def __getitem__(self, key: str, /) -> TableColumn: ...
+
+    @t.overload
+    def __getitem__(self, key: t.Iterable[bool], /) -> QuantityTable: ...
+
+    def __getitem__(self, key: str | t.Iterable[bool]) -> TableColumn | QuantityTable:
+        if isinstance(key, str):
+            try:
+                return self._columns[key]
+            except KeyError:
+                raise KeyError(f"The table has no column named {key!r}") from None
+
+        return self.filter(key)
+
+    def __setitem__(self, name: str, column: TableColumn, /) -> None:
+        if self._columns and len(column) != len(self):
+            raise ValueError(
+                f"The column has {len(column)} values, but the table has {len(self)} rows"
+            )
+
+        # Store a copy, so that this table's columns can't be shared with another table (or with
+        # another column of this one)
+        self._columns[name] = TableColumn(column.values, column.unit)
+
+    def __delitem__(self, name: str, /) -> None:
+        del self._columns[name]
+
+    def __repr__(self) -> str:
+        return f"<QuantityTable columns={self.units!r} rows={len(self)}>"
+
+
+class _Row(t.Mapping[str, "u.Quantity"]):
+    __slots__ = ("_columns", "_index")
+
+    def __init__(self, columns: dict[str, TableColumn], index: int):
+        self._columns = columns
+        self._index = index
+
+    def __getitem__(self, name: str) -> u.Quantity:
+        column = self._columns[name]
+        return u.Quantity(column.values[self._index], column.unit)
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+def _to_float(value: u.Quantity | float, unit: u.Unit) -> float:
+    if not isinstance(value, u.Quantity):
+        return float(value)
+
+    if value._unit is unit:
+        return float(value._value)
+
+    return float(value._value) * _conversion_factor(value._unit, unit)
+
+
+def _conversion_factor(from_unit: u.Unit, to_unit: u.Unit) -> float:
+    if not from_unit.is_compatible_with(to_unit):
+        raise ValueError(
+            f"Cannot convert {from_unit} (a unit of {from_unit.quantity}) to {to_unit} (a unit of"
+            f" {to_unit.quantity})"
+        )
+
+    return from_unit.float_multiplier / to_unit.float_multiplier
@@ -0,0 +1,164 @@
+"""
+Vectorised statistics for many measurements of the same quantity. Requires `numpy`.
+
+All functions accept either a numpy array of numbers together with the `unit` of those numbers, or
+an iterable of `Quantity` objects. The results are returned as `Quantity` objects in the input unit:
+
+```python
+>>> latencies = numpy.array([12.5, 8.0, 30.1])
+>>> u.stats.median(latencies, u.milli(u.seconds))
+12.5 ms
+>>> u.stats.var(latencies, u.milli(u.seconds))
+90.93555555555558 ms²
+```
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+import u
+
+from ._utils import import_numpy
+from .capital_quantities import QUANTITY, MUL
+
+if t.TYPE_CHECKING:
+    import numpy as np
+
+
+__all__ = ["mean", "median", "percentile", "std", "var", "min", "max", "histogram"]
+
+
+Q = t.TypeVar("Q", bound=QUANTITY)
+
+Values = t.Union["np.ndarray", t.Iterable["u.Quantity[Q]"]]
+
+
+def mean(values: Values[Q], unit: u.Unit[Q] | None = None, /) -> u.Quantity[Q]:
+    """
+    Calculates the arithmetic mean.
+    """
+    array, unit = _to_array(values, unit)
+    return unit(float(import_numpy("u.stats").mean(array)))
+
+
+def median(values: Values[Q], unit: u.Unit[Q] | None = None, /) -> u.Quantity[Q]:
+    """
+    Calculates the median.
+    """
+    array, unit = _to_array(values, unit)
+    return unit(float(import_numpy("u.stats").median(array)))
+
+
+@t.overload
+def percentile(
+    values: Values[Q], unit: u.Unit[Q] | None = None, /, *, q: float
+) -> u.Quantity[Q]: ...
+
+
+@t.overload
+def percentile(
+    values: Values[Q], unit: u.Unit[Q] | None = None, /, *, q: t.Sequence[float]
+) -> list[u.Quantity[Q]]: ...
+
+
+def percentile(
+    values: Values[Q], unit: u.Unit[Q] | None = None, /, *, q: float | t.Sequence[float]
+) -> u.Quantity[Q] | list[u.Quantity[Q]]:
+    """
+    Calculates the `q`-th percentile. `q` must be between 0 and 100. If `q` is a sequence, a list
+    of quantities is returned.
+
+    ```python
+    >>> p50, p99 = u.stats.percentile(latencies, u.milli(u.seconds), q=[50, 99])
+    ```
+    """
+    array, unit = _to_array(values, unit)
+    result = import_numpy("u.stats").percentile(array, q)
+
+    if result.ndim == 0:
+        return unit(float(result))
+
+    return [unit(float(value)) for value in result]
+
+
+def std(values: Values[Q], unit: u.Unit[Q] | None = None, /, *, ddof: int = 0) -> u.Quantity[Q]:
+    """
+    Calculates the standard deviation. Pass `ddof=1` for the sample standard deviation.
+    """
+    array, unit = _to_array(values, unit)
+    return unit(float(import_numpy("u.stats").std(array, ddof=ddof)))
+
+
+def var(
+    values: Values[Q], unit: u.Unit[Q] | None = None, /, *, ddof: int = 0
+) -> u.Quantity[MUL[Q, Q]]:
+    """
+    Calculates the variance. Note that the result is measured in the *square* of the input unit.
+    Pass `ddof=1` for the sample variance.
+    """
+    array, unit = _to_array(values, unit)
+    return (unit**2)(float(import_numpy("u.stats").var(array, ddof=ddof)))
+
+
+def min(values: Values[Q], unit: u.Unit[Q] | None = None, /) -> u.Quantity[Q]:
+    """
+    Returns the smallest value.
+    """
+    array, unit = _to_array(values, unit)
+    return unit(float(import_numpy("u.stats").min(array)))
+
+
+def max(values: Values[Q], unit: u.Unit[Q] | None = None, /) -> u.Quantity[Q]:
+    """
+    Returns the largest value.
+    """
+    array, unit = _to_array(values, unit)
+    return unit(float(import_numpy("u.stats").max(array)))
+
+
+def histogram(
+    values: Values[Q],
+    unit: u.Unit[Q] | None = None,
+    /,
+    *,
+    bins: int | t.Sequence[u.Quantity[Q]] = 10,
+) -> tuple[np.ndarray, list[u.Quantity[Q]]]:
+    """
+    Computes a histogram. Returns the counts and the bin edges. `bins` can either be the number of
+    bins or a sequence of bin edges, which can be given in any compatible unit.
+
+    ```python
+    >>> bins = [u.seconds(0), u.seconds(1), u.seconds(5)]
+    >>> counts, edges = u.stats.histogram(latencies, u.milli(u.seconds), bins=bins)
+    ```
+    """
+    np = import_numpy("u.stats")
+    array, unit = _to_array(values, unit)
+
+    if not isinstance(bins, int):
+        bins = np.array([edge.to_number(unit) for edge in bins])  # type: ignore
+
+    counts, edges = np.histogram(array, bins=bins)
+
+    return counts, [unit(float(edge)) for edge in edges]
+
+
+def _to_array(values: Values[Q], unit: u.Unit[Q] | None) -> tuple[np.ndarray, u.Unit[Q]]:
+    np = import_numpy("u.stats")
+
+    if isinstance(values, np.ndarray):
+        if unit is None:
+            raise TypeError("A `unit` is required when passing a numpy array")
+
+        return values, unit
+
+    quantities = values if isinstance(values, t.Sequence) else list(values)
+    if not quantities:
+        raise ValueError("At least one value is required")
+
+    if unit is None:
+        unit = quantities[0]._unit
+
+    numbers = u.stream.to_numbers(quantities, unit)
+    return np.fromiter(numbers, dtype=float, count=len(quantities)), unit
@@ -0,0 +1,107 @@
+"""
+Generator-based building blocks for processing large amounts of quantities in constant memory.
+Every stage resolves units and conversion factors only once per distinct unit, rather than once per
+item. The stages can be chained:
+
+```python
+with open("latencies.log") as file:
+    for number in u.stream.to_numbers(u.stream.parse(file), u.seconds):
+        ...
+```
+"""
+
+from __future__ import annotations
+
+import typing as t
+
+import u
+
+from .capital_quantities import QUANTITY
+from .quantity import split_number_and_unit
+
+
+__all__ = ["parse", "convert", "to_numbers", "filter_compatible"]
+
+
+Q = t.TypeVar("Q", bound=QUANTITY)
+
+
+@t.overload
+def parse(lines: t.Iterable[str]) -> t.Iterator[u.Quantity]: ...
+
+
+@t.overload
+def parse(lines: t.Iterable[str], quantity: type[u.Quantity[Q]]) -> t.Iterator[u.Quantity[Q]]: ...
+
+
+def parse(
+    lines: t.Iterable[str], quantity: type[u.Quantity] = u.Quantity
+) -> t.Iterator[u.Quantity]:
+    """
+    Parses each line with `Quantity.parse`. Leading and trailing whitespace is ignored, and so are
+    empty lines.
+
+    If a `quantity` is passed, a `ValueError` is raised for any line that doesn't contain that
+    quantity.
+    """
+    units = dict[str, u.Unit]()
+
+    for line in lines:
+        text = line.strip()
+        if not text:
+            continue
+
+        number, unit_str = split_number_and_unit(text)
+
+        try:
+            unit = units[unit_str]
+        except KeyError:
+            try:
+                unit = units[unit_str] = u.Unit.parse(unit_str, quantity)
+            except ValueError as e:
+                raise ValueError(f"Cannot parse {text!r} as a {quantity!r}") from e
+
+        yield u.Quantity(number, unit)
+
+
+def convert(quantities: t.Iterable[u.Quantity[Q]], to: u.Unit[Q]) -> t.Iterator[u.Quantity[Q]]:
+    """
+    Converts each quantity to the unit `to`. Raises a `ValueError` if an incompatible quantity is
+    encountered.
+    """
+    for number in to_numbers(quantities, to):
+        yield u.Quantity(number, to)
+
+
+def to_numbers(quantities: t.Iterable[u.Quantity[Q]], unit: u.Unit[Q]) -> t.Iterator[float]:
+    """
+    Like `Quantity.to_number`, but for many quantities. Raises a `ValueError` if an incompatible
+    quantity is encountered.
+    """
+    factors = dict[u.Unit, float]()
+
+    for quantity in quantities:
+        try:
+            factor = factors[quantity._unit]
+        except KeyError:
+            factor = factors[quantity._unit] = quantity._unit(1).to_number(unit)
+
+        yield float(quantity._value) * factor
+
+
+def filter_compatible(
+    quantities: t.Iterable[u.Quantity], quantity: type[u.Quantity[Q]]
+) -> t.Iterator[u.Quantity[Q]]:
+    """
+    Discards all quantities that aren't measuring the given `quantity`.
+    """
+    compatible_units = dict[u.Unit, bool]()
+
+    for value in quantities:
+        try:
+            is_compatible = compatible_units[value._unit]
+        except KeyError:
+            is_compatible = compatible_units[value._unit] = value._unit.is_compatible_with(quantity)
+
+        if is_compatible:
+            yield value  # type: ignore
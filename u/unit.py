@@ -2,15 +2,16 @@ from __future__ import annotations
 
 import bisect
 import decimal
+import fractions
 import functools
 import typing_extensions as t
 
 import u
 
-from ._utils import cached, join_symbols, parse_symbol
-from .quantity import Quantity
+from ._utils import cached, join_symbols, parse_symbol, power_symbol
+from .quantity import Quantity, get_quantity_for_exponents
 from .capital_quantities import QUANTITY, DIV, MUL, Q2
-from .maths import FloatOrDecimal, multiply, divide
+from .maths import Number, convert
 from . import prefixes
 
 
@@ -19,7 +20,7 @@ __all__ = ["Unit"]
 
 Q_co = t.TypeVar("Q_co", bound=QUANTITY, covariant=True)
 
-UnitId = tuple[type[Quantity], FloatOrDecimal]
+UnitId = tuple[type[Quantity], Number]
 
 units_cache: t.MutableMapping[UnitId, Unit] = {}
 units_by_symbol: t.MutableMapping[str, Unit] = {}
@@ -51,11 +52,21 @@ class Unit(t.Generic[Q_co]):
     "unit system", like "imperial" or "metric". Currently, unit systems are only used by
     `Quantity.__str__`, which tries to stay within the same unit system. (So for example,
     `u.meters(1523)` will be printed as "1.5 km" and not as "0.9 mi".)
+
+    Added in version 4.1: The `float_multiplier` attribute, which is the `multiplier` converted to a
+    float. It's used instead of the `multiplier` if the numeric mode is set to `"float"`. (See
+    `u.set_numeric_mode`.)
+
+    Added in version 4.1: The `multiplier` can be a `fractions.Fraction`. This allows for exact
+    multipliers like 1/3, which a Decimal can't represent. The exact value is available as the
+    `fraction_multiplier` attribute, and is used to convert quantities whose value is a `Fraction`.
     """
 
     quantity: t.Final[type[Quantity[Q_co]]]
     symbol: t.Final[str]
     multiplier: t.Final[decimal.Decimal]
+    fraction_multiplier: t.Final[fractions.Fraction]
+    float_multiplier: t.Final[float]
     systems: t.Final[frozenset[str]]
 
     @t.overload
@@ -63,7 +74,7 @@ class Unit(t.Generic[Q_co]):
         self,
         quantity: type[Quantity[Q_co]],
         symbol: str,
-        multiplier: FloatOrDecimal,
+        multiplier: Number,
         systems: t.Iterable[str] | None = None,
     ):
         pass
@@ -82,24 +93,31 @@ class Unit(t.Generic[Q_co]):
         self,
         quantity: type[Quantity[Q_co]] | Unit[Q_co],
         symbol: str,
-        multiplier: FloatOrDecimal | None = None,
+        multiplier: Number | None = None,
         systems: t.Iterable[str] = (),
     ):
         if isinstance(quantity, Unit):
             self.quantity = quantity.quantity
             self.multiplier = quantity.multiplier
+            fraction_multiplier = quantity.fraction_multiplier
             self.systems = quantity.systems
         else:
             self.quantity = quantity
 
-            assert isinstance(multiplier, (int, float, decimal.Decimal))
-            self.multiplier = decimal.Decimal(multiplier)
+            assert isinstance(multiplier, (int, float, decimal.Decimal, fractions.Fraction))
+            fraction_multiplier = fractions.Fraction(multiplier)
+            self.multiplier = t.cast(decimal.Decimal, convert(multiplier, decimal.Decimal))
             self.systems = frozenset(systems)
 
+        self.fraction_multiplier = fraction_multiplier
+        self.float_multiplier = float(self.multiplier)
         self.symbol = symbol
 
         unit_id = (self.quantity, self.multiplier)
 
+        # Units are used as keys in lots of caches, so the hash is precomputed
+        self._hash = hash(unit_id)
+
         # If an `UnregisteredUnit` already existed, update its symbol. This is important because
         # that unit may exist in any number of our `@cached` functions. (For example, `1/s` is
         # created before `hertz`, and is permanently cached by `Unit.__truediv__`.)
@@ -114,41 +132,54 @@ class Unit(t.Generic[Q_co]):
             return
 
         units_by_symbol[symbol] = self
+        Unit._from_compound_symbol.cache_clear()
 
         # Register this unit with the Quantity
         units = t.cast(list[Unit[Q_co]], self.quantity.units)
 
         bisect.insort(units, self, key=lambda unit: unit.multiplier)
 
+        # The base unit may have changed
+        self.quantity._base_unit = None  # type: ignore
+
     @staticmethod
     def _from_symbol(symbol: str) -> Unit:
-        try:
-            return units_by_symbol[symbol]
-        except KeyError:
-            pass
+        unit = units_by_symbol.get(symbol)
+        if unit is not None:
+            return unit
 
-        # Check if it starts with a prefix
-        prefix_length = min(1 + prefixes.max_prefix_length, len(symbol) - 1)
+        # Check if it starts with a prefix. If multiple prefixes match, the longest one wins.
+        for prefix in prefixes.find_prefixes(symbol):
+            unit = units_by_symbol.get(symbol[len(prefix.symbol) :])
+            if unit is not None:
+                return prefix(unit)
 
-        while prefix_length > 0:
-            prefix_symbol = symbol[:prefix_length]
+        raise ValueError(f"The symbol {symbol!r} doesn't correspond to a known Unit")
 
-            try:
-                prefix = u.Prefix.from_symbol(prefix_symbol)
-            except ValueError:
-                pass
-            else:
-                unit_symbol = symbol[prefix_length:]
-                try:
-                    unit = units_by_symbol[unit_symbol]
-                except KeyError:
-                    pass
-                else:
-                    return prefix(unit)
+    # The results of `Unit.parse`, keyed by the stripped symbol. Since registering a unit can change
+    # the result, this cache is cleared whenever a unit is registered.
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _from_compound_symbol(symbol: str) -> Unit:
+        exponents = parse_symbol(symbol)
+
+        unit: Unit
 
-            prefix_length -= 1
+        # Try to start with a positive exponent
+        try:
+            sym = next(sym for sym, exponent in exponents.items() if exponent > 0)
+        except StopIteration:
+            unit = u.one
+        else:
+            unit = Unit._from_symbol(sym) ** exponents.pop(sym)
 
-        raise ValueError(f"The symbol {symbol!r} doesn't correspond to a known Unit")
+        for sym, exponent in exponents.items():
+            if exponent > 0:
+                unit *= Unit._from_symbol(sym) ** exponent
+            elif exponent < 0:
+                unit /= Unit._from_symbol(sym) ** -exponent
+
+        return unit
 
     @classmethod
     def parse(cls, symbol: str, /, quantity: type[Quantity[Q2]] = Quantity) -> Unit[Q2]:
@@ -166,6 +197,9 @@ class Unit(t.Generic[Q_co]):
         Unit(Quantity[DISTANCE DURATION⁻¹], 'm/s', 1.0)
         ```
 
+        Exponents can be written as superscripts or with `^` or `**` (like `m^2`), and parentheses
+        can be used for grouping (like `kg/(m*s)`).
+
         Passing a `quantity` argument will check if the parsed unit is compatible with that
         quantity:
 
@@ -175,23 +209,7 @@ class Unit(t.Generic[Q_co]):
         ```
         """
 
-        exponents = parse_symbol(symbol)
-
-        unit: Unit
-
-        # Try to start with a positive exponent
-        try:
-            sym = next(sym for sym, exponent in exponents.items() if exponent > 0)
-        except StopIteration:
-            unit = u.one
-        else:
-            unit = Unit._from_symbol(sym) ** exponents.pop(sym)
-
-        for sym, exponent in exponents.items():
-            if exponent > 0:
-                unit *= Unit._from_symbol(sym) ** exponent
-            elif exponent < 0:
-                unit /= Unit._from_symbol(sym) ** -exponent
+        unit = Unit._from_compound_symbol(symbol.strip())
 
         if quantity is Quantity or unit.is_compatible_with(quantity):
             return unit
@@ -232,61 +250,55 @@ class Unit(t.Generic[Q_co]):
     @t.overload
     def __pow__(self, exponent: int, /) -> Unit: ...
 
+    @cached
     def __pow__(self, exponent: int) -> Unit:
-        if exponent > 0:
-            # Avoid use of `u.one` here because this code runs before the module is completely
-            # initialized
-            result = self
+        # Note: Avoid use of `u.one` for positive exponents because this code runs before the module
+        # is completely initialized
+        if exponent == 1:
+            return self
 
-            for _ in range(exponent - 1):
-                result *= self
-        else:
-            result = u.one
+        if exponent == 0:
+            return u.one
 
-            for _ in range(-exponent):
-                result /= self
-
-        return result
+        return lookup_unit(
+            power_quantity(self.quantity, exponent),
+            lambda: power_symbol(self.symbol, exponent),
+            self.fraction_multiplier**exponent,
+            self.systems,
+        )
 
     @cached
     def __mul__(self, other: Unit[Q2], /) -> Unit[MUL[Q_co, Q2]]:
         return lookup_unit(
-            join_quantities(self.quantity, other.quantity, MUL),
+            join_quantities(self.quantity, other.quantity, "*"),
             join_symbols(self.symbol, other.symbol, "*"),
-            multiply(self.multiplier, other.multiplier, decimal.Decimal),
+            self.fraction_multiplier * other.fraction_multiplier,
             combine_systems(self.systems, other.systems),
         )
 
     @cached
     def __truediv__(self, other: Unit[Q2], /) -> Unit[DIV[Q_co, Q2]]:
         def make_symbol():
-            quantity = t.get_args(self.quantity)[0]
-            try:
-                quantity_name = quantity.__name__
-            except AttributeError:
-                # Bleh, old `typing` module
-                quantity_name = quantity._name
-
-            if quantity_name == "ONE" and "*" not in other.symbol and "/" not in other.symbol:
+            if not self.quantity.exponents and "*" not in other.symbol and "/" not in other.symbol:
                 if "*" in other.symbol or "/" in other.symbol:
                     symbol = f"({other.symbol})⁻¹"
                 else:
                     symbol = other.symbol + "⁻¹"
             elif "*" in other.symbol or "(" in other.symbol:
-                symbol = join_symbols(self.symbol, other.symbol, "/(") + ")"
+                symbol = f"{self.symbol}/({other.symbol})"
             else:
                 symbol = join_symbols(self.symbol, other.symbol, "/")
 
             return symbol
 
         return lookup_unit(
-            join_quantities(self.quantity, other.quantity, DIV),
+            join_quantities(self.quantity, other.quantity, "/"),
             make_symbol,
-            divide(self.multiplier, other.multiplier, decimal.Decimal),
+            self.fraction_multiplier / other.fraction_multiplier,
             combine_systems(self.systems, other.systems),
         )
 
-    def __rmul__(self, value: FloatOrDecimal, /) -> Quantity[Q_co]:
+    def __rmul__(self, value: Number, /) -> Quantity[Q_co]:
         return Quantity(value, self)
 
     def __rtruediv__(self, value: t.Literal[1], /) -> Unit[DIV[u.ONE, Q_co]]:
@@ -295,14 +307,14 @@ class Unit(t.Generic[Q_co]):
 
         return u.one / self
 
-    def __call__(self, value: FloatOrDecimal | Quantity[Q_co], /) -> Quantity[Q_co]:
+    def __call__(self, value: Number | Quantity[Q_co], /) -> Quantity[Q_co]:
         if isinstance(value, Quantity):
             return Quantity(value.to_number(self), self)
         else:
             return Quantity(value, self)
 
     def __hash__(self) -> int:
-        return hash((self.quantity, self.multiplier))
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, __class__):
@@ -338,10 +350,10 @@ class UnregisteredUnit(Unit):
 def lookup_unit(
     quantity: type[Quantity],
     symbol: str | t.Callable[[], str],
-    multiplier: FloatOrDecimal,
+    multiplier: Number,
     systems: t.Iterable[str] | None = None,
 ) -> Unit:
-    unit_id: UnitId = (quantity, multiplier)
+    unit_id: UnitId = (quantity, convert(multiplier, decimal.Decimal))
 
     try:
         return units_cache[unit_id]
@@ -370,8 +382,17 @@ def combine_systems(s1: t.Iterable[str], s2: t.Iterable[str]) -> frozenset[str]:
     return s1 | s2
 
 
-def join_quantities(q1: type[Quantity], q2: type[Quantity], joiner) -> type[Quantity]:
-    [a] = t.get_args(q1)
-    [b] = t.get_args(q2)
+def join_quantities(q1: type[Quantity], q2: type[Quantity], operator: str) -> type[Quantity]:
+    exponents = dict(q1.exponents)
+    sign = -1 if operator == "/" else 1
+
+    for quantity, exponent in q2.exponents.items():
+        exponents[quantity] = exponents.get(quantity, 0) + sign * exponent
+
+    # A `QuantityAlias` stands in for the `Quantity[...]` class it describes
+    return t.cast(type[Quantity], get_quantity_for_exponents(exponents))
+
 
-    return Quantity[joiner[a, b]]
+def power_quantity(quantity: type[Quantity], exponent: int) -> type[Quantity]:
+    exponents = {quant: exp * exponent for quant, exp in quantity.exponents.items()}
+    return t.cast(type[Quantity], get_quantity_for_exponents(exponents))